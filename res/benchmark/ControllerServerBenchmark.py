@@ -0,0 +1,151 @@
+"""
+    mtxPython - A framework to create matrix games.
+    Copyright (C) 2016  Tobias Stampfl <info@matrixgames.rocks>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation in version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+# Compares the threaded and the nonblocking mode of the mtxNet.ControllerServer. For each mode a
+# server is started in its own process. Then the given number of connections is opened and held,
+# each connection is checked by a ping and the threads and the memory of the server process are
+# reported (Linux only). While the connections are held, a number of client threads send pings for
+# the given duration to measure the requests per second.
+#
+# Usage: python ControllerServerBenchmark.py [--connections 1000] [--clients 16] [--duration 5]
+
+import argparse
+import multiprocessing
+import os
+import socket
+import sys
+import time
+from threading import Thread
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src'))
+
+from thrift.transport import TSocket
+from thrift.transport import TTransport
+from thrift.protocol import TBinaryProtocol
+
+import mtx
+import mtxNet
+from mtxNet.controllerService import ControllerService
+
+
+def RunServer(port, nonblocking, workers):
+    # The ping calls don't need a game console.
+    handler = mtxNet.ControllerHandler(None, mtx.GameLoader())
+    mtxNet.ControllerServer(port, handler, nonblocking, workers).Run(blocking=True)
+
+
+def WaitForServer(port, timeout=10.0):
+    end = time.time() + timeout
+    while time.time() < end:
+        try:
+            socket.create_connection(('127.0.0.1', port), 1.0).close()
+            return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
+
+def Connect(port, nonblocking):
+    sock = TSocket.TSocket('127.0.0.1', port)
+    sock.setTimeout(30000)
+    if nonblocking:
+        transport = TTransport.TFramedTransport(sock)
+    else:
+        transport = TTransport.TBufferedTransport(sock)
+    transport.open()
+    return ControllerService.Client(TBinaryProtocol.TBinaryProtocol(transport)), transport
+
+
+def GetProcessStatus(pid):
+    status = {}
+    try:
+        with open('/proc/%d/status' % pid) as statusFile:
+            for line in statusFile:
+                key, value = line.split(':', 1)
+                status[key] = value.strip()
+    except (IOError, OSError):
+        pass
+    return status.get('Threads', '-'), status.get('VmRSS', '-')
+
+
+def Benchmark(port, nonblocking, workers, connectionCount, clientCount, duration):
+    process = multiprocessing.Process(target=RunServer, args=(port, nonblocking, workers))
+    process.daemon = True
+    process.start()
+
+    try:
+        if not WaitForServer(port):
+            raise RuntimeError("The server did not start.")
+
+        connections = []
+        for _ in range(connectionCount):
+            try:
+                client, transport = Connect(port, nonblocking)
+                client.Ping()
+                connections.append((client, transport))
+            except Exception as e:
+                print('  connection %d failed: %s' % (len(connections) + 1, e))
+                break
+
+        threads, memory = GetProcessStatus(process.pid)
+
+        counts = [0] * min(clientCount, len(connections))
+        end = time.time() + duration
+
+        def Client(index):
+            client = connections[index][0]
+            while time.time() < end:
+                client.Ping()
+                counts[index] += 1
+
+        clients = [Thread(target=Client, args=(i,)) for i in range(len(counts))]
+        start = time.time()
+        for thread in clients:
+            thread.start()
+        for thread in clients:
+            thread.join()
+        elapsed = time.time() - start
+
+        for client, transport in connections:
+            transport.close()
+
+        return len(connections), threads, memory, sum(counts) / elapsed
+    finally:
+        process.terminate()
+        process.join()
+
+
+def Main():
+    parser = argparse.ArgumentParser(description='Benchmark of the controller server modes.')
+    parser.add_argument('--port', type=int, default=19090)
+    parser.add_argument('--connections', type=int, default=1000)
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    print('%-12s %12s %10s %12s %14s' % ('mode', 'connections', 'threads', 'memory',
+                                         'requests/s'))
+    for port, nonblocking in ((args.port, False), (args.port + 1, True)):
+        held, threads, memory, rate = Benchmark(port, nonblocking, args.workers, args.connections,
+                                                args.clients, args.duration)
+        print('%-12s %12d %10s %12s %14.0f' % ('nonblocking' if nonblocking else 'threaded',
+                                               held, threads, memory, rate))
+
+
+if __name__ == '__main__':
+    Main()
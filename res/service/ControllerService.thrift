@@ -36,4 +36,15 @@ service ControllerService {
     void LoadGame(1: string name) throws (1:GameError gameError),
     void ReloadGame(),
     void ResetLevel(),
+
+    i32 CreateSession(1: string name) throws (1:GameError gameError),
+    i8 JoinSession(1: i32 sessionId) throws (1:GameError gameError),
+    void LeaveSession(1: i32 sessionId, 2: i8 number) throws (1:GameError gameError),
+    void DestroySession(1: i32 sessionId) throws (1:GameError gameError),
+    list<i32> GetSessions(),
+    i16 ConnectSessionRenderer(1: i32 sessionId, 2: string host, 3: i32 port) throws (1:GameError gameError),
+    void DisconnectSessionRenderer(1: i32 sessionId, 2: i16 rendererId) throws (1:GameError gameError),
+    void SessionMovePlayer(1: i32 sessionId, 2: i8 number, 3: Direction direction) throws (1:GameError gameError),
+    void SessionJumpPlayer(1: i32 sessionId, 2: i8 number, 3: Direction direction) throws (1:GameError gameError),
+    void SessionResetLevel(1: i32 sessionId) throws (1:GameError gameError),
 }
@@ -5,6 +5,9 @@ namespace csharp RendererService
 namespace py RendererService
 
 
+const i32 PROTOCOL_VERSION = 2
+
+
 enum Direction {
     UP    = 0x0,
     RIGHT = 0x1,
@@ -52,6 +55,44 @@ union Value {
 }
 
 
+enum ActType {
+    PAUSE         = 0x00,
+    RESUME        = 0x01,
+    CLEAR         = 0x02,
+    LOAD_LEVEL    = 0x03,
+    RESET_LEVEL   = 0x04,
+    UPDATE        = 0x05,
+    MOVE          = 0x06,
+    JUMP          = 0x07,
+    SPAWN         = 0x08,
+    REMOVE        = 0x09,
+    COLLECT       = 0x0A,
+    TRIGGER_ENTER = 0x0B,
+    TRIGGER_LEAVE = 0x0C,
+}
+
+
+struct Act {
+    1: ActType actType,
+    2: i16 objectId,
+    3: i16 sourceId,
+    4: string key,
+    5: Value value,
+    6: i8 symbol,
+    7: i16 positionX,
+    8: i16 positionY,
+    9: Direction direction,
+    10: i16 fromX,
+    11: i16 fromY,
+    12: i16 toX,
+    13: i16 toY,
+    14: list<list<list<list<i16>>>> field,
+    15: LevelInfo levelInfo,
+    16: binary packedField,
+    17: binary packedCells,
+}
+
+
 service RendererService {
     void Ping(),
     void Shutdown(),
@@ -71,4 +112,6 @@ service RendererService {
     void TriggerLeave(1: i16 objectId, 2: i16 sourceId),
     void Move(1: i16 objectId, 2: Direction direction, 3: i16 fromX, 4: i16 fromY, 5: i16 toX, 6: i16 toY),
     void Jump(1: i16 objectId, 2: Direction direction, 3: i16 fromX, 4: i16 fromY, 5: i16 toX, 6: i16 toY),
+    i32 GetProtocolVersion(),
+    oneway void ProcessActs(1: list<Act> acts),
 }
@@ -15,6 +15,9 @@
     along with this program. If not, see <http://www.gnu.org/licenses/>.
 """
 
+from . import FieldCodec
+
+
 class Act():
     PAUSE         = 0x00
     RESUME        = 0x01
@@ -44,16 +47,65 @@ class ObjectAct(Act):
 
 
 class LevelAct(Act):
-    def __init__(self, actId, level):
+    def __init__(self, actId, level, modifiedCells=None):
         Act.__init__(self, actId)
         self.level = level
+        self.modifiedCells = modifiedCells
+        self._packedField = None
+        self._packedCells = None
+
+    def Freeze(self):
+        """
+        Takes a packed copy of the current objects of the level field, so that the act still
+        describes the state at the time it was created, even if it is processed later.
+        """
+        if self._packedField is None:
+            self._packedField = FieldCodec.EncodeField(self.level.GetField())
+            if self.modifiedCells is not None:
+                self._packedCells = FieldCodec.EncodeCells(self.level.GetField(), self.modifiedCells)
+
+    def GetFieldData(self):
+        """
+        Returns:
+            :obj:`list`: A list of rows, each row is a list of cells and each cell is a list of
+            (id, symbol) tuples of the objects on the cell, ordered from bottom to top.
+        """
+        if self._packedField is not None:
+            return FieldCodec.DecodeField(self._packedField)
+
+        field = self.level.GetField()
+        return [[[(obj._id, obj._symbol) for obj in reversed(field.GetCell(x, y))]
+                 for x in range(field._width)]
+                for y in range(field._height)]
+
+    def GetPackedField(self):
+        """
+        Returns:
+            :obj:`bytes`: The objects of the whole level field (see :mod:`mtx.FieldCodec`).
+        """
+        if self._packedField is not None:
+            return self._packedField
+        return FieldCodec.EncodeField(self.level.GetField())
+
+    def GetPackedCells(self):
+        """
+        Returns:
+            :obj:`bytes` or :obj:`None`: The objects of the modified cells (see
+            :mod:`mtx.FieldCodec`) or None, if the modified cells are unknown.
+        """
+        if self.modifiedCells is None:
+            return None
+        if self._packedCells is not None:
+            return self._packedCells
+        return FieldCodec.EncodeCells(self.level.GetField(), self.modifiedCells)
 
 
 class UpdateAct(ObjectAct):
-    def __init__(self, objId, key, value):
+    def __init__(self, objId, key, value, oldValue=None):
         ObjectAct.__init__(self, Act.UPDATE, objId)
         self.key = key
         self.value = value
+        self.oldValue = oldValue
 
 
 class SpawnAct(ObjectAct):
@@ -112,11 +164,11 @@ class ActGroup():
     def AddLoadLevelAct(self, level):
         self._acts.append(LevelAct(Act.LOAD_LEVEL, level))
 
-    def AddResetLevelAct(self, level):
-        self._acts.append(LevelAct(Act.RESET_LEVEL, level))
+    def AddResetLevelAct(self, level, modifiedCells=None):
+        self._acts.append(LevelAct(Act.RESET_LEVEL, level, modifiedCells))
 
-    def AddUpdateAct(self, obj, key, value):
-        self._acts.append(UpdateAct(obj.GetId(), key, value))
+    def AddUpdateAct(self, obj, key, value, oldValue=None):
+        self._acts.append(UpdateAct(obj.GetId(), key, value, oldValue))
 
     def AddMoveAct(self, obj, direction, toX, toY):
         self._acts.append(MotionAct(Act.MOVE, obj.GetId(), direction, obj._cell._x, obj._cell._y, toX, toY))
@@ -140,6 +192,62 @@ class ActGroup():
         self._acts.append(EventAct(Act.TRIGGER_LEAVE, obj.GetId(), source.GetId()))
 
 
+class NullActGroup(ActGroup):
+    """
+    Act group that drops all acts. It is used when nobody is interested in the acts, e.g. by
+    :class:`mtx.HeadlessConsole`, so no act objects have to be created.
+    """
+
+    def __init__(self):
+        ActGroup.__init__(self)
+        self._busy = False
+
+    def Ready(self):
+        pass
+
+    def AddAct(self, act):
+        pass
+
+    def AddPauseAct(self):
+        pass
+
+    def AddResumeAct(self):
+        pass
+
+    def AddClearAct(self):
+        pass
+
+    def AddLoadLevelAct(self, level):
+        pass
+
+    def AddResetLevelAct(self, level, modifiedCells=None):
+        pass
+
+    def AddUpdateAct(self, obj, key, value, oldValue=None):
+        pass
+
+    def AddMoveAct(self, obj, direction, toX, toY):
+        pass
+
+    def AddJumpAct(self, obj, direction, toX, toY):
+        pass
+
+    def AddSpawnAct(self, obj, x, y):
+        pass
+
+    def AddRemoveAct(self, obj, source):
+        pass
+
+    def AddCollectAct(self, obj, source):
+        pass
+
+    def AddTriggerEnterAct(self, obj, source):
+        pass
+
+    def AddTriggerLeaveAct(self, obj, source):
+        pass
+
+
 class ActQueue():
     def __init__(self):
         self._actGroups = []
@@ -152,6 +260,9 @@ class ActQueue():
     def __iter__(self):
         return self._actGroups.__iter__()
 
+    def __len__(self):
+        return len(self._actGroups)
+
     def remove(self, actGroup):
         self._actGroups.remove(actGroup)
 
@@ -0,0 +1,229 @@
+"""
+    mtxPython - A framework to create matrix games.
+    Copyright (C) 2016  Tobias Stampfl <info@matrixgames.rocks>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation in version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import collections
+import logging
+import time
+from threading import Thread, Condition
+
+from . import Act, Renderer
+
+
+class AsyncRenderer(Renderer):
+    """
+    Wraps a :class:`renderer<mtx.Renderer>` and feeds it from a bounded queue in its own worker
+    thread, so that a slow renderer does not block the game or the other renderers.
+    """
+
+    BLOCK       = 0x00
+    DROP_OLDEST = 0x01
+    COALESCE    = 0x02
+
+    POLICIES = (BLOCK, DROP_OLDEST, COALESCE)
+
+    def __init__(self, renderer, queueSize=64, overflowPolicy=COALESCE, snapshotFactory=None):
+        """
+        Parameters:
+            renderer (:class:`mtx.Renderer`): The renderer to be fed.
+            queueSize (:obj:`int`): The maximum number of act groups waiting for the renderer.
+            overflowPolicy (:obj:`int`): What to do if the queue is full.
+                :attr:`BLOCK` waits until the renderer has caught up,
+                :attr:`DROP_OLDEST` discards the oldest waiting act group and
+                :attr:`COALESCE` replaces all waiting act groups by a snapshot of the game.
+                Act groups that load or reset a level are never discarded. If the oldest one
+                does, :attr:`DROP_OLDEST` replaces the waiting act groups by a snapshot as well
+                or, without `snapshotFactory`, discards the oldest act group without level acts.
+                If all waiting act groups contain level acts, it waits like :attr:`BLOCK`, so
+                the queue never exceeds `queueSize`.
+            snapshotFactory (:obj:`callable`): Returns a ready :class:`mtx.ActGroup` that brings
+                the renderer to the current state of the game. Required by :attr:`COALESCE`, without
+                it the policy falls back to :attr:`DROP_OLDEST`.
+
+        Raises:
+            :obj:`ValueError`: If `queueSize` or `overflowPolicy` is not valid.
+        """
+        if queueSize < 1:
+            raise ValueError("The queue size must be at least 1.")
+
+        if overflowPolicy not in self.POLICIES:
+            raise ValueError("Unknown overflow policy `%s`." % overflowPolicy)
+
+        self._renderer = renderer
+        self._queueSize = queueSize
+        self._overflowPolicy = overflowPolicy
+        self._snapshotFactory = snapshotFactory
+
+        self._queue = collections.deque()
+        self._condition = Condition()
+        self._active = True
+
+        self._sentCount = 0
+        self._droppedCount = 0
+        self._coalescedCount = 0
+        self._blockedCount = 0
+        self._maxDepth = 0
+        self._lastLag = 0.0
+        self._maxLag = 0.0
+        self._totalLag = 0.0
+
+        self._thread = Thread(target=self._WorkerThread)
+        self._thread.setDaemon(True)
+        self._thread.start()
+
+    def GetRenderer(self):
+        """
+        Returns:
+            :class:`mtx.Renderer`: The wrapped renderer.
+        """
+        return self._renderer
+
+    def GetPreferedFieldSize(self):
+        return self._renderer.GetPreferedFieldSize()
+
+    def ProcessActGroup(self, actGrp):
+        """
+        Puts the act group into the queue of the renderer. Levels referenced by the act group are
+        frozen, because the renderer processes them later.
+
+        Parameters:
+            actGrp (:class:`mtx.ActGroup`): The act group to be processed by the renderer.
+        """
+        hasLevel = self._FreezeLevels(actGrp)
+
+        with self._condition:
+            if not self._active:
+                return
+
+            if len(self._queue) >= self._queueSize:
+                block = self._overflowPolicy == self.BLOCK
+                if not block and self._snapshotFactory is not None and\
+                   (self._overflowPolicy == self.COALESCE or self._queue[0][2]):
+                    # The snapshot already contains the state of the new act group.
+                    self._coalescedCount += len(self._queue) + 1
+                    self._queue.clear()
+                    actGrp = self._snapshotFactory()
+                    hasLevel = self._FreezeLevels(actGrp)
+                elif not block:
+                    # Without its level the renderer could not process any further act group.
+                    for i, (queueTime, queuedGrp, queuedHasLevel) in enumerate(self._queue):
+                        if not queuedHasLevel:
+                            del self._queue[i]
+                            self._droppedCount += 1
+                            break
+                    else:
+                        block = True
+
+                if block:
+                    self._blockedCount += 1
+                    while self._active and len(self._queue) >= self._queueSize:
+                        self._condition.wait()
+                    if not self._active:
+                        return
+
+            self._queue.append((time.perf_counter(), actGrp, hasLevel))
+            self._maxDepth = max(self._maxDepth, len(self._queue))
+            self._condition.notify_all()
+
+    @staticmethod
+    def _FreezeLevels(actGrp):
+        hasLevel = False
+        for act in actGrp:
+            if act.id in Act.LEVEL:
+                act.Freeze()
+                hasLevel = True
+        return hasLevel
+
+    def Stop(self, wait=False):
+        """
+        Stops the worker thread. Act groups that are still waiting are discarded.
+
+        Parameters:
+            wait (:obj:`bool`): True, to wait until the worker thread has finished.
+        """
+        with self._condition:
+            self._active = False
+            self._droppedCount += len(self._queue)
+            self._queue.clear()
+            self._condition.notify_all()
+
+        if wait:
+            self._thread.join()
+
+    def GetLag(self):
+        """
+        Returns:
+            :obj:`float`: The time in seconds the oldest waiting act group is already waiting or
+            0 if the queue is empty.
+        """
+        with self._condition:
+            if len(self._queue) == 0:
+                return 0.0
+            return time.perf_counter() - self._queue[0][0]
+
+    def GetStats(self):
+        """
+        Returns:
+            :obj:`dict`: The metrics of the queue:
+
+                :depth: Number of act groups currently waiting.
+                :maxDepth: Highest number of waiting act groups so far.
+                :sent: Number of act groups processed by the renderer.
+                :dropped: Number of act groups that were discarded.
+                :coalesced: Number of act groups that were replaced by a snapshot.
+                :blocked: Number of act groups that had to wait for a free place in the queue.
+                :lag: Time the oldest waiting act group is already waiting.
+                :lastLag: Time between queueing and processing of the last act group.
+                :maxLag: Highest time between queueing and processing of an act group.
+                :avgLag: Average time between queueing and processing of an act group.
+        """
+        with self._condition:
+            now = time.perf_counter()
+            return {'depth':     len(self._queue),
+                    'maxDepth':  self._maxDepth,
+                    'sent':      self._sentCount,
+                    'dropped':   self._droppedCount,
+                    'coalesced': self._coalescedCount,
+                    'blocked':   self._blockedCount,
+                    'lag':       now - self._queue[0][0] if len(self._queue) > 0 else 0.0,
+                    'lastLag':   self._lastLag,
+                    'maxLag':    self._maxLag,
+                    'avgLag':    self._totalLag / self._sentCount if self._sentCount > 0 else 0.0}
+
+    def _WorkerThread(self):
+        while True:
+            with self._condition:
+                while self._active and len(self._queue) == 0:
+                    self._condition.wait()
+
+                if not self._active:
+                    return
+
+                queueTime, actGrp, hasLevel = self._queue.popleft()
+                self._condition.notify_all()
+
+            try:
+                self._renderer.ProcessActGroup(actGrp)
+            except Exception:
+                logging.error("Renderer failed to process an act group...", exc_info=1)
+
+            lag = time.perf_counter() - queueTime
+
+            with self._condition:
+                self._sentCount += 1
+                self._lastLag = lag
+                self._maxLag = max(self._maxLag, lag)
+                self._totalLag += lag
@@ -15,6 +15,9 @@
     along with this program. If not, see <http://www.gnu.org/licenses/>.
 """
 
+from .Constants import TRAIT
+
+
 class BaseObject():
     """
     Base class for all objects.
@@ -23,6 +26,19 @@ class BaseObject():
     renderer.
     """
 
+    __slots__ = ('_id', '_symbol', '_cell')
+
+    #: True, if the objects of the class never change, move or are removed. In a level with
+    #: flyweight objects (see :class:`mtx.Level`), all objects of such a class with the same symbol
+    #: are represented by one shared object.
+    FLYWEIGHT = False
+
+    #: True, if the results of the `Is*` methods depend on the state of an object. Otherwise the
+    #: traits are calculated once for the whole class when it is registered (see
+    #: :meth:`GetTraits`). The cells cache the traits of their objects, so an object with dynamic
+    #: traits has to call :meth:`TraitsChanged` whenever the results of its `Is*` methods change.
+    DYNAMIC_TRAITS = False
+
     def __init__(self, id, symbol):
         self._id = id
         self._symbol = symbol
@@ -38,11 +54,55 @@ class BaseObject():
     def GetSymbol(self):
         return self._symbol
 
+    def SetSymbol(self, symbol):
+        """
+        Changes the symbol of the object. The cell of the object is informed about the change, so
+        its object counters and accessibility data stay valid.
+
+        Parameters:
+            symbol (:obj:`str`): The new symbol of the object.
+        """
+        oldSymbol = self._symbol
+        self._symbol = symbol
+        if self._cell is not None:
+            self._cell._ObjectChanged(self, oldSymbol)
+
+    def TraitsChanged(self):
+        """
+        Informs the cell of the object that the results of its `Is*` methods have changed, e.g.
+        when a door is opened, so the traits of the cell and the accessibility data of the field
+        stay valid. Only objects with :attr:`DYNAMIC_TRAITS` need to call it. It is called by
+        :meth:`mtx.Level.Reset` and :class:`mtx.Journal` after they have restored the state of
+        such an object.
+        """
+        if self._cell is not None:
+            self._cell._TraitsChanged(self)
+
     def __eq__(self, other):
         if isinstance(other, BaseObject):
             return self._symbol == other.GetSymbol()
         return self._symbol in other
 
+    def GetState(self):
+        """
+        Returns the mutable state of the object apart from its symbol and its cell. It is stored
+        by :meth:`mtx.Level.TakeSnapshot` and given back to :meth:`SetState` when the level is
+        reset. Objects without a state return None.
+
+        Returns:
+            The state of the object or None.
+        """
+        return None
+
+    def SetState(self, state):
+        """
+        Restores a state returned by :meth:`GetState`.
+
+        Parameters:
+            state: The state of the object.
+        """
+        pass
+
     def IsBelow(self, symbol):
         objBelow = self._cell.GetObjectBelow(self)
         return objBelow is not None and objBelow.Is(symbol)
@@ -114,9 +174,44 @@ class BaseObject():
         """
         return False
 
+    def GetTraits(self):
+        """
+        Returns the traits of the object, which are used by the engine instead of calling the
+        `Is*` methods. For registered classes they are calculated once by
+        :func:`mtx.RegisterObjectClass`, unless the class sets :attr:`DYNAMIC_TRAITS`.
+
+        Returns:
+            :obj:`int`: The combination of :class:`mtx.TRAIT<mtx.Constants.TRAIT>` flags that
+            correspond to the `Is*` methods of the object.
+        """
+        traits = CLASS_TRAITS.get(self.__class__)
+        if traits is None:
+            traits = self._CalculateTraits()
+        return traits
+
+    def _CalculateTraits(self):
+        traits = TRAIT.NONE
+        if self.IsSolid():
+            traits |= TRAIT.SOLID
+        if self.IsMovable():
+            traits |= TRAIT.MOVABLE
+            if not self.IsMovableByObject():
+                traits |= TRAIT.UNPUSHABLE
+        if self.IsCollectable():
+            traits |= TRAIT.COLLECTABLE
+        if self.IsRemovable():
+            traits |= TRAIT.REMOVABLE
+            if self.RemoveOnEnter():
+                traits |= TRAIT.REMOVE_ON_ENTER
+        if self.IsTrigger():
+            traits |= TRAIT.TRIGGER
+        return traits
+
 
 REGISTERED_OBJECT_CLASSES = {}
 MULTI_OBJECT_SYMBOL = {}
+SYMBOL_BITS = {}
+CLASS_TRAITS = {}
 
 
 def _CheckSymbol(symbol):
@@ -131,11 +226,22 @@ def _CheckSymbol(symbol):
 
 def RegisterObjectClass(objCls):
     """
-    Method to register an object class.
+    Method to register an object class. The traits of the class are calculated once (see
+    :meth:`mtx.BaseObject.GetTraits`).
     """
     for symbol in objCls.GetSymbols():
         _CheckSymbol(symbol)
         REGISTERED_OBJECT_CLASSES[symbol] = objCls
+        GetSymbolBit(symbol)
+
+    CLASS_TRAITS.pop(objCls, None)
+    if not objCls.DYNAMIC_TRAITS:
+        # The `Is*` methods are called on an uninitialized object. If they need the state of the
+        # object, the traits have to be calculated for each object.
+        try:
+            CLASS_TRAITS[objCls] = objCls.__new__(objCls)._CalculateTraits()
+        except AttributeError:
+            pass
 
 
 def RegisterMultiObjectSymbol(symbol, symbols):
@@ -161,3 +267,36 @@ def GetRegisteredMultiObjectSymbols(symbol):
     if symbol not in MULTI_OBJECT_SYMBOL:
         raise RuntimeError("No multi object registered for the symbol `%s`" % symbol)
     return MULTI_OBJECT_SYMBOL[symbol]
+
+
+def GetSymbolTraits(symbol):
+    """
+    Parameters:
+        symbol (:obj:`str`): The symbol of a registered object class.
+
+    Returns:
+        :obj:`int` or :obj:`None`: The :class:`mtx.TRAIT<mtx.Constants.TRAIT>` flags of the class
+        or None, if they depend on the state of the objects (see
+        :attr:`mtx.BaseObject.DYNAMIC_TRAITS`).
+
+    Raises:
+        :obj:`RuntimeError`: If no class is registered for the symbol.
+    """
+    return CLASS_TRAITS.get(GetRegisteredObjectClass(symbol))
+
+
+def GetSymbolBit(symbol):
+    """
+    Returns the bit that represents `symbol` in symbol bitsets. Each symbol gets its own bit, the
+    bits of registered object classes are assigned when they are registered.
+
+    Parameters:
+        symbol (:obj:`str`): An object symbol.
+
+    Returns:
+        :obj:`int`: The bit of the symbol.
+    """
+    bit = SYMBOL_BITS.get(symbol)
+    if bit is None:
+        bit = SYMBOL_BITS[symbol] = 1 << len(SYMBOL_BITS)
+    return bit
@@ -15,7 +15,10 @@
     along with this program. If not, see <http://www.gnu.org/licenses/>.
 """
 
-from . import Constants, BaseObject
+from . import Constants, BaseObject, GetSymbolBit, TRAIT
+
+# The positions of the set bits of each combination of traits.
+_TRAIT_BITS = tuple(tuple(bit for bit in range(8) if traits >> bit & 1) for traits in range(256))
 
 
 class Cell():
@@ -28,6 +31,9 @@ class Cell():
     whether a new game object can be placed on the cell.
     """
 
+    __slots__ = ('_field', '_x', '_y', '_objCount', '_objects', '_objectIds', '_traits',
+                 '_traitCounts', '_symbolMask')
+
     def __init__(self, field, x, y):
         """
         Parameters:
@@ -40,23 +46,32 @@ class Cell():
         self._x = x
         self._y = y
         self._objCount = {}
+        self._traits = TRAIT.NONE
+        self._symbolMask = 0
 
+        # The number of objects with each trait bit, so removing an object updates the traits
+        # without scanning the stack. They are counted when an object is removed for the first
+        # time.
+        self._traitCounts = None
+
+        # The objects are ordered from bottom to top, so the top most object is the last one.
         self._objects = []
+        self._objectIds = {}
 
     def __repr__(self):
         return 'mtx.Cell(%r, %r)' % (self._field, self._position)
 
     def __iter__(self):
-        return self._objects.__iter__()
+        return self._objects.__reversed__()
 
     def __contains__(self, obj):
         if isinstance(obj, BaseObject):
-            return obj in self._objects
+            return self._objectIds.get(obj._id) is obj
 
         return self._objCount.get(obj, 0) > 0
 
     def __reversed__(self):
-        return self._objects.__reversed__()
+        return self._objects.__iter__()
 
     def Add(self, obj):
         """
@@ -65,19 +80,45 @@ class Cell():
         Parameters:
             obj (:class:`mtx.BaseObject`): The object to be added to the cell.
         """
+        self._Place(obj, None)
+
+    def Insert(self, index, obj):
+        """
+        Inserts an :ref:`object<mtx.objects>` into the cell at the given position of the stack.
+
+        Parameters:
+            index (:obj:`int`): The position counted from the bottom of the cell. If it is greater
+                than the number of objects, the object is added on top.
+            obj (:class:`mtx.BaseObject`): The object to be inserted into the cell.
+        """
+        self._Place(obj, index)
 
+    def _Place(self, obj, index):
         # If the object is currently placed on another cell, it has to be removed from it.
         oldCell = obj.GetCell()
         if oldCell is not None:
             oldCell.Remove(obj)
 
-        # Set this cell as the new parent for the object and add it on top of the object list.
+        # Set this cell as the new parent for the object and add it to the object list.
         obj.SetCell(self)
-        self._objects.insert(0, obj)
+        if index is None or index >= len(self._objects):
+            self._objects.append(obj)
+        else:
+            self._objects.insert(index, obj)
+        self._objectIds[obj._id] = obj
 
         # Increase the counter of the object type in this cell.
         symbol = obj.GetSymbol()
         self._objCount[symbol] = self._objCount.get(symbol, 0) + 1
+        traits = obj.GetTraits()
+        self._traits |= traits
+        if self._traitCounts is not None:
+            counts = self._traitCounts
+            for bit in _TRAIT_BITS[traits]:
+                counts[bit] += 1
+        self._symbolMask |= GetSymbolBit(symbol)
+
+        self._field._ObjectAdded(self, obj)
 
     def Remove(self, obj):
         """
@@ -89,16 +130,72 @@ class Cell():
         Raises:
             :obj:`LookupError`: If the object is not in the objects list.
         """
-        if obj not in self._objects:
+        if self._objectIds.get(obj._id) is not obj:
             raise LookupError("Object `%s` not in list." % obj)
 
-        # Set the object as parentless and remove it from the object list.
+        # Set the object as parentless and remove it from the object list. Mostly it is the top
+        # most object, so the list is searched from the end.
         obj.SetCell(None)
-        self._objects.remove(obj)
+        del self._objectIds[obj._id]
+
+        objects = self._objects
+        if objects[-1] is obj:
+            index = len(objects) - 1
+            objects.pop()
+        else:
+            index = self._FindIndex(obj)
+            del objects[index]
 
         # Decrease the counter of the object type in this cell.
+        self._DecreaseCount(obj.GetSymbol())
+        if self._traitCounts is None:
+            self._CountTraits()
+        else:
+            counts = self._traitCounts
+            for bit in _TRAIT_BITS[obj.GetTraits()]:
+                counts[bit] -= 1
+                if counts[bit] == 0:
+                    self._traits &= ~(1 << bit)
+
+        self._field._ObjectRemoved(self, obj, index)
+
+    def _FindIndex(self, obj):
+        objects = self._objects
+        for idx in range(len(objects) - 1, -1, -1):
+            if objects[idx] is obj:
+                return idx
+        return -1
+
+    def _DecreaseCount(self, symbol):
+        count = self._objCount[symbol] - 1
+        self._objCount[symbol] = count
+        if count == 0:
+            self._symbolMask &= ~GetSymbolBit(symbol)
+
+    def _CountTraits(self):
+        counts = [0] * 8
+        traits = TRAIT.NONE
+        for obj in self._objects:
+            objTraits = obj.GetTraits()
+            traits |= objTraits
+            for bit in _TRAIT_BITS[objTraits]:
+                counts[bit] += 1
+        self._traits = traits
+        self._traitCounts = counts
+
+    def _ObjectChanged(self, obj, oldSymbol):
+        # Called by an object of the cell after its symbol has changed.
+        self._DecreaseCount(oldSymbol)
         symbol = obj.GetSymbol()
-        self._objCount[symbol] = self._objCount[symbol] - 1
+        self._objCount[symbol] = self._objCount.get(symbol, 0) + 1
+        self._symbolMask |= GetSymbolBit(symbol)
+        self._CountTraits()
+        self._field._ObjectChanged(self, obj, oldSymbol)
+
+    def _TraitsChanged(self, obj):
+        # Called by an object of the cell after the results of its `Is*` methods have changed.
+        self._CountTraits()
+        self._field._TraitsChanged(self)
 
     def GetPosition(self):
         """
@@ -153,42 +250,49 @@ class Cell():
         Returns:
             :obj:`bool`: True, if cell is accessible, False otherwise.
         """
-        whitelist = gameSettings.cellAccessWhitelist
-        blacklist = gameSettings.cellAccessBlacklist
-
-        if len(self._objects) == 0:
-            if whitelist is not None and ' ' not in whitelist:
-                return False
-
-            if blacklist is not None and ' ' in blacklist:
-                return False
-
-            return True
+        return Cell._CheckAccess(self._traits, self._symbolMask, moving, gameSettings)
 
-        whitelistRespected = False
+    @staticmethod
+    def _CheckAccess(traits, symbolMask, moving, gameSettings):
+        if traits & TRAIT.SOLID:
+            # If a solid object is on the cell, no other object is allowed.
+            return False
 
-        for obj in self._objects:
-            if obj.IsSolid():
-                # If a solid object is on the cell, no other object is allowed.
-                return False
+        if traits & TRAIT.MOVABLE and (not moving or traits & TRAIT.UNPUSHABLE):
+            # If a movable object is on the cell, and either one object wants to acces without
+            # moving or the movable object can't be moved by another object, the access will
+            # be denied.
+            return False
 
-            if obj.IsMovable() and (not moving or not obj.IsMovableByObject()):
-                # If a movable object is on the cell, and either one object wants to acces without
-                # moving or the movable object can't be moved by another object, the access will
-                # be denied.
-                return False
+        whitelistMask, blacklistMask, emptyAccessible = gameSettings.GetCompiledAccess()
 
-            if whitelist is not None and not whitelistRespected and obj.GetSymbol() in whitelist:
-                whitelistRespected = True
+        if symbolMask == 0:
+            return emptyAccessible
 
-            if blacklist is not None and obj.GetSymbol() in blacklist:
-                return False
+        if whitelistMask is not None and not symbolMask & whitelistMask:
+            return False
 
-        if whitelist is not None and not whitelistRespected:
+        if symbolMask & blacklistMask:
             return False
 
         return True
 
+    def GetTraits(self):
+        """
+        Returns:
+            :obj:`int`: The combined :class:`mtx.TRAIT<mtx.Constants.TRAIT>` flags of all objects
+            on the cell.
+        """
+        return self._traits
+
+    def GetSymbolMask(self):
+        """
+        Returns:
+            :obj:`int`: The bitset of the symbols of all objects on the cell (see
+            :func:`mtx.GetSymbolBit`).
+        """
+        return self._symbolMask
+
     def GetFirstObject(self):
         """
         Returns:
@@ -197,7 +301,7 @@ class Cell():
         """
 
         if len(self._objects) > 0:
-            return self._objects[0]
+            return self._objects[-1]
         return None
 
     def GetObjectBelow(self, obj):
@@ -211,14 +315,14 @@ class Cell():
             none exists.
         """
 
-        if obj not in self._objects:
+        if self._objectIds.get(obj._id) is not obj:
             return None
 
-        idx = self._objects.index(obj)
-        if idx == len(self._objects) - 1:
+        idx = self._FindIndex(obj)
+        if idx == 0:
             return None
 
-        return self._objects[idx + 1]
+        return self._objects[idx - 1]
 
     def GetObjectCount(self, symbol):
         """
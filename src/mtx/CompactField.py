@@ -0,0 +1,355 @@
+"""
+    mtxPython - A framework to create matrix games.
+    Copyright (C) 2016  Tobias Stampfl <info@matrixgames.rocks>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation in version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from array import array
+
+from . import BaseObject, Cell, Field, GetSymbolBit, TRAIT
+
+
+class CompactCell(Cell):
+    """
+    Lightweight view on a cell of a :class:`mtx.CompactField`. It provides the same interface as
+    :class:`mtx.Cell`, but all data is kept by the field, so views can be created and thrown away
+    at any time.
+    """
+
+    __slots__ = ('_index',)
+
+    def __init__(self, field, x, y):
+        """
+        Parameters:
+            field (:class:`mtx.CompactField`): The field the cell belongs to.
+            x (:obj:`int`): The x coordinate of the cell within the field.
+            y (:obj:`int`): The y coordinate of the cell within the field.
+        """
+        self._field = field
+        self._x = x
+        self._y = y
+        self._index = y * field._width + x
+
+    def __repr__(self):
+        return 'mtx.CompactCell(%r, %r)' % (self._field, (self._x, self._y))
+
+    def __eq__(self, other):
+        return isinstance(other, CompactCell) and self._field is other._field and\
+               self._index == other._index
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((id(self._field), self._index))
+
+    def _GetObjects(self):
+        # Returns the objects of the cell, ordered from bottom to top. A flyweight object is
+        # always the bottom most object.
+        field = self._field
+        stack = field._stacks.get(self._index)
+        if stack is not None:
+            objects = stack
+        else:
+            objId = field._topIds[self._index]
+            objects = () if objId < 0 else (field._objects[objId],)
+
+        if field._flyweightIds is not None:
+            flyweightId = field._flyweightIds[self._index]
+            if flyweightId > 0:
+                return (field._flyweights[flyweightId - 1],) + tuple(objects)
+        return objects
+
+    def __iter__(self):
+        return reversed(self._GetObjects())
+
+    def __reversed__(self):
+        return iter(self._GetObjects())
+
+    def __contains__(self, obj):
+        if isinstance(obj, BaseObject):
+            return any(o is obj for o in self._GetObjects())
+
+        return any(o._symbol == obj for o in self._GetObjects())
+
+    def Add(self, obj):
+        """
+        Adds a new :ref:`object<mtx.objects>` on top of the cell.
+
+        Parameters:
+            obj (:class:`mtx.BaseObject`): The object to be added to the cell.
+        """
+        self._Place(obj, None)
+
+    def _Place(self, obj, index):
+        oldCell = obj.GetCell()
+        if oldCell is not None:
+            oldCell.Remove(obj)
+
+        obj.SetCell(self)
+
+        field = self._field
+        cellIndex = self._index
+        topId = field._topIds[cellIndex]
+        if topId >= 0:
+            stack = field._stacks.get(cellIndex)
+            if stack is None:
+                stack = field._stacks[cellIndex] = [field._objects[topId]]
+            if index is None or index >= len(stack):
+                stack.append(obj)
+            else:
+                stack.insert(index, obj)
+            field._topIds[cellIndex] = stack[-1]._id
+        else:
+            field._topIds[cellIndex] = obj._id
+
+        field._objects[obj._id] = obj
+        field._traits[cellIndex] |= obj.GetTraits()
+        field._ObjectAdded(self, obj)
+
+    def Remove(self, obj):
+        """
+        Removes an :class:`object<mtx.objects>` from the cell.
+
+        Parameters:
+            obj (:class:`mtx.BaseObject`): The object to be removed from the cell.
+
+        Raises:
+            :obj:`LookupError`: If the object is not on the cell.
+        """
+        field = self._field
+        index = self._index
+        stack = field._stacks.get(index)
+
+        if field._IsFlyweight(obj):
+            raise RuntimeError("Flyweight object `%s` can't be removed." % obj)
+
+        if stack is None:
+            if field._topIds[index] != obj._id or field._objects.get(obj._id) is not obj:
+                raise LookupError("Object `%s` not in list." % obj)
+
+            position = 0
+            field._topIds[index] = -1
+            field._traits[index] = field._GetFlyweightTraits(index)
+        else:
+            for position in range(len(stack) - 1, -1, -1):
+                if stack[position] is obj:
+                    del stack[position]
+                    break
+            else:
+                raise LookupError("Object `%s` not in list." % obj)
+
+            field._topIds[index] = stack[-1]._id
+            traits = field._GetFlyweightTraits(index)
+            for o in stack:
+                traits |= o.GetTraits()
+            field._traits[index] = traits
+
+            if len(stack) == 1:
+                del field._stacks[index]
+
+        del field._objects[obj._id]
+        obj.SetCell(None)
+        field._ObjectRemoved(self, obj, position)
+
+    def _ObjectChanged(self, obj, oldSymbol):
+        traits = TRAIT.NONE
+        for o in self._GetObjects():
+            traits |= o.GetTraits()
+        self._field._traits[self._index] = traits
+        self._field._ObjectChanged(self, obj, oldSymbol)
+
+    def _TraitsChanged(self, obj):
+        traits = TRAIT.NONE
+        for o in self._GetObjects():
+            traits |= o.GetTraits()
+        self._field._traits[self._index] = traits
+        self._field._TraitsChanged(self)
+
+    def IsAccessible(self, moving, gameSettings):
+        return Cell._CheckAccess(self._field._traits[self._index], self.GetSymbolMask(), moving,
+                                 gameSettings)
+
+    def GetFirstObject(self):
+        field = self._field
+        objId = field._topIds[self._index]
+        if objId >= 0:
+            return field._objects[objId]
+
+        if field._flyweightIds is not None:
+            flyweightId = field._flyweightIds[self._index]
+            if flyweightId > 0:
+                return field._flyweights[flyweightId - 1]
+        return None
+
+    def GetObjectBelow(self, obj):
+        objects = self._GetObjects()
+        for i in range(len(objects) - 1, 0, -1):
+            if objects[i] is obj:
+                return objects[i - 1]
+        return None
+
+    def GetObjectCount(self, symbol):
+        return sum(1 for o in self._GetObjects() if o._symbol == symbol)
+
+    def GetTraits(self):
+        """
+        Returns:
+            :obj:`int`: The combined :class:`mtx.TRAIT<mtx.Constants.TRAIT>` flags of all objects
+            on the cell.
+        """
+        return self._field._traits[self._index]
+
+    def GetSymbolMask(self):
+        symbolMask = 0
+        for obj in self._GetObjects():
+            symbolMask |= GetSymbolBit(obj._symbol)
+        return symbolMask
+
+
+class CompactField(Field):
+    """
+    Field that keeps its cells in flat arrays indexed by `y * width + x` instead of one
+    :class:`mtx.Cell` object per position. It stores the id of the top most object and the
+    combined :class:`traits<mtx.Constants.TRAIT>` of each cell. Only cells with more than one
+    object need an additional stack of their objects.
+
+    :meth:`GetCell` returns a :class:`mtx.CompactCell`, which is a view on the arrays and
+    behaves like a :class:`mtx.Cell`.
+
+    Objects of classes marked as :attr:`mtx.BaseObject.FLYWEIGHT` (e.g. walls) can be stored in an
+    additional layer, which only holds one byte per cell (see :class:`mtx.Level`). Each symbol
+    is represented by one shared object, which is always the bottom most object of its cells,
+    has no cell of its own and can't be removed.
+    """
+
+    def __init__(self, level, width, height):
+        """
+        Parameters:
+            level (:class:`mtx.Level`): The level the field belongs to.
+            width (:obj:`int`): The width of the field.
+            height (:obj:`int`): The height of the field.
+        """
+        self._flyweights = []
+        self._flyweightIds = None
+        Field.__init__(self, level, width, height)
+
+    def __repr__(self):
+        return 'mtx.CompactField(%r, %r)' % (self._width, self._height)
+
+    def __iter__(self):
+        for y in range(self._height):
+            for x in range(self._width):
+                yield CompactCell(self, x, y)
+
+    def _CreateCells(self):
+        size = self._width * self._height
+        self._topIds = array('l', [-1]) * size
+        self._traits = array('B', bytes(size))
+        self._stacks = {}
+        self._objects = {}
+
+    def Clear(self):
+        """
+        Removes all objects from all cells. The flyweight objects are kept, because they are part
+        of the static structure of the level.
+        """
+        for obj in self._objects.values():
+            obj.SetCell(None)
+
+        self._CreateCells()
+        self._touchedCells.clear()
+        self._hash = 0
+        self._pathFinder = None
+        self._symbolIndex = None
+
+        if self._flyweightIds is not None:
+            for index, flyweightId in enumerate(self._flyweightIds):
+                if flyweightId > 0:
+                    self._traits[index] = self._flyweights[flyweightId - 1].GetTraits()
+
+    def _Populate(self, contents):
+        # Fills the empty cells of a new field in bulk, see Field._Populate.
+        width = self._width
+        fieldObjects = self._objects
+        for x, y, objects, objCount, symbolMask, traits in contents:
+            cell = CompactCell(self, x, y)
+            index = y * width + x
+            for obj in objects:
+                obj.SetCell(cell)
+                fieldObjects[obj._id] = obj
+
+            if traits is None:
+                traits = TRAIT.NONE
+                for obj in objects:
+                    traits |= obj.GetTraits()
+
+            if len(objects) > 1:
+                self._stacks[index] = list(objects)
+            self._topIds[index] = objects[-1]._id
+            self._traits[index] |= traits
+
+    def _IsFlyweight(self, obj):
+        return any(obj is flyweight for flyweight in self._flyweights)
+
+    def _GetFlyweightTraits(self, index):
+        if self._flyweightIds is None:
+            return TRAIT.NONE
+
+        flyweightId = self._flyweightIds[index]
+        if flyweightId == 0:
+            return TRAIT.NONE
+        return self._flyweights[flyweightId - 1].GetTraits()
+
+    def AddFlyweight(self, x, y, obj):
+        """
+        Places a shared flyweight object on a cell. It becomes the bottom most object of the cell.
+
+        Parameters:
+            x (:obj:`int`): The x coordinate of the cell.
+            y (:obj:`int`): The y coordinate of the cell.
+            obj (:class:`mtx.BaseObject`): The shared object.
+
+        Raises:
+            :obj:`RuntimeError`: If the cell already has a flyweight object or if there are too
+                many different flyweight objects.
+        """
+        if self._flyweightIds is None:
+            self._flyweightIds = array('B', bytes(self._width * self._height))
+
+        for i, flyweight in enumerate(self._flyweights):
+            if flyweight is obj:
+                flyweightId = i + 1
+                break
+        else:
+            if len(self._flyweights) == 255:
+                raise RuntimeError("A field can't have more than 255 flyweight objects.")
+            self._flyweights.append(obj)
+            flyweightId = len(self._flyweights)
+
+        index = y * self._width + x
+        if self._flyweightIds[index] > 0:
+            raise RuntimeError("Cell %s already has a flyweight object." % ((x, y),))
+
+        self._flyweightIds[index] = flyweightId
+        self._traits[index] |= obj.GetTraits()
+        self._ObjectAdded(CompactCell(self, x, y), obj)
+
+    def GetCell(self, x, y):
+        if x < 0 or x >= self._width or\
+           y < 0 or y >= self._height:
+           return None
+
+        return CompactCell(self, x, y)
+
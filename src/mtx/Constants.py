@@ -31,6 +31,22 @@ DOWN   = 0x2
 LEFT   = 0x3
 
 
+class TRAIT:
+    """
+    Bit flags describing the behaviour of an object (see :meth:`mtx.BaseObject.GetTraits`).
+    """
+    NONE         = 0x00
+    SOLID        = 0x01
+    MOVABLE      = 0x02
+    COLLECTABLE  = 0x04
+    REMOVABLE    = 0x08
+    TRIGGER      = 0x10
+    #: Set for movable objects that can't be moved by another object.
+    UNPUSHABLE   = 0x20
+    #: Set for removable objects that are removed when another object enters their cell.
+    REMOVE_ON_ENTER = 0x40
+
+
 class TEXTURE:
 
     class GROUND:
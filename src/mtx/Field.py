@@ -15,7 +15,23 @@
     along with this program. If not, see <http://www.gnu.org/licenses/>.
 """
 
-from . import Constants, Cell
+import random
+
+from . import Constants, Cell, PathFinder, SymbolIndex, TRAIT
+
+# The random keys for the Zobrist hash of the fields. For each symbol and field size there is one
+# key per cell, so fields of the same size share their keys and have comparable hashes.
+_ZOBRIST_KEYS = {}
+
+
+def _GetZobristKeys(symbol, width, height):
+    keys = _ZOBRIST_KEYS.get((symbol, width, height))
+    if keys is None:
+        # A string seed gives the same keys in every process.
+        rnd = random.Random('%s:%d:%d' % (symbol, width, height))
+        keys = [rnd.getrandbits(64) for _ in range(width * height)]
+        _ZOBRIST_KEYS[(symbol, width, height)] = keys
+    return keys
 
 
 class Field():
@@ -35,6 +51,24 @@ class Field():
         self._height = height
         self._cells = None
 
+        # Cells whose objects have changed since the last snapshot of the level was taken or
+        # restored.
+        self._touchedCells = set()
+
+        # The journal that records the changes of the field while a game step is performed.
+        self._journal = None
+
+        # The Zobrist hash of the symbols on the cells and the keys used by this field. The hash
+        # is only maintained after it has been requested for the first time.
+        self._hash = 0
+        self._zobristKeys = None
+
+        # The path finder is created when a path or a distance map is requested.
+        self._pathFinder = None
+
+        # The index of the objects by symbol is created when it is queried for the first time.
+        self._symbolIndex = None
+
         self._CreateCells()
 
     def __repr__(self):
@@ -55,6 +89,54 @@ class Field():
 
             self._cells.append(row)
 
+    def _LoadZobristKeys(self, symbol):
+        keys = self._zobristKeys[symbol] = _GetZobristKeys(symbol, self._width, self._height)
+        return keys
+
+    def _ObjectAdded(self, cell, obj):
+        self._touchedCells.add(cell)
+        if self._zobristKeys is not None:
+            keys = self._zobristKeys.get(obj._symbol) or self._LoadZobristKeys(obj._symbol)
+            self._hash ^= keys[cell._y * self._width + cell._x]
+        if self._journal is not None:
+            self._journal.ObjectAdded(cell, obj)
+        if self._symbolIndex is not None:
+            self._symbolIndex.ObjectAdded(cell, obj._symbol, obj)
+        if self._pathFinder is not None:
+            self._pathFinder.CellChanged(cell)
+
+    def _ObjectRemoved(self, cell, obj, index):
+        self._touchedCells.add(cell)
+        if self._zobristKeys is not None:
+            keys = self._zobristKeys.get(obj._symbol) or self._LoadZobristKeys(obj._symbol)
+            self._hash ^= keys[cell._y * self._width + cell._x]
+        if self._journal is not None:
+            self._journal.ObjectRemoved(cell, obj, index)
+        if self._symbolIndex is not None:
+            self._symbolIndex.ObjectRemoved(cell, obj._symbol, obj)
+        if self._pathFinder is not None:
+            self._pathFinder.CellChanged(cell)
+
+    def _ObjectChanged(self, cell, obj, oldSymbol):
+        self._touchedCells.add(cell)
+        if self._zobristKeys is not None:
+            index = cell._y * self._width + cell._x
+            oldKeys = self._zobristKeys.get(oldSymbol) or self._LoadZobristKeys(oldSymbol)
+            keys = self._zobristKeys.get(obj._symbol) or self._LoadZobristKeys(obj._symbol)
+            self._hash ^= oldKeys[index] ^ keys[index]
+        if self._journal is not None:
+            self._journal.ObjectChanged(obj, oldSymbol)
+        if self._symbolIndex is not None:
+            self._symbolIndex.ObjectRemoved(cell, oldSymbol, obj)
+            self._symbolIndex.ObjectAdded(cell, obj._symbol, obj)
+        if self._pathFinder is not None:
+            self._pathFinder.CellChanged(cell)
+
+    def _TraitsChanged(self, cell):
+        # The symbols of the cell are unchanged, only its accessibility may be different.
+        if self._pathFinder is not None:
+            self._pathFinder.CellChanged(cell)
+
     def GetLevel(self):
         return self._level
 
@@ -63,6 +145,118 @@ class Field():
         Removes all objects from all cells.
         """
         self._CreateCells()
+        self._touchedCells.clear()
+        self._hash = 0
+        self._pathFinder = None
+        self._symbolIndex = None
+
+    def GetStateHash(self):
+        """
+        Returns the Zobrist hash of the field. It is the XOR of a random 64 bit key for the symbol
+        and the position of each object, which is updated whenever an object is added to or
+        removed from a cell or changes its symbol. Objects with the same symbol are
+        interchangeable, the ids and states of the objects are not taken into account.
+
+        The first call calculates the hash from all cells, afterwards it is kept up to date in
+        constant time per change.
+
+        Returns:
+            :obj:`int`: The 64 bit hash of the objects on the field.
+        """
+        if self._zobristKeys is None:
+            self._zobristKeys = {}
+            self._hash = 0
+            for cell in self:
+                index = cell._y * self._width + cell._x
+                for obj in cell:
+                    keys = self._zobristKeys.get(obj._symbol) or self._LoadZobristKeys(obj._symbol)
+                    self._hash ^= keys[index]
+        return self._hash
+
+    def _GetPathFinder(self):
+        if self._pathFinder is None:
+            self._pathFinder = PathFinder(self)
+        return self._pathFinder
+
+    def _Populate(self, contents):
+        # Fills the empty cells of a new field in bulk (see mtx.LevelTemplate). Each entry
+        # contains the position, the objects from bottom to top, the object counters, the symbol
+        # bitset and the traits of a cell, which are None if they have to be collected from the
+        # objects. The hooks are not called and the cells are not marked as touched, because
+        # nothing depends on a new field before the first snapshot is taken.
+        cells = self._cells
+        for x, y, objects, objCount, symbolMask, traits in contents:
+            cell = cells[y][x]
+            objectIds = cell._objectIds
+            for obj in objects:
+                obj.SetCell(cell)
+                objectIds[obj._id] = obj
+
+            if traits is None:
+                traits = TRAIT.NONE
+                for obj in objects:
+                    traits |= obj.GetTraits()
+
+            cell._objects.extend(objects)
+            cell._objCount.update(objCount)
+            cell._traits |= traits
+            cell._symbolMask |= symbolMask
+
+    def _IsFlyweight(self, obj):
+        return False
+
+    def _GetSymbolIndex(self):
+        if self._symbolIndex is None:
+            self._symbolIndex = SymbolIndex(self)
+        return self._symbolIndex
+
+    def FindPath(self, start, goal, moving=True):
+        """
+        Finds a shortest path between two cells, which only passes accessible cells (see
+        :meth:`mtx.Cell.IsAccessible`). The path is taken from the cached distance map of the
+        goal (see :meth:`DistanceMap`), so many objects heading for the same goal share the
+        costs of the search.
+
+        Parameters:
+            start (:class:`mtx.Cell`): The cell where the path starts, e.g. the cell of an
+                opponent. It doesn't have to be accessible.
+            goal (:class:`mtx.Cell`): The cell where the path ends, e.g. the cell of a player.
+                It doesn't have to be accessible.
+            moving (:obj:`bool`): True, if the cells are entered by moves, False otherwise.
+
+        Returns:
+            :obj:`list` or :obj:`None`: The directions of the path or None, if there is none.
+        """
+        return self._GetPathFinder().FindPath(start, goal, moving)
+
+    def DistanceMap(self, targets, moving=True):
+        """
+        Returns the distances of all cells to the nearest of the given targets. The map is cached
+        until the accessibility of a cell changes in a way that may affect it.
+
+        Example:
+            .. code-block:: python
+
+                # All opponents move towards the nearest player.
+                players = [p.GetCell() for p in level.GetPlayers().values()]
+                distanceMap = level.GetField().DistanceMap(players)
+                for opponent in opponents:
+                    direction = distanceMap.GetDirection(*opponent.GetCell().GetPosition())
+                    if direction is not None:
+                        self.MoveObject(opponent, direction)
+
+        Parameters:
+            targets (:class:`mtx.Cell` or :obj:`list`): The target cell or a list of target
+                cells.
+            moving (:obj:`bool`): True, if the cells are entered by moves, False otherwise (see
+                :meth:`mtx.Cell.IsAccessible`).
+
+        Returns:
+            :class:`mtx.DistanceMap`: The distances to the targets.
+        """
+        if isinstance(targets, Cell):
+            targets = [targets]
+        return self._GetPathFinder().DistanceMap(targets, moving)
 
     def GetSize(self):
         """
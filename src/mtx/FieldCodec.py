@@ -0,0 +1,132 @@
+"""
+    mtxPython - A framework to create matrix games.
+    Copyright (C) 2016  Tobias Stampfl <info@matrixgames.rocks>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation in version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import struct
+
+# Compact binary encoding of the objects of a field.
+#
+# All values are little endian. A packed field starts with the width and the height of the field
+# (two unsigned shorts), followed by every cell in row-major order. A cell is encoded as the number
+# of its objects (unsigned char), followed by the id (int) and the symbol (unsigned char) of each
+# object, ordered from bottom to top.
+#
+# Packed cells only contain a subset of the cells. After the width and the height follows the
+# number of cells (unsigned int) and for each cell its index (unsigned int, y * width + x) and its
+# objects, encoded like above.
+
+_HEADER = struct.Struct('<HH')
+_COUNT = struct.Struct('<I')
+_OBJECT = struct.Struct('<iB')
+
+
+def _PackCell(data, cell):
+    objects = list(reversed(cell))
+    data.append(len(objects))
+    for obj in objects:
+        data += _OBJECT.pack(obj._id, ord(obj._symbol))
+
+
+def _UnpackCell(data, offset):
+    count = data[offset]
+    offset += 1
+
+    objects = []
+    for _ in range(count):
+        objId, symbol = _OBJECT.unpack_from(data, offset)
+        objects.append((objId, chr(symbol)))
+        offset += _OBJECT.size
+
+    return objects, offset
+
+
+def EncodeField(field):
+    """
+    Parameters:
+        field (:class:`mtx.Field`): The field to be encoded.
+
+    Returns:
+        :obj:`bytes`: The packed field.
+    """
+    data = bytearray(_HEADER.pack(field.GetWidth(), field.GetHeight()))
+    for cell in field:
+        _PackCell(data, cell)
+    return bytes(data)
+
+
+def EncodeCells(field, positions):
+    """
+    Parameters:
+        field (:class:`mtx.Field`): The field the cells belong to.
+        positions (:obj:`iterable`): The (x, y) positions of the cells to be encoded.
+
+    Returns:
+        :obj:`bytes`: The packed cells.
+    """
+    width = field.GetWidth()
+    positions = sorted(positions, key=lambda p: p[1] * width + p[0])
+
+    data = bytearray(_HEADER.pack(width, field.GetHeight()))
+    data += _COUNT.pack(len(positions))
+    for x, y in positions:
+        data += _COUNT.pack(y * width + x)
+        _PackCell(data, field.GetCell(x, y))
+    return bytes(data)
+
+
+def DecodeField(data):
+    """
+    Parameters:
+        data (:obj:`bytes`): A packed field.
+
+    Returns:
+        :obj:`list`: A list of rows, each row is a list of cells and each cell is a list of
+        (id, symbol) tuples of the objects on the cell, ordered from bottom to top.
+    """
+    width, height = _HEADER.unpack_from(data, 0)
+    offset = _HEADER.size
+
+    rows = []
+    for _ in range(height):
+        row = []
+        for _ in range(width):
+            objects, offset = _UnpackCell(data, offset)
+            row.append(objects)
+        rows.append(row)
+
+    return rows
+
+
+def DecodeCells(data):
+    """
+    Parameters:
+        data (:obj:`bytes`): Packed cells.
+
+    Returns:
+        :obj:`dict`: Maps the (x, y) position of each cell to a list of (id, symbol) tuples of the
+        objects on the cell, ordered from bottom to top.
+    """
+    width, height = _HEADER.unpack_from(data, 0)
+    count, = _COUNT.unpack_from(data, _HEADER.size)
+    offset = _HEADER.size + _COUNT.size
+
+    cells = {}
+    for _ in range(count):
+        index, = _COUNT.unpack_from(data, offset)
+        objects, offset = _UnpackCell(data, offset + _COUNT.size)
+        cells[(index % width, index // width)] = objects
+
+    return cells
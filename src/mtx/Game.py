@@ -15,7 +15,13 @@
     along with this program. If not, see <http://www.gnu.org/licenses/>.
 """
 
-from . import ActGroup, GameConsole, Settings
+import collections
+
+from . import (Act, ActGroup, EventAct, GameConsole, Journal, LevelTemplate, MotionAct, Settings,
+               SpawnAct, TRAIT, UpdateAct)
+
+# The traits of objects that react when another object enters or leaves their cell.
+_EVENT_TRAITS = TRAIT.COLLECTABLE | TRAIT.REMOVABLE | TRAIT.TRIGGER
 
 class GameInterface():
     @classmethod
@@ -169,9 +175,34 @@ class GameInterface():
         """
         pass
 
-    def OnUndo(self):
+    def OnDeadlock(self, obj):
+        """
+        Event method, which is called when a pushed object can no longer be moved onto a target
+        (see :meth:`mtx.Level.IsDeadlocked`). It is only called, if
+        :attr:`mtx.Settings.deadlockDetection` is enabled.
+
+        It can be used to warn the player early, e.g. by suggesting an undo or a reset.
+
+        Parameters:
+            obj (:class:`mtx.BaseObject`): The pushed object.
+        """
         pass
 
+    def OnUndo(self):
+        """
+        Event method, which is called when the game console requests to undo the last move. By
+        default, the last step of the journal is undone (see :meth:`mtx.Game.Undo`).
+        """
+        self.Undo()
+
+    def OnRedo(self):
+        """
+        Event method, which is called when the game console requests to redo the last undone
+        move. By default, the last undone step of the journal is redone (see
+        :meth:`mtx.Game.Redo`).
+        """
+        self.Redo()
+
     def GetNextLevel(self, number):
         """
         This method is called from the game console to get the next level.
@@ -222,11 +253,18 @@ class GameInterface():
 
 class Game(GameInterface):
 
+    #: The maximum number of compiled level definitions cached by :meth:`CreateLevel`.
+    MAX_LEVEL_TEMPLATES = 64
+
     def __init__(self):
         self._console = None
         self._level = None
         self._settings = Settings()
         self._actGrp = None
+        self._journal = Journal(0)
+        self._levelTemplates = collections.OrderedDict()
+        self._levelPack = None
+        self._levelPackOptions = (False, False)
 
     def SetConsole(self, console):
         """
@@ -257,6 +295,75 @@ class Game(GameInterface):
         if self._actGrp is not None:
             self._actGrp.AddAct(act)
 
+    def CreateLevel(self, defDict, number=None, compact=False, flyweight=False):
+        """
+        Creates a level like :meth:`mtx.Level.Create`, but compiles each level definition only
+        once (see :class:`mtx.LevelTemplate`). The compiled definitions are cached by the game,
+        keyed by the whole definition, so games that create the same levels again and again, e.g.
+        in :meth:`GetNextLevel`, save the time to parse the plan.
+
+        Parameters:
+            defDict (:obj:`dict`): A dictionary with the level definition.
+            number (:obj:`int`): The number of the level.
+            compact (:obj:`bool`): True, to use a :class:`mtx.CompactField` for the level.
+            flyweight (:obj:`bool`): True, to share flyweight objects (see :class:`mtx.Level`).
+
+        Returns:
+            :class:`mtx.Level`: The level object for the given definition.
+        """
+        key = (tuple(defDict.get('plan')), defDict.get('name', ''),
+               defDict.get('ground'), defDict.get('wall'))
+
+        template = self._levelTemplates.get(key)
+        if template is None:
+            template = LevelTemplate.Compile(defDict)
+            self._levelTemplates[key] = template
+            if len(self._levelTemplates) > self.MAX_LEVEL_TEMPLATES:
+                self._levelTemplates.popitem(last=False)
+        else:
+            self._levelTemplates.move_to_end(key)
+
+        return template.Instantiate(number, compact, flyweight)
+
+    def SetLevelPack(self, levelPack, compact=False, flyweight=False):
+        """
+        Sets the level pack whose levels are played by the game. Unless :meth:`GetNextLevel` is
+        overridden, the level with the requested number is taken from the pack (see
+        :meth:`CreateLevel`) and the game ends after the last level of the pack.
+
+        Example:
+            .. code-block:: python
+
+                def __init__(self):
+                    mtx.Game.__init__(self)
+                    path = os.path.join(os.path.dirname(__file__), 'levels.mtxl')
+                    self.SetLevelPack(mtx.LevelPack(path))
+
+        Parameters:
+            levelPack (:class:`mtx.LevelPack`): The level pack or None.
+            compact (:obj:`bool`): True, to use a :class:`mtx.CompactField` for the levels.
+            flyweight (:obj:`bool`): True, to share flyweight objects (see :class:`mtx.Level`).
+        """
+        self._levelPack = levelPack
+        self._levelPackOptions = (compact, flyweight)
+
+    def GetLevelPack(self):
+        """
+        Returns:
+            :class:`mtx.LevelPack`: The level pack of the game or None.
+        """
+        return self._levelPack
+
+    def GetNextLevel(self, number):
+        if self._levelPack is None:
+            return GameInterface.GetNextLevel(self, number)
+
+        if number > self._levelPack.GetLevelCount():
+            return None
+
+        compact, flyweight = self._levelPackOptions
+        return self.CreateLevel(self._levelPack.Get(number), number, compact, flyweight)
+
     def NextLevel(self):
         levelNumber = 1 if self._level is None else self._level.GetNumber() + 1
         self._level = self.GetNextLevel(levelNumber)
@@ -266,7 +373,9 @@ class Game(GameInterface):
             if self._level.GetNumber() is None:
                 self._level.SetNumber(levelNumber)
 
+            self._journal = Journal(self._settings.undoDepth)
             self.OnLevelStart(self._level, False)
+            self._level.TakeSnapshot()
             self._console.OnNextLevel()
 
     def IsCellAccessible(self, cell, moving):
@@ -310,13 +419,16 @@ class Game(GameInterface):
 
         # Create new ActGroup
         self._actGrp = self._console.CreateActGroup()
+        self._journal.Begin(self._level.GetField())
 
         result = self._MoveObject(obj, direction, moveDepth)
 
         if result:
+            self._journal.End(self._actGrp)
             self._actGrp.Ready()
             self._console.ProcessActGroup()
         else:
+            self._journal.Cancel()
             self._console.DiscardActGroup(self._actGrp)
         self._actGrp = None
 
@@ -369,12 +481,14 @@ class Game(GameInterface):
 
         # Create new ActGroup
         self._actGrp = self._console.CreateActGroup()
+        self._journal.Begin(self._level.GetField())
 
         self._actGrp.AddJumpAct(obj, direction, nCell._x, nCell._y)
 
         self._LeaveCell(obj, obj.GetCell())
         self._EnterCell(obj, nCell)
 
+        self._journal.End(self._actGrp)
         self._actGrp.Ready()
         self._console.ProcessActGroup()
         self._actGrp = None
@@ -405,6 +519,75 @@ class Game(GameInterface):
         # Jump the player
         return self.JumpObject(player, direction, distance)
 
+    def Undo(self, count=1):
+        """
+        Undoes the last moves and jumps. The renderers receive the inverse acts: objects move
+        back, removed and collected objects are spawned again and updates are reverted.
+        The number of moves that can be undone is set by
+        :attr:`mtx.Settings.undoDepth<mtx.Settings.undoDepth>`.
+
+        Parameters:
+            count (:obj:`int`): The number of moves to be undone.
+
+        Returns:
+            :obj:`int`: The number of moves that have been undone.
+        """
+        return self._ReplayJournal(count, self._journal.Undo, self._AddInverseActs)
+
+    def Redo(self, count=1):
+        """
+        Redoes moves and jumps that have been undone by :meth:`Undo`. A new move or jump discards
+        the moves that can be redone.
+
+        Parameters:
+            count (:obj:`int`): The number of moves to be redone.
+
+        Returns:
+            :obj:`int`: The number of moves that have been redone.
+        """
+        return self._ReplayJournal(count, self._journal.Redo, self._AddActs)
+
+    def _ReplayJournal(self, count, journalMethod, addActs):
+        if self._level is None:
+            return 0
+
+        actGrp = self._console.CreateActGroup()
+
+        done = 0
+        while done < count:
+            acts = journalMethod()
+            if acts is None:
+                break
+            addActs(actGrp, acts)
+            done += 1
+
+        if done > 0:
+            actGrp.Ready()
+            self._console.ProcessActGroup()
+        else:
+            self._console.DiscardActGroup(actGrp)
+
+        return done
+
+    @staticmethod
+    def _AddActs(actGrp, acts):
+        for act in acts:
+            actGrp.AddAct(act)
+
+    def _AddInverseActs(self, actGrp, acts):
+        for act in reversed(acts):
+            if act.id in Act.MOTION:
+                actGrp.AddAct(MotionAct(act.id, act.objId, (act.direction + 2) % 4,
+                                        act.toX, act.toY, act.fromX, act.fromY))
+            elif act.id in (Act.REMOVE, Act.COLLECT):
+                obj = self._level.GetObject(act.objId)
+                x, y = obj.GetCell().GetPosition()
+                actGrp.AddAct(SpawnAct(act.objId, obj.GetSymbol(), x, y))
+            elif act.id == Act.SPAWN:
+                actGrp.AddAct(EventAct(Act.REMOVE, act.objId, act.objId))
+            elif act.id == Act.UPDATE and act.oldValue is not None:
+                actGrp.AddAct(UpdateAct(act.objId, act.key, act.oldValue, act.value))
+
     def _MoveObject(self, obj, direction, moveDepth):
         """
         Moves an object in the given direction.
@@ -424,26 +607,37 @@ class Game(GameInterface):
 
         # Check if a movable object is on the neighbour cell.
         nObj = nCell.GetFirstObject()
-        if nObj is not None and nObj.IsMovable():
+        pushed = False
+        if nObj is not None and nObj.GetTraits() & TRAIT.MOVABLE:
             # If moveDepth is zero or the object on the neighbour cell could not be moved, then
             # return False.
             if moveDepth == 0 or not self._MoveObject(nObj, direction, moveDepth-1):
                 return False
+            pushed = True
 
         self._actGrp.AddMoveAct(obj, direction, nCell._x, nCell._y)
 
         self._LeaveCell(obj, obj.GetCell())
         self._EnterCell(obj, nCell)
 
+        if pushed and self._settings.deadlockDetection and self._level.IsDeadlocked(nObj):
+            self.OnDeadlock(nObj)
+
         return True
 
     def _EnterCell(self, obj, cell):
         # If any collectable objects are present, then ALL of them will be collected, if
         # they are accepted by the entering object. The top most object, that is not a
         # collectable will be treated separately.
+        # The combined traits of the cell tell, whether there is anything to do at all.
+        if not cell.GetTraits() & _EVENT_TRAITS:
+            cell.Add(obj)
+            return
+
         nonCollectableFound = False
         for o in cell:
-            if o.IsCollectable():
+            traits = o.GetTraits()
+            if traits & TRAIT.COLLECTABLE:
                 if self.OnCollect(o, obj):
                     self._actGrp.AddCollectAct(o, obj)
                     cell.Remove(o)
@@ -452,11 +646,11 @@ class Game(GameInterface):
                 # other non-collectable objects are handled.
                 nonCollectableFound = True
 
-                if o.IsRemovable():
-                    if o.RemoveOnEnter() and self.OnRemove(o, obj):
+                if traits & TRAIT.REMOVABLE:
+                    if traits & TRAIT.REMOVE_ON_ENTER and self.OnRemove(o, obj):
                         self._actGrp.AddRemoveAct(o, obj)
                         cell.Remove(o)
-                elif o.IsTrigger():
+                elif traits & TRAIT.TRIGGER:
                     self.OnTriggerEnter(o, obj)
                     self._actGrp.AddTriggerEnterAct(o, obj)
 
@@ -470,9 +664,11 @@ class Game(GameInterface):
         if o is None:
             return
 
-        if o.IsTrigger():
+        traits = o.GetTraits()
+        if traits & TRAIT.TRIGGER:
             self.OnTriggerLeave(o, obj)
             self._actGrp.AddTriggerLeaveAct(o, obj)
-        elif o.IsRemovable() and not o.RemoveOnEnter() and self.OnRemove(o, obj):
+        elif traits & TRAIT.REMOVABLE and not traits & TRAIT.REMOVE_ON_ENTER and\
+             self.OnRemove(o, obj):
              self._actGrp.AddRemoveAct(o, obj)
              cell.Remove(o)
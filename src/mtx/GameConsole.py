@@ -15,20 +15,95 @@
     along with this program. If not, see <http://www.gnu.org/licenses/>.
 """
 
+import collections
+import threading
 import time
-from . import ActGroup, ActQueue
+from concurrent.futures import Future
+
+from . import ActGroup, ActQueue, AsyncRenderer, GameLoop, InputBuffer
 
 
 class GameConsole():
 
-    def __init__(self):
+    def __init__(self, rendererQueueSize=0, overflowPolicy=AsyncRenderer.COALESCE,
+                 inputBuffer=None):
+        """
+        Parameters:
+            rendererQueueSize (:obj:`int`): If greater than 0, each registered renderer gets its
+                own queue of this size and is fed by its own thread (see
+                :class:`mtx.AsyncRenderer`). Otherwise the renderers are called one after another
+                by the thread that runs the game.
+            overflowPolicy (:obj:`int`): The overflow policy for the renderer queues.
+            inputBuffer (:class:`mtx.InputBuffer`): If given, the moves and jumps of the players
+                are buffered and executed by :meth:`Idle`. Otherwise they are executed at once.
+        """
         self._renderers = []
         self._game = None
         self._gameInitialized = False
-        self._clock = time.clock()
+        self._clock = time.perf_counter()
         self._actQueue = ActQueue()
+        self._rendererQueueSize = rendererQueueSize
+        self._overflowPolicy = overflowPolicy
+
+        # Commands submitted by other threads, which are executed by the thread that runs the
+        # game (see Submit). Appending to and popping from a deque is thread-safe without a lock.
+        self._commands = collections.deque()
+        self._gameThreadId = None
+
+        self._inputBuffer = inputBuffer
+
+    def Submit(self, command, *args):
+        """
+        Queues a call that changes the game, so it is executed by the thread that runs the game
+        the next time it calls :meth:`Idle` (see :meth:`ProcessCommands`). All commands queued
+        until then are executed one after another in the order they were submitted. This makes
+        it safe to control the game from other threads, e.g. the threads of a network server.
+        If the calling thread is the one that runs the game, the command is executed immediately.
+
+        Example:
+            .. code-block:: python
+
+                future = console.Submit(console.MovePlayer, 1, mtx.UP)
+                future.result()
+
+        Parameters:
+            command (:obj:`callable`): The function to be called, e.g. :meth:`MovePlayer`.
+            *args: The arguments of the call.
+
+        Returns:
+            :class:`concurrent.futures.Future`: The future of the result of the call.
+        """
+        future = Future()
+        if threading.get_ident() == self._gameThreadId:
+            self._ExecuteCommand(future, command, args)
+        else:
+            self._commands.append((future, command, args))
+        return future
+
+    def ProcessCommands(self):
+        """
+        Executes the commands queued by :meth:`Submit`. It is called by :meth:`Idle`, the
+        calling thread is regarded as the thread that runs the game.
+        """
+        self._gameThreadId = threading.get_ident()
+        commands = self._commands
+        while len(commands) > 0:
+            future, command, args = commands.popleft()
+            self._ExecuteCommand(future, command, args)
+
+    @staticmethod
+    def _ExecuteCommand(future, command, args):
+        if future.set_running_or_notify_cancel():
+            try:
+                future.set_result(command(*args))
+            except Exception as e:
+                future.set_exception(e)
 
     def RegisterRenderer(self, renderer):
+        if self._rendererQueueSize > 0:
+            renderer = AsyncRenderer(renderer, self._rendererQueueSize, self._overflowPolicy,
+                                     self._CreateSnapshotActGroup)
+
         self._renderers.append(renderer)
         if self._game is not None and self._game._level is not None:
             actGrp = ActGroup()
@@ -38,7 +113,24 @@ class GameConsole():
             self.ProcessActGroup(actGrp, renderer)
 
     def UnregisterRenderer(self, renderer):
-        self._renderers.remove(renderer)
+        for r in self._renderers:
+            if r is renderer or (isinstance(r, AsyncRenderer) and r.GetRenderer() is renderer):
+                self._renderers.remove(r)
+                if isinstance(r, AsyncRenderer):
+                    r.Stop()
+                return
+
+        raise ValueError("Renderer `%s` is not registered." % renderer)
+
+    def GetRendererStats(self):
+        """
+        Returns:
+            :obj:`list`: A list of (renderer, stats) tuples with the queue metrics (see
+            :meth:`mtx.AsyncRenderer.GetStats`) of each registered renderer. Empty, if the
+            renderers are called directly.
+        """
+        return [(r.GetRenderer(), r.GetStats()) for r in self._renderers
+                if isinstance(r, AsyncRenderer)]
 
     def GetGame(self):
         return self._game
@@ -47,42 +139,87 @@ class GameConsole():
         if self._game is not None:
             self._game.OnShutdown()
 
+        self._ClearInputs()
+
         self._gameInitialized = False
         self._game = game
         self._game.SetConsole(self)
 
         self._game.OnInit(self._game.GetSettings())
+        self._game.GetSettings().Compile()
         self._game.NextLevel()
         self._gameInitialized = True
 
     def StopGame(self):
+        self._ClearInputs()
+
         if self._game is not None:
             self._gameInitialized = False
             self._game.OnShutdown()
             self._game = None
 
-            actGrp = self._actQueue.CreateActGroup()
+            actGrp = self.CreateActGroup()
             actGrp.AddClearAct()
             actGrp.Ready()
 
             self.ProcessActGroup()
 
+    def GetInputBuffer(self):
+        """
+        Returns:
+            :class:`mtx.InputBuffer`: The input buffer of the console or None.
+        """
+        return self._inputBuffer
+
     def MovePlayer(self, number, direction):
         if self._game is not None:
-            self._game.OnPlayerMoveRequest(number, direction)
+            if self._inputBuffer is not None:
+                self._inputBuffer.Add(number, InputBuffer.MOVE, direction)
+            else:
+                self._game.OnPlayerMoveRequest(number, direction)
 
     def JumpPlayer(self, number, direction):
         if self._game is not None:
-            self._game.OnPlayerJumpRequest(number, direction)
+            if self._inputBuffer is not None:
+                self._inputBuffer.Add(number, InputBuffer.JUMP, direction)
+            else:
+                self._game.OnPlayerJumpRequest(number, direction)
+
+    def ProcessInputs(self):
+        """
+        Executes the next buffered inputs of the players (see :meth:`mtx.InputBuffer.Flush`). It
+        is called by :meth:`Idle`.
+        """
+        if self._inputBuffer is not None:
+            self._inputBuffer.Flush(self._ExecuteInput)
+
+    def _ClearInputs(self):
+        # Inputs given for a previous level or game must not be replayed in the new one.
+        if self._inputBuffer is not None:
+            self._inputBuffer.Clear()
+
+    def _ExecuteInput(self, number, action, direction):
+        if self._game is not None and self._gameInitialized:
+            if action == InputBuffer.JUMP:
+                self._game.OnPlayerJumpRequest(number, direction)
+            else:
+                self._game.OnPlayerMoveRequest(number, direction)
 
     def ResetLevel(self):
+        self._ClearInputs()
+
         if self._game is not None:
             level = self._game._level
+            modifiedCells = level.GetModifiedCells()
             level.Reset()
+            self._game._journal.Clear()
             self._game.OnLevelStart(level, True)
 
-            actGrp = self._actQueue.CreateActGroup()
-            actGrp.AddResetLevelAct(level)
+            # The game may already have changed the level again.
+            modifiedCells.update(level.GetModifiedCells())
+
+            actGrp = self.CreateActGroup()
+            actGrp.AddResetLevelAct(level, modifiedCells)
             actGrp.Ready()
 
             self.ProcessActGroup()
@@ -91,14 +228,48 @@ class GameConsole():
         if self._game is not None:
             self._game.OnUndo()
 
-    def Idle(self):
-        clock = time.clock()
-        deltaTime = clock - self._clock
+    def Redo(self):
+        if self._game is not None:
+            self._game.OnRedo()
+
+    def Idle(self, deltaTime=None):
+        """
+        Executes the submitted commands (see :meth:`Submit`) and the buffered inputs of the
+        players (see :meth:`ProcessInputs`) and calls :meth:`mtx.Game.OnIdle`.
+
+        Parameters:
+            deltaTime (:obj:`float`): The time in seconds that elapsed for the game, e.g. the
+                fixed interval of a :class:`mtx.GameLoop`. By default the time since the last
+                call is measured.
+        """
+        self.ProcessCommands()
+        self.ProcessInputs()
+
+        clock = time.perf_counter()
+        if deltaTime is None:
+            deltaTime = clock - self._clock
         self._clock = clock
 
         if self._game is not None and self._gameInitialized:
             self._game.OnIdle(deltaTime)
 
+    def RunLoop(self, tickRate=50, blocking=True):
+        """
+        Drives the console by its own :class:`mtx.GameLoop`.
+
+        Parameters:
+            tickRate (:obj:`float`): The number of calls of :meth:`Idle` per second.
+            blocking (:obj:`bool`): True, to run the loop in the calling thread until it is
+                stopped. False, to run it in a new daemon thread.
+
+        Returns:
+            :class:`mtx.GameLoop`: The loop, which can be stopped by :meth:`mtx.GameLoop.Stop`.
+        """
+        loop = GameLoop(tickRate)
+        loop.AddConsole(self)
+        loop.Run(blocking)
+        return loop
+
     def CreateActGroup(self):
         return self._actQueue.CreateActGroup()
 
@@ -109,18 +280,28 @@ class GameConsole():
         queue = self._actQueue if actGrp is None else [actGrp]
         renderers = self._renderers if renderer is None else [renderer]
 
-        for actGrp in queue[:]:
-            if actGrp.IsBusy():
-                break
+        while len(queue) > 0 and not queue[0].IsBusy():
+            actGrp = queue[0]
 
             if len(actGrp) > 0:
                 for renderer in renderers:
                     renderer.ProcessActGroup(actGrp)
 
-            queue.remove(actGrp)
+            del queue[0]
+
+    def _CreateSnapshotActGroup(self):
+        actGrp = ActGroup()
+        if self._game is not None and self._game._level is not None:
+            actGrp.AddLoadLevelAct(self._game._level)
+        else:
+            actGrp.AddClearAct()
+        actGrp.Ready()
+        return actGrp
 
     def OnNextLevel(self):
-        actGrp = self._actQueue.CreateActGroup()
+        self._ClearInputs()
+
+        actGrp = self.CreateActGroup()
         actGrp.AddLoadLevelAct(self._game._level)
         actGrp.Ready()
 
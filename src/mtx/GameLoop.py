@@ -0,0 +1,222 @@
+"""
+    mtxPython - A framework to create matrix games.
+    Copyright (C) 2016  Tobias Stampfl <info@matrixgames.rocks>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation in version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import collections
+import logging
+import time
+from threading import Lock, Thread
+
+
+class GameLoop():
+    """
+    Drives one or more :class:`game consoles<mtx.GameConsole>` with a fixed tick rate. Each tick
+    calls :meth:`mtx.GameConsole.Idle` of every console with the fixed tick interval as elapsed
+    time, so the games advance in equal steps regardless of the actual timing. The commands that
+    have been submitted to a console since the last tick (see :meth:`mtx.GameConsole.Submit`),
+    e.g. the moves of the players, are executed at the beginning of its tick.
+
+    The ticks are scheduled by :func:`time.perf_counter` on a fixed timeline, so the timing does
+    not drift. If the loop falls behind, e.g. because a tick took longer than the interval, the
+    missed ticks are caught up one after another, but at most `maxCatchUpTicks` at a time. Ticks
+    beyond that are skipped and the timeline is moved on.
+
+    Example:
+        .. code-block:: python
+
+            loop = mtx.GameLoop(tickRate=50)
+            for console in consoles:
+                loop.AddConsole(console)
+            loop.Run(blocking=False)
+            ...
+            print(loop.GetStats())
+            loop.Stop()
+    """
+
+    def __init__(self, tickRate=50, maxCatchUpTicks=5, statsSize=1000):
+        """
+        Parameters:
+            tickRate (:obj:`float`): The number of ticks per second.
+            maxCatchUpTicks (:obj:`int`): The maximum number of ticks that are performed one
+                after another to catch up with the timeline.
+            statsSize (:obj:`int`): The number of recent ticks whose durations are used for the
+                statistics.
+
+        Raises:
+            :obj:`ValueError`: If `tickRate` is not positive or `maxCatchUpTicks` is less than 1.
+        """
+        if tickRate <= 0:
+            raise ValueError("The tick rate must be positive.")
+
+        if maxCatchUpTicks < 1:
+            raise ValueError("At least one tick has to be performed to catch up.")
+
+        self._interval = 1.0 / tickRate
+        self._maxCatchUpTicks = maxCatchUpTicks
+        self._active = False
+        self._running = False
+
+        # The consoles are replaced as a whole, so the loop thread never sees a partial update.
+        # The lock serializes the updates and the start of the loop.
+        self._consoles = ()
+        self._lock = Lock()
+
+        self._durations = collections.deque(maxlen=statsSize)
+        self._tickCount = 0
+        self._overrunCount = 0
+        self._skippedCount = 0
+
+    def GetInterval(self):
+        """
+        Returns:
+            :obj:`float`: The time between two ticks in seconds.
+        """
+        return self._interval
+
+    def AddConsole(self, console):
+        """
+        Adds a game console to the loop. It can be called from any thread.
+
+        Parameters:
+            console (:class:`mtx.GameConsole`): The game console to be driven by the loop.
+        """
+        with self._lock:
+            self._consoles = self._consoles + (console,)
+
+    def RemoveConsole(self, console):
+        """
+        Removes a game console from the loop. It can be called from any thread.
+
+        Parameters:
+            console (:class:`mtx.GameConsole`): The game console to be removed.
+
+        Raises:
+            :obj:`ValueError`: If the console is not part of the loop.
+        """
+        with self._lock:
+            if console not in self._consoles:
+                raise ValueError("Game console `%s` is not part of the loop." % console)
+
+            self._consoles = tuple(c for c in self._consoles if c is not console)
+
+    def GetConsoles(self):
+        """
+        Returns:
+            :obj:`tuple`: The game consoles of the loop.
+        """
+        return self._consoles
+
+    def IsRunning(self):
+        """
+        Returns:
+            :obj:`bool`: True, if the loop is running. After :meth:`Stop` it stays True until the
+            current tick has finished.
+        """
+        return self._running
+
+    def Run(self, blocking=True):
+        """
+        Runs the loop until :meth:`Stop` is called.
+
+        Parameters:
+            blocking (:obj:`bool`): True, to run the loop in the calling thread. False, to run it
+                in a new daemon thread.
+
+        Raises:
+            :obj:`RuntimeError`: If the loop is already running (see :meth:`IsRunning`).
+        """
+        with self._lock:
+            if self._running:
+                raise RuntimeError("The game loop is already running.")
+            self._running = True
+            self._active = True
+
+        if not blocking:
+            loopThread = Thread(target=self._Loop)
+            loopThread.daemon = True
+            loopThread.start()
+            return
+
+        try:
+            self._Loop()
+        except KeyboardInterrupt:
+            self._active = False
+
+    def Stop(self):
+        """
+        Stops the loop after the current tick. It can be called from any thread.
+        """
+        self._active = False
+
+    def Tick(self):
+        """
+        Performs a single tick for all consoles.
+        """
+        for console in self._consoles:
+            try:
+                console.Idle(self._interval)
+            except Exception:
+                logging.error("Error in the tick of game console `%s`..." % console, exc_info=1)
+
+    def _Loop(self):
+        interval = self._interval
+        nextTick = time.perf_counter()
+
+        try:
+            while self._active:
+                now = time.perf_counter()
+                if now < nextTick:
+                    time.sleep(nextTick - now)
+                    continue
+
+                dueCount = int((now - nextTick) / interval) + 1
+                if dueCount > self._maxCatchUpTicks:
+                    skipped = dueCount - self._maxCatchUpTicks
+                    self._skippedCount += skipped
+                    nextTick += skipped * interval
+                    dueCount = self._maxCatchUpTicks
+
+                for _ in range(dueCount):
+                    if not self._active:
+                        break
+
+                    start = time.perf_counter()
+                    self.Tick()
+                    duration = time.perf_counter() - start
+
+                    self._durations.append(duration)
+                    self._tickCount += 1
+                    if duration > interval:
+                        self._overrunCount += 1
+                    nextTick += interval
+        finally:
+            self._running = False
+
+    def GetStats(self):
+        """
+        Returns:
+            :obj:`dict`: The number of `ticks` performed, the number of `overruns` (ticks that
+            took longer than the interval), the number of `skipped` ticks and the `p50`, `p99`
+            and `max` duration in seconds of the recent ticks.
+        """
+        durations = sorted(self._durations)
+        count = len(durations)
+        return {'ticks':    self._tickCount,
+                'overruns': self._overrunCount,
+                'skipped':  self._skippedCount,
+                'p50':      durations[count // 2] if count > 0 else 0.0,
+                'p99':      durations[min(count - 1, count * 99 // 100)] if count > 0 else 0.0,
+                'max':      durations[-1] if count > 0 else 0.0}
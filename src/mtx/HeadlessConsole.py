@@ -0,0 +1,81 @@
+"""
+    mtxPython - A framework to create matrix games.
+    Copyright (C) 2016  Tobias Stampfl <info@matrixgames.rocks>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation in version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from . import ActGroup, GameConsole, NullActGroup
+
+
+class HeadlessConsole(GameConsole):
+    """
+    Game console without renderers for simulations, e.g. bots, level validation or load tests.
+    The acts of the game are not queued and not sent anywhere. By default they are not even
+    created, optionally the acts of the last step are kept in a reused act group.
+
+    Time does not pass on its own, the game is advanced by :meth:`Step`.
+    """
+
+    def __init__(self, recordActs=False, inputBuffer=None):
+        """
+        Parameters:
+            recordActs (:obj:`bool`): True, to keep the acts of the last step (see
+                :meth:`GetLastActGroup`), False to drop all acts.
+            inputBuffer (:class:`mtx.InputBuffer`): If given, the moves and jumps of the players
+                are buffered and executed by :meth:`Step`.
+        """
+        GameConsole.__init__(self, inputBuffer=inputBuffer)
+        self._recordActs = recordActs
+        self._actGroup = ActGroup() if recordActs else NullActGroup()
+
+    def RegisterRenderer(self, renderer):
+        """
+        Raises:
+            :obj:`RuntimeError`: Always, a headless console can't have renderers.
+        """
+        raise RuntimeError("A headless console does not support renderers.")
+
+    def GetLastActGroup(self):
+        """
+        Returns:
+            :class:`mtx.ActGroup`: The acts of the last step. It is empty if the console does not
+            record acts. The act group is reused by the next step.
+        """
+        return self._actGroup
+
+    def Step(self, deltaTime):
+        """
+        Executes the submitted commands (see :meth:`mtx.GameConsole.Submit`) and the buffered
+        inputs and advances the game by calling :meth:`mtx.Game.OnIdle` with a fixed time.
+
+        Parameters:
+            deltaTime (:obj:`float`): The time in seconds that elapsed for the game.
+        """
+        self.ProcessCommands()
+        self.ProcessInputs()
+
+        if self._game is not None and self._gameInitialized:
+            self._game.OnIdle(deltaTime)
+
+    def CreateActGroup(self):
+        if self._recordActs:
+            del self._actGroup._acts[:]
+            self._actGroup._busy = True
+        return self._actGroup
+
+    def DiscardActGroup(self, actGrp):
+        pass
+
+    def ProcessActGroup(self, actGrp=None, renderer=None):
+        pass
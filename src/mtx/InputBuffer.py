@@ -0,0 +1,157 @@
+"""
+    mtxPython - A framework to create matrix games.
+    Copyright (C) 2016  Tobias Stampfl <info@matrixgames.rocks>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation in version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import collections
+
+
+class InputBuffer():
+    """
+    Input stage of a :class:`mtx.GameConsole` that keeps floods of player inputs, e.g. by key
+    repeat, from running the whole move pipeline for every single input. The move and jump
+    requests are collected in a bounded buffer per player and executed by the game thread when
+    the console idles (see :meth:`mtx.GameConsole.Idle`):
+
+    * Each player can have at most `bufferSize` pending inputs, further inputs are dropped.
+    * An input that would be the `maxRepeats` + 1-th equal input in a row at the end of the
+      buffer is merged into the previous ones, i.e. dropped as well. 0 disables the merging.
+    * At most `maxInputsPerTick` inputs of each player are executed per idle call, the remaining
+      inputs wait for the next one.
+
+    Example:
+        .. code-block:: python
+
+            console = mtx.GameConsole(inputBuffer=mtx.InputBuffer(bufferSize=4, maxRepeats=2))
+    """
+
+    MOVE = 0
+    JUMP = 1
+
+    def __init__(self, bufferSize=8, maxRepeats=0, maxInputsPerTick=1):
+        """
+        Parameters:
+            bufferSize (:obj:`int`): The maximum number of pending inputs per player.
+            maxRepeats (:obj:`int`): The maximum number of equal inputs in a row per player or
+                0 to keep all of them.
+            maxInputsPerTick (:obj:`int`): The maximum number of inputs per player that are
+                executed by one call of :meth:`Flush`.
+
+        Raises:
+            :obj:`ValueError`: If `bufferSize` or `maxInputsPerTick` is less than 1 or
+                `maxRepeats` is negative.
+        """
+        if bufferSize < 1 or maxInputsPerTick < 1:
+            raise ValueError("The buffer size and the inputs per tick must be at least 1.")
+
+        if maxRepeats < 0:
+            raise ValueError("The maximum number of repeats must not be negative.")
+
+        self._bufferSize = bufferSize
+        self._maxRepeats = maxRepeats
+        self._maxInputsPerTick = maxInputsPerTick
+        self._buffers = {}
+        self.ResetStats()
+
+    def Add(self, number, action, direction):
+        """
+        Buffers an input of a player.
+
+        Parameters:
+            number (:obj:`int`): The number of the player.
+            action (:obj:`int`): :attr:`MOVE` or :attr:`JUMP`.
+            direction (:obj:`int`): The direction of the input.
+
+        Returns:
+            :obj:`bool`: True, if the input has been buffered, False if it has been merged or
+            dropped.
+        """
+        self._received += 1
+
+        buffer = self._buffers.get(number)
+        if buffer is None:
+            buffer = self._buffers[number] = collections.deque()
+
+        playerInput = (action, direction)
+        repeats = self._maxRepeats
+        if repeats > 0 and len(buffer) >= repeats and\
+           all(buffer[-i] == playerInput for i in range(1, repeats + 1)):
+            self._merged += 1
+            return False
+
+        if len(buffer) >= self._bufferSize:
+            self._dropped += 1
+            return False
+
+        buffer.append(playerInput)
+        return True
+
+    def Flush(self, execute):
+        """
+        Executes the next inputs of each player.
+
+        Parameters:
+            execute (:obj:`callable`): Called with the player number, the action and the direction
+                of each input that is executed.
+        """
+        for number, buffer in list(self._buffers.items()):
+            # An input may clear the buffers, e.g. by finishing the level.
+            count = self._maxInputsPerTick
+            while count > 0 and len(buffer) > 0:
+                action, direction = buffer.popleft()
+                self._executed += 1
+                count -= 1
+                execute(number, action, direction)
+
+    def Clear(self):
+        """
+        Drops all pending inputs, e.g. when a level is reset or a new level or game is loaded.
+        """
+        for buffer in self._buffers.values():
+            self._dropped += len(buffer)
+            buffer.clear()
+
+    def GetPendingCount(self, number=None):
+        """
+        Parameters:
+            number (:obj:`int`): The number of a player or None for all players.
+
+        Returns:
+            :obj:`int`: The number of pending inputs.
+        """
+        if number is not None:
+            return len(self._buffers.get(number, ()))
+        return sum(len(buffer) for buffer in self._buffers.values())
+
+    def GetStats(self):
+        """
+        Returns:
+            :obj:`dict`: The number of `received`, `executed`, `merged` and `dropped` inputs
+            since the last reset of the statistics and the number of `pending` inputs.
+        """
+        return {'received': self._received,
+                'executed': self._executed,
+                'merged':   self._merged,
+                'dropped':  self._dropped,
+                'pending':  self.GetPendingCount()}
+
+    def ResetStats(self):
+        """
+        Resets the counters of the statistics.
+        """
+        self._received = 0
+        self._executed = 0
+        self._merged = 0
+        self._dropped = 0
@@ -0,0 +1,183 @@
+"""
+    mtxPython - A framework to create matrix games.
+    Copyright (C) 2016  Tobias Stampfl <info@matrixgames.rocks>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation in version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import collections
+
+
+class Journal():
+    """
+    Records the changes a game step (a move or a jump) makes to the cells of a
+    :class:`field<mtx.Field>`, so that the step can be undone and redone. Only the changed objects
+    are recorded, so the costs of an undo depend on the size of the step and not on the size of the
+    level. The number of steps kept is limited, the oldest steps are dropped first.
+    """
+
+    ADD    = 0x00
+    REMOVE = 0x01
+    CHANGE = 0x02
+
+    def __init__(self, depth):
+        """
+        Parameters:
+            depth (:obj:`int`): The maximum number of steps that can be undone. 0 disables the
+                journal.
+        """
+        self._depth = depth
+        self._undoSteps = collections.deque(maxlen=max(depth, 1))
+        self._redoSteps = []
+        self._field = None
+        self._ops = None
+
+    def IsEnabled(self):
+        """
+        Returns:
+            :obj:`bool`: True, if the journal records steps, False otherwise.
+        """
+        return self._depth > 0
+
+    def Clear(self):
+        """
+        Forgets all recorded steps.
+        """
+        self._undoSteps.clear()
+        self._redoSteps = []
+
+    def Begin(self, field):
+        """
+        Starts to record the changes of `field` as a new step.
+
+        Parameters:
+            field (:class:`mtx.Field`): The field of the current level.
+        """
+        if self._depth > 0:
+            self._field = field
+            self._ops = []
+            field._journal = self
+
+    def End(self, acts):
+        """
+        Finishes the current step. A step that has changed the field can be undone afterwards and
+        the steps that have been undone can no longer be redone.
+
+        Parameters:
+            acts (:obj:`iterable`): The acts that have been sent to the renderers for the step.
+        """
+        if self._field is None:
+            return
+
+        ops = self._ops
+        self.Cancel()
+
+        if len(ops) > 0:
+            self._undoSteps.append((ops, list(acts)))
+            self._redoSteps = []
+
+    def Cancel(self):
+        """
+        Stops recording without storing the current step.
+        """
+        if self._field is not None:
+            self._field._journal = None
+            self._field = None
+            self._ops = None
+
+    def ObjectAdded(self, cell, obj):
+        self._ops.append((self.ADD, cell, obj))
+
+    def ObjectRemoved(self, cell, obj, index):
+        self._ops.append((self.REMOVE, cell, obj, index))
+
+    def ObjectChanged(self, obj, oldSymbol):
+        # The state of the object is expected to be changed after its symbol.
+        self._ops.append([self.CHANGE, obj, oldSymbol, obj.GetState()])
+
+    def GetUndoCount(self):
+        """
+        Returns:
+            :obj:`int`: The number of steps that can be undone.
+        """
+        return len(self._undoSteps)
+
+    def GetRedoCount(self):
+        """
+        Returns:
+            :obj:`int`: The number of steps that can be redone.
+        """
+        return len(self._redoSteps)
+
+    def Undo(self):
+        """
+        Reverts the changes of the last step.
+
+        Returns:
+            :obj:`list` or :obj:`None`: The acts of the step that has been undone or None, if there
+            is no step to undo.
+        """
+        if len(self._undoSteps) == 0:
+            return None
+
+        step = self._undoSteps.pop()
+        ops, acts = step
+        for op in reversed(ops):
+            if op[0] == self.ADD:
+                op[1].Remove(op[2])
+            elif op[0] == self.REMOVE:
+                op[1].Insert(op[3], op[2])
+            else:
+                self._SwapState(op)
+
+        self._redoSteps.append(step)
+        return acts
+
+    def Redo(self):
+        """
+        Applies the changes of the last step that has been undone again.
+
+        Returns:
+            :obj:`list` or :obj:`None`: The acts of the step that has been redone or None, if there
+            is no step to redo.
+        """
+        if len(self._redoSteps) == 0:
+            return None
+
+        step = self._redoSteps.pop()
+        ops, acts = step
+        for op in ops:
+            if op[0] == self.ADD:
+                op[1].Add(op[2])
+            elif op[0] == self.REMOVE:
+                op[1].Remove(op[2])
+            else:
+                self._SwapState(op)
+
+        self._undoSteps.append(step)
+        return acts
+
+    @staticmethod
+    def _SwapState(op):
+        # Restores the stored symbol and state of the object and keeps the current ones, so the
+        # same operation can be used in both directions.
+        obj, symbol, state = op[1], op[2], op[3]
+        op[2] = obj._symbol
+        op[3] = obj.GetState()
+
+        if obj._symbol != symbol:
+            obj.SetSymbol(symbol)
+        if state is not None:
+            obj.SetState(state)
+            if obj.DYNAMIC_TRAITS:
+                obj.TraitsChanged()
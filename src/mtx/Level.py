@@ -15,11 +15,24 @@
     along with this program. If not, see <http://www.gnu.org/licenses/>.
 """
 
-from . import (Constants, Field, GetRegisteredObjectClass, IsMultiObjectSymbol,
-               GetRegisteredMultiObjectSymbols)
-from .objects import Player
+import collections
+import struct
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from . import (Constants, Field, CompactField, GetRegisteredObjectClass, IsMultiObjectSymbol,
+               GetRegisteredMultiObjectSymbols, TRAIT)
+from .objects import Player, Target
 from .Utils import count
 
+_STATE_KEY = struct.Struct('<Q')
+
+# The (dx, dy) offsets for each direction, indexed by the direction constants.
+_OFFSETS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
 
 class Level():
     """
@@ -30,7 +43,8 @@ class Level():
 
     def __init__(self, width, height, name=None, number=None,
                  groundTexture=Constants.TEXTURE.GROUND.NONE,
-                 wallTexture=Constants.TEXTURE.WALL.WHITE_BRICKS):
+                 wallTexture=Constants.TEXTURE.WALL.WHITE_BRICKS, compact=False,
+                 flyweight=False):
         """
         Parameters:
             width (:obj:`int`): The width of the level.
@@ -40,10 +54,23 @@ class Level():
                 for the ground of the level.
             wallTecture (:class:`mtx.TEXTURE.GROUND<mtx.Constants.TEXTURE.GROUND>`): The texture
                 for a wall in the level.
+            compact (:obj:`bool`): True, to use a :class:`mtx.CompactField` instead of a
+                :class:`mtx.Field`. Recommended for very large levels.
+            flyweight (:obj:`bool`): True, to represent all objects of a
+                :attr:`flyweight class<mtx.BaseObject.FLYWEIGHT>` with the same symbol (e.g.
+                walls) by one shared object, which is stored in the flyweight layer of the
+                :class:`mtx.CompactField`. It has one id for all its cells and can't be removed.
+                Requires `compact`.
+
+        Raises:
+            :obj:`ValueError`: If `flyweight` is used without `compact`.
         """
+        if flyweight and not compact:
+            raise ValueError("Flyweight objects require a compact field.")
+
         self._game = None
         self._number = number
-        self._field = Field(self, width, height)
+        self._field = (CompactField if compact else Field)(self, width, height)
         self._name = name
         self._groundTexture = groundTexture
         self._wallTexture = wallTexture
@@ -52,10 +79,15 @@ class Level():
         self._objects = {}
         self._objCount = {}
         self._resetDataList = []
+        self._snapshot = None
+        self._deadSquares = None
+        self._spareBoxes = None
+        self._flyweight = flyweight
+        self._flyweights = {}
         self._newId = count()
 
     @staticmethod
-    def Create(defDict, number=None):
+    def Create(defDict, number=None, compact=False, flyweight=False):
         """
         This method creates a new level on the basis of a level definition in the form of a
         directory. It defines all the information for the level such as the name, the textures and
@@ -71,6 +103,9 @@ class Level():
 
         Parameters:
             defDict (:obj:`dict`): A dictionary with the level definition.
+            number (:obj:`int`): The number of the level.
+            compact (:obj:`bool`): True, to use a :class:`mtx.CompactField` for the level.
+            flyweight (:obj:`bool`): True, to share flyweight objects (see :class:`mtx.Level`).
 
         Returns:
             :class:`mtx.Level`: The level object for the given definition.
@@ -92,7 +127,8 @@ class Level():
         width  = len(plan[0])
         height = len(plan)
 
-        level = Level(width, height, name, number, groundTexture, wallTexture)
+        level = Level(width, height, name, number, groundTexture, wallTexture, compact,
+                      flyweight)
 
         for y, row in enumerate(plan):
             for x, symbol in enumerate(row):
@@ -175,10 +211,56 @@ class Level():
         """
         return self._players.get(number)
 
+    def IsReachable(self, number, x, y):
+        """
+        Checks whether a player can walk to a cell without pushing anything. The reachable cells
+        of each player are indexed when they are queried for the first time and kept up to date
+        afterwards, only the region of the field affected by a change is searched again. So
+        the query takes constant time.
+
+        Parameters:
+            number (:obj:`int`): The number of the player.
+            x (:obj:`int`): `X` coordinate of the cell position.
+            y (:obj:`int`): `Y` coordinate of the cell position.
+
+        Returns:
+            :obj:`bool`: True, if the cell is reachable, False if not or if the player does not
+            exist.
+        """
+        player = self._players.get(number)
+        cell = self._field.GetCell(x, y)
+        if player is None or cell is None:
+            return False
+        return self._field._GetPathFinder().IsReachable(player, cell)
+
+    def GetReachableCells(self, number):
+        """
+        Parameters:
+            number (:obj:`int`): The number of the player.
+
+        Returns:
+            :obj:`list`: The (x, y) positions of all cells the player can walk to without pushing
+            anything (see :meth:`IsReachable`), including the cell of the player. Empty, if the
+            player does not exist.
+        """
+        player = self._players.get(number)
+        if player is None:
+            return []
+        return self._field._GetPathFinder().GetReachableCells(player)
+
     def GetObject(self, id):
         return self._objects[id]
 
     def GetObjects(self, symbol):
+        """
+        Parameters:
+            symbol (:obj:`str`): One or more symbols.
+
+        Returns:
+            :obj:`list`: All objects with one of the symbols that have been added to the level,
+            including the ones that have been collected or removed in the meantime (see
+            :meth:`GetLiveObjects`).
+        """
         objects = []
         for s in symbol:
             objects.extend(self._symbols.get(s, []))
@@ -194,13 +276,348 @@ class Level():
         """
         return self._objCount.get(symbol, 0)
 
+    def GetStateHash(self):
+        """
+        Returns:
+            :obj:`int`: The 64 bit Zobrist hash of the current state of the level (see
+            :meth:`mtx.Field.GetStateHash`). It can be used to detect repeated states, e.g.
+            in a transposition table.
+        """
+        return self._field.GetStateHash()
+
+    def GetStateKey(self):
+        """
+        Returns:
+            :obj:`bytes`: The state hash (see :meth:`GetStateHash`) packed into 8 bytes, e.g.
+            to send it to another process or to store it in a compact table.
+        """
+        return _STATE_KEY.pack(self._field.GetStateHash())
+
+    def GetRemainingCount(self, symbol):
+        """
+        Returns the number of objects that are currently on the field. Unlike
+        :meth:`GetObjectCount`, collected and removed objects are not counted, so e.g. a game is
+        won when no dot is remaining.
+
+        The objects on the field are indexed by their symbol, when this method,
+        :meth:`GetLiveObjects` or :meth:`GetLivePositionBits` is called for the first time.
+        Afterwards the index is kept up to date whenever an object is added to or removed from a
+        cell, so the query takes constant time.
+
+        Parameters:
+            symbol (:obj:`str`): One or more symbols.
+
+        Returns:
+            :obj:`int`: The number of objects on the field with one of the symbols. A shared
+            flyweight object (see :class:`mtx.Level`) is counted once for each of its cells.
+        """
+        return self._field._GetSymbolIndex().GetCount(symbol)
+
+    def GetLiveObjects(self, symbol):
+        """
+        Parameters:
+            symbol (:obj:`str`): One or more symbols.
+
+        Returns:
+            :obj:`list`: The objects with one of the symbols that are currently on the field
+            (see :meth:`GetRemainingCount`). A shared flyweight object is only listed once.
+        """
+        return self._field._GetSymbolIndex().GetObjects(symbol)
+
+    def GetLivePositionBits(self, symbol):
+        """
+        Returns the positions of the objects on the field as a bitset. Bitsets of different
+        symbols can be combined, e.g. to check whether all targets are covered by boxes:
+
+        .. code-block:: python
+
+            targets = level.GetLivePositionBits('t')
+            covered = targets & level.GetLivePositionBits('b') == targets
+
+        Parameters:
+            symbol (:obj:`str`): One or more symbols.
+
+        Returns:
+            :obj:`int`: A bitset with the bit `y * width + x` set for each cell with an object
+            with one of the symbols (see :meth:`mtx.SymbolIndex.GetPositionBits`).
+        """
+        return self._field._GetSymbolIndex().GetPositionBits(symbol)
+
+    def TakeSnapshot(self):
+        """
+        Stores the current state of the level, which will be restored by :meth:`Reset`. The game
+        takes a snapshot after :meth:`mtx.Game.OnLevelStart` has been called for a new level.
+
+        The snapshot holds the objects of every cell together with their symbols and the state
+        of each object (see :meth:`mtx.BaseObject.GetState`).
+        """
+        cells = {}
+        field = self._field
+        for cell in field:
+            objects = tuple((obj, obj._symbol) for obj in reversed(cell)
+                            if not field._IsFlyweight(obj))
+            if len(objects) > 0:
+                cells[(cell._x, cell._y)] = objects
+
+        states = []
+        for obj in self._objects.values():
+            state = obj.GetState()
+            if state is not None:
+                states.append((obj, state))
+
+        self._snapshot = (cells, tuple(states), len(self._resetDataList), dict(self._objCount))
+        self._field._touchedCells.clear()
+
     def Reset(self):
         """
-        Resets the level to the initial state.
+        Resets the level to the state of the last snapshot (see :meth:`TakeSnapshot`). Only the
+        cells that have changed since then are restored, the cells and objects are reused.
+        Without a snapshot, the field is rebuilt from the initial cells and symbols of the
+        objects. Their states (see :meth:`mtx.BaseObject.GetState`) are not restored, because
+        only a snapshot stores them.
         """
-        self._field.Clear()
-        for (x, y), obj in self._resetDataList:
-            self._field.GetCell(x, y).Add(obj)
+        if self._snapshot is None:
+            self._field.Clear()
+            for (x, y), obj, symbol in self._resetDataList:
+                # The object is not on a cell at the moment, so the symbol can be set directly.
+                obj._symbol = symbol
+                self._field.GetCell(x, y).Add(obj)
+            self._field._touchedCells.clear()
+            return
+
+        cells, states, objectCount, objCount = self._snapshot
+        field = self._field
+
+        # Forget the objects that have been added after the snapshot.
+        for position, obj, symbol in self._resetDataList[objectCount:]:
+            if obj._cell is not None:
+                obj._cell.Remove(obj)
+            del self._objects[obj._id]
+            self._symbols[symbol] = [o for o in self._symbols[symbol] if o is not obj]
+            if isinstance(obj, Player) and self._players.get(obj.GetNumber()) is obj:
+                del self._players[obj.GetNumber()]
+        del self._resetDataList[objectCount:]
+        self._objCount = dict(objCount)
+
+        # Flyweight objects never change, so they stay on their cells.
+        positions = set((cell._x, cell._y) for cell in field._touchedCells)
+        for x, y in positions:
+            cell = field.GetCell(x, y)
+            for obj in list(cell):
+                if not field._IsFlyweight(obj):
+                    cell.Remove(obj)
+
+        for x, y in positions:
+            cell = field.GetCell(x, y)
+            for obj, symbol in cells.get((x, y), ()):
+                # The object is not on a cell at the moment, so the symbol can be set directly.
+                obj._symbol = symbol
+                cell.Add(obj)
+
+        for obj, state in states:
+            obj.SetState(state)
+            if obj.DYNAMIC_TRAITS:
+                obj.TraitsChanged()
+
+        field._touchedCells.clear()
+
+    def GetModifiedCells(self):
+        """
+        Returns the positions of all cells whose objects differ from the state that :meth:`Reset`
+        restores. With a snapshot only the cells that have changed since the snapshot are checked,
+        otherwise all objects that have been moved, removed or have changed their symbol. In both
+        cases the costs do not depend on the size of the field.
+
+        Returns:
+            :obj:`set`: The (x, y) positions of the modified cells.
+        """
+        positions = set()
+
+        if self._snapshot is not None:
+            cells = self._snapshot[0]
+            field = self._field
+            for cell in field._touchedCells:
+                position = (cell._x, cell._y)
+                objects = cells.get(position, ())
+                current = [obj for obj in reversed(cell) if not field._IsFlyweight(obj)]
+                if len(current) != len(objects) or\
+                   any(obj is not o or obj._symbol != symbol
+                       for obj, (o, symbol) in zip(current, objects)):
+                    positions.add(position)
+            return positions
+
+        for position, obj, symbol in self._resetDataList:
+            cell = obj._cell
+            if cell is None:
+                positions.add(position)
+            elif cell._x != position[0] or cell._y != position[1] or obj._symbol != symbol:
+                positions.add(position)
+                positions.add((cell._x, cell._y))
+        return positions
+
+    def _CalculateDeadSquares(self):
+        # Walls are cells with solid objects, which never move. The boxes are pulled backwards
+        # from the targets, a box can be pulled onto a cell, if the cell behind it is not a wall.
+        width, height = self._field.GetSize()
+        walls = bytearray(width * height)
+        targets = []
+        for cell in self._field:
+            index = cell._y * width + cell._x
+            if cell.GetTraits() & TRAIT.SOLID:
+                walls[index] = 1
+            elif any(isinstance(obj, Target) for obj in cell):
+                targets.append(index)
+
+        # Without targets a box can't be in the wrong place.
+        if len(targets) == 0:
+            return bytearray(width * height)
+
+        def Floor(x, y):
+            return 0 <= x < width and 0 <= y < height and not walls[y * width + x]
+
+        reached = bytearray(width * height)
+        queue = collections.deque()
+        for index in targets:
+            reached[index] = 1
+            queue.append(index)
+
+        while queue:
+            index = queue.popleft()
+            x, y = index % width, index // width
+            for dx, dy in _OFFSETS:
+                if Floor(x + dx, y + dy) and Floor(x + 2 * dx, y + 2 * dy):
+                    prev = (y + dy) * width + x + dx
+                    if not reached[prev]:
+                        reached[prev] = 1
+                        queue.append(prev)
+
+        return bytearray(1 if not reached[i] and not walls[i] else 0
+                         for i in range(width * height))
+
+    def _GetDeadSquares(self):
+        if self._deadSquares is None:
+            self._deadSquares = self._CalculateDeadSquares()
+        return self._deadSquares
+
+    def IsDeadSquare(self, x, y):
+        """
+        Checks whether a :class:`movable object<mtx.baseObjects.MovableObject>` on the given
+        cell can never be pushed onto a :class:`target<mtx.objects.Target>`, because the walls
+        are in the way. If the level has no targets, there are no dead squares.
+
+        The dead squares only depend on the solid objects of the level. They are calculated on
+        the first call and kept when the level is reset.
+
+        Parameters:
+            x (:obj:`int`): `X` coordinate of the cell position.
+            y (:obj:`int`): `Y` coordinate of the cell position.
+
+        Returns:
+            :obj:`bool`: True, if the cell is a dead square.
+        """
+        return self._GetDeadSquares()[y * self._field._width + x] == 1
+
+    def GetDeadSquareMap(self):
+        """
+        Returns the dead squares (see :meth:`IsDeadSquare`) of the whole level.
+
+        **Requires NumPy.**
+
+        Returns:
+            :obj:`numpy.ndarray`: A boolean array with the shape (height, width), which is True
+            for each dead square.
+
+        Raises:
+            :obj:`RuntimeError`: If NumPy is not available.
+        """
+        if numpy is None:
+            raise RuntimeError("mtx.Level.GetDeadSquareMap requires NumPy.")
+
+        width, height = self._field.GetSize()
+        return numpy.frombuffer(bytes(self._GetDeadSquares()), numpy.uint8)\
+                    .reshape(height, width).astype(numpy.bool_)
+
+    def _HasSpareBoxes(self):
+        # If there are more movable objects than targets, some of them may stay anywhere.
+        if self._spareBoxes is None:
+            boxCount = 0
+            targetCount = 0
+            for cell in self._field:
+                for obj in cell:
+                    if isinstance(obj, Target):
+                        targetCount += 1
+                    elif obj.GetTraits() & (TRAIT.MOVABLE | TRAIT.UNPUSHABLE) == TRAIT.MOVABLE:
+                        boxCount += 1
+            self._spareBoxes = boxCount > targetCount
+        return self._spareBoxes
+
+    def IsFrozen(self, obj):
+        """
+        Checks whether a :class:`movable object<mtx.baseObjects.MovableObject>` can never be
+        moved again, because it is blocked horizontally and vertically. An axis is blocked by a
+        wall, by dead squares on both sides (see :meth:`IsDeadSquare`) or by another frozen
+        movable object.
+
+        Parameters:
+            obj (:class:`mtx.BaseObject`): The movable object.
+
+        Returns:
+            :obj:`bool`: True, if the object is frozen and it or one of the objects that block
+            it is not on a :class:`target<mtx.objects.Target>`.
+        """
+        cell = obj.GetCell()
+        if cell is None:
+            return False
+
+        frozen = []
+        if not self._IsFrozen(cell, frozen):
+            return False
+        return not all(any(isinstance(o, Target) for o in c) for c in frozen)
+
+    def _IsFrozen(self, cell, frozen):
+        # Cells that are already being checked are treated like walls. If the object turns out
+        # not to be frozen, the cells checked on its behalf are forgotten again.
+        mark = len(frozen)
+        frozen.append(cell)
+        dead = self._GetDeadSquares()
+        width = self._field._width
+        for first, second in ((Constants.LEFT, Constants.RIGHT), (Constants.UP, Constants.DOWN)):
+            a = cell.GetNeighbour(first)
+            b = cell.GetNeighbour(second)
+            if a is None or b is None or a in frozen or b in frozen or\
+               a.GetTraits() & TRAIT.SOLID or b.GetTraits() & TRAIT.SOLID:
+                continue
+            if dead[a._y * width + a._x] and dead[b._y * width + b._x]:
+                continue
+            if self._IsBox(a) and self._IsFrozen(a, frozen):
+                continue
+            if self._IsBox(b) and self._IsFrozen(b, frozen):
+                continue
+            del frozen[mark:]
+            return False
+        return True
+
+    @staticmethod
+    def _IsBox(cell):
+        return any(obj.GetTraits() & (TRAIT.MOVABLE | TRAIT.UNPUSHABLE) == TRAIT.MOVABLE
+                   for obj in cell)
+
+    def IsDeadlocked(self, obj):
+        """
+        Parameters:
+            obj (:class:`mtx.BaseObject`): A movable object.
+
+        Returns:
+            :obj:`bool`: True, if the object is on a dead square (see :meth:`IsDeadSquare`) or
+            frozen apart from a target (see :meth:`IsFrozen`). Always False, if the level has
+            more movable objects than :class:`targets<mtx.objects.Target>`, because then not
+            every object has to reach a target. The objects and targets are counted on the first
+            call.
+        """
+        cell = obj.GetCell()
+        if cell is None or self._HasSpareBoxes():
+            return False
+        return self.IsDeadSquare(cell._x, cell._y) or self.IsFrozen(obj)
 
     def Add(self, x, y, symbol):
         """
@@ -227,6 +644,10 @@ class Level():
             self._objCount[symbol] = self._objCount.get(symbol, 0) + 1
 
             objCls = GetRegisteredObjectClass(symbol)
+            if self._flyweight and objCls.FLYWEIGHT:
+                self._AddFlyweight(x, y, symbol, objCls)
+                return
+
             obj = objCls(next(self._newId), symbol)
             if isinstance(obj, Player):
                 self._players[obj.GetNumber()] = obj
@@ -234,9 +655,18 @@ class Level():
             self._symbols.setdefault(symbol, []).append(obj)
             self._objects[obj.GetId()] = obj
 
-            self._resetDataList.append(((x, y), obj))
+            self._resetDataList.append(((x, y), obj, symbol))
             self._field.GetCell(x, y).Add(obj)
 
+    def _AddFlyweight(self, x, y, symbol, objCls):
+        obj = self._flyweights.get(symbol)
+        if obj is None:
+            obj = self._flyweights[symbol] = objCls(next(self._newId), symbol)
+            self._symbols.setdefault(symbol, []).append(obj)
+            self._objects[obj.GetId()] = obj
+
+        self._field.AddFlyweight(x, y, obj)
+
     def GetCell(self, x, y):
         """
         Parameters:
@@ -0,0 +1,194 @@
+"""
+    mtxPython - A framework to create matrix games.
+    Copyright (C) 2016  Tobias Stampfl <info@matrixgames.rocks>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation in version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import mmap
+import struct
+
+from . import Constants
+
+# Binary file format of a level pack.
+#
+# All values are little endian. The file starts with a header of the magic bytes 'MTXL', the
+# version (unsigned short) and the number of levels (unsigned int), followed by an index with the
+# offset (unsigned int) and the length (unsigned int) of each level record. So any level can be
+# found without reading the others.
+#
+# A level record starts with the width and the height of the plan (unsigned shorts), the ground
+# and the wall texture (ints) and the length of the name (unsigned short), followed by the name
+# encoded as UTF-8 and the rows of the plan. Each symbol is stored as one byte (Latin-1) and rows
+# that are shorter than the first row are padded with spaces.
+
+_HEADER = struct.Struct('<4sHI')
+_INDEX_ENTRY = struct.Struct('<II')
+_LEVEL = struct.Struct('<HHiiH')
+
+_MAGIC = b'MTXL'
+_VERSION = 1
+
+
+class LevelPack():
+    """
+    Read only access to the level definitions (see :meth:`mtx.Level.Create`) stored in a level
+    pack file, which is created by :meth:`Write`. The file is memory mapped and a definition is
+    only decoded when it is requested by :meth:`Get`, so games with thousands of levels neither
+    have to keep them in memory nor parse the levels that are never played.
+
+    The levels are numbered from 1, like the numbers passed to :meth:`mtx.Game.GetNextLevel`.
+    A game can play the levels of a pack by calling :meth:`mtx.Game.SetLevelPack`.
+
+    Example:
+        .. code-block:: python
+
+            mtx.LevelPack.Write('levels.mtxl', [{'name': 'Level 1',
+                                                 'plan': ['#####',
+                                                          '#1bt#',
+                                                          '#####']}])
+
+            with mtx.LevelPack('levels.mtxl') as pack:
+                level = mtx.Level.Create(pack.Get(1), 1)
+    """
+
+    def __init__(self, path):
+        """
+        Parameters:
+            path (:obj:`str`): The path of the level pack file.
+
+        Raises:
+            :obj:`ValueError`: If the file is not a level pack or has an unsupported version.
+        """
+        self._path = path
+        self._data = None
+        with open(path, 'rb') as packFile:
+            # An empty file can't be mapped.
+            if packFile.seek(0, 2) < _HEADER.size:
+                raise ValueError("'%s' is not a level pack." % path)
+            self._data = mmap.mmap(packFile.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self._count = _HEADER.unpack_from(self._data, 0)
+        if magic != _MAGIC:
+            self.Close()
+            raise ValueError("'%s' is not a level pack." % path)
+        if version != _VERSION:
+            self.Close()
+            raise ValueError("Level pack '%s' has the unsupported version %d." % (path, version))
+
+    def __repr__(self):
+        return 'mtx.LevelPack(%r)' % self._path
+
+    def __len__(self):
+        return self._count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.Close()
+
+    def Close(self):
+        """
+        Closes the memory mapped file.
+        """
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+
+    def GetLevelCount(self):
+        """
+        Returns:
+            :obj:`int`: The number of levels in the pack.
+        """
+        return self._count
+
+    def Get(self, number):
+        """
+        Decodes a level definition from the pack.
+
+        Parameters:
+            number (:obj:`int`): The number of the level (starting at 1).
+
+        Returns:
+            :obj:`dict`: The level definition with the keys 'name', 'ground', 'wall' and 'plan'.
+
+        Raises:
+            :obj:`LookupError`: If there is no level with the given number.
+            :obj:`RuntimeError`: If the pack has been closed.
+        """
+        if self._data is None:
+            raise RuntimeError("Level pack '%s' has been closed." % self._path)
+
+        if number < 1 or number > self._count:
+            raise LookupError("Level pack '%s' has no level %d." % (self._path, number))
+
+        data = self._data
+        offset, length = _INDEX_ENTRY.unpack_from(data, _HEADER.size +
+                                                  (number - 1) * _INDEX_ENTRY.size)
+
+        width, height, ground, wall, nameLength = _LEVEL.unpack_from(data, offset)
+        offset += _LEVEL.size
+        name = data[offset:offset + nameLength].decode('utf-8')
+        offset += nameLength
+
+        plan = data[offset:offset + width * height].decode('latin-1')
+        return {'name':   name,
+                'ground': ground,
+                'wall':   wall,
+                'plan':   [plan[y * width:(y + 1) * width] for y in range(height)]}
+
+    @staticmethod
+    def Write(path, defDicts):
+        """
+        Writes level definitions into a new level pack file.
+
+        Parameters:
+            path (:obj:`str`): The path of the level pack file. An existing file is replaced.
+            defDicts (:obj:`iterable`): The level definitions (see :meth:`mtx.Level.Create`) in
+                the order of their level numbers.
+
+        Raises:
+            :obj:`ValueError`: If a row of a plan is longer than the first row or a symbol can't
+                be stored in one byte.
+        """
+        records = []
+        for defDict in defDicts:
+            plan = defDict.get('plan')
+            width = len(plan[0])
+            for y, row in enumerate(plan):
+                if len(row) > width:
+                    raise ValueError("Row %d of the plan is longer than the first row." % y)
+
+            try:
+                planData = ''.join(row.ljust(width) for row in plan).encode('latin-1')
+            except UnicodeEncodeError:
+                raise ValueError("The plan contains a symbol that can't be stored in a level pack.")
+
+            name = defDict.get('name', '').encode('utf-8')
+            records.append(_LEVEL.pack(width, len(plan),
+                                       defDict.get('ground', Constants.TEXTURE.GROUND.NONE),
+                                       defDict.get('wall', Constants.TEXTURE.WALL.WHITE_BRICKS),
+                                       len(name)) + name + planData)
+
+        data = bytearray(_HEADER.pack(_MAGIC, _VERSION, len(records)))
+        offset = _HEADER.size + len(records) * _INDEX_ENTRY.size
+        for record in records:
+            data += _INDEX_ENTRY.pack(offset, len(record))
+            offset += len(record)
+
+        for record in records:
+            data += record
+
+        with open(path, 'wb') as packFile:
+            packFile.write(data)
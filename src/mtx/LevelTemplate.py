@@ -0,0 +1,168 @@
+"""
+    mtxPython - A framework to create matrix games.
+    Copyright (C) 2016  Tobias Stampfl <info@matrixgames.rocks>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation in version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from . import (Constants, GetRegisteredObjectClass, GetRegisteredMultiObjectSymbols,
+               GetSymbolBit, GetSymbolTraits, IsMultiObjectSymbol, Level, TRAIT)
+from .objects import Player
+
+
+class LevelTemplate():
+    """
+    A level definition (see :meth:`mtx.Level.Create`) that has been compiled once into a flat
+    list of instructions, one for each cell with objects. The symbols are resolved to their
+    object classes, multi object symbols are expanded and the object counters, symbol bitsets and
+    traits of the cells are calculated during the compilation. So :meth:`Instantiate` only has to
+    create the objects and fill the cells of the new field in bulk.
+
+    It is used by :meth:`mtx.Game.CreateLevel` to create the same level again and again.
+
+    Example:
+        .. code-block:: python
+
+            template = mtx.LevelTemplate.Compile({'plan': ['#####',
+                                                           '#1bt#',
+                                                           '#####']})
+            level = template.Instantiate()
+    """
+
+    def __init__(self, width, height, name, groundTexture, wallTexture, instructions, objCount):
+        self._width = width
+        self._height = height
+        self._name = name
+        self._groundTexture = groundTexture
+        self._wallTexture = wallTexture
+        self._instructions = instructions
+        self._objCount = objCount
+
+    @staticmethod
+    def Compile(defDict):
+        """
+        Parameters:
+            defDict (:obj:`dict`): A dictionary with the level definition (see
+                :meth:`mtx.Level.Create`).
+
+        Returns:
+            :class:`mtx.LevelTemplate`: The compiled level definition.
+
+        Raises:
+            :obj:`ValueError`: If a row of the plan is longer than the first row.
+            :obj:`RuntimeError`: If no object class is registered for a symbol of the plan.
+        """
+        plan = defDict.get('plan')
+        width = len(plan[0])
+        height = len(plan)
+
+        instructions = []
+        objCount = {}
+
+        def AddSymbol(entries, symbol):
+            # Multi object symbols are counted too, but only their objects are created.
+            objCount[symbol] = objCount.get(symbol, 0) + 1
+            if IsMultiObjectSymbol(symbol):
+                for sym in GetRegisteredMultiObjectSymbols(symbol):
+                    AddSymbol(entries, sym)
+            else:
+                objCls = GetRegisteredObjectClass(symbol)
+                entries.append((symbol, objCls, issubclass(objCls, Player)))
+
+        for y, row in enumerate(plan):
+            if len(row) > width:
+                raise ValueError("Row %d of the plan is longer than the first row." % y)
+
+            for x, symbol in enumerate(row):
+                # A space as symbol will be ignored, because it is not representing an object.
+                if symbol == ' ':
+                    continue
+
+                entries = []
+                AddSymbol(entries, symbol)
+
+                cellCount = {}
+                symbolMask = 0
+                traits = TRAIT.NONE
+                for sym, objCls, isPlayer in entries:
+                    cellCount[sym] = cellCount.get(sym, 0) + 1
+                    symbolMask |= GetSymbolBit(sym)
+                    # The traits of objects with dynamic traits are only known after creation.
+                    symbolTraits = GetSymbolTraits(sym)
+                    traits = None if traits is None or symbolTraits is None else\
+                             traits | symbolTraits
+
+                instructions.append((x, y, tuple(entries), cellCount, symbolMask, traits))
+
+        return LevelTemplate(width, height, defDict.get('name', ''),
+                             defDict.get('ground', Constants.TEXTURE.GROUND.NONE),
+                             defDict.get('wall', Constants.TEXTURE.WALL.WHITE_BRICKS),
+                             tuple(instructions), objCount)
+
+    def GetSize(self):
+        """
+        Returns:
+            :obj:`tuple`: The (width, height) of the level.
+        """
+        return (self._width, self._height)
+
+    def Instantiate(self, number=None, compact=False, flyweight=False):
+        """
+        Creates a new level from the template. The level is the same as the one created by
+        :meth:`mtx.Level.Create` for the definition of the template.
+
+        Parameters:
+            number (:obj:`int`): The number of the level.
+            compact (:obj:`bool`): True, to use a :class:`mtx.CompactField` for the level.
+            flyweight (:obj:`bool`): True, to share flyweight objects (see :class:`mtx.Level`).
+
+        Returns:
+            :class:`mtx.Level`: The new level.
+        """
+        level = Level(self._width, self._height, self._name, number, self._groundTexture,
+                      self._wallTexture, compact, flyweight)
+
+        newId = level._newId
+        players = level._players
+        symbols = level._symbols
+        objects = level._objects
+        resetDataList = level._resetDataList
+
+        contents = []
+        for x, y, entries, cellCount, symbolMask, traits in self._instructions:
+            position = (x, y)
+            cellObjects = []
+            for symbol, objCls, isPlayer in entries:
+                if flyweight and objCls.FLYWEIGHT:
+                    level._AddFlyweight(x, y, symbol, objCls)
+                    continue
+
+                obj = objCls(next(newId), symbol)
+                if isPlayer:
+                    players[obj.GetNumber()] = obj
+
+                objList = symbols.get(symbol)
+                if objList is None:
+                    objList = symbols[symbol] = []
+                objList.append(obj)
+                objects[obj._id] = obj
+
+                resetDataList.append((position, obj, symbol))
+                cellObjects.append(obj)
+
+            if cellObjects:
+                contents.append((x, y, cellObjects, cellCount, symbolMask, traits))
+
+        level._field._Populate(contents)
+        level._objCount = dict(self._objCount)
+        return level
@@ -0,0 +1,429 @@
+"""
+    mtxPython - A framework to create matrix games.
+    Copyright (C) 2016  Tobias Stampfl <info@matrixgames.rocks>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation in version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import collections
+
+from . import Constants
+from .Settings import Settings
+
+# The settings of fields whose level does not belong to a game. They are shared, so the grids of
+# these fields are not rebuilt by each query.
+_DEFAULT_SETTINGS = Settings()
+
+
+class DistanceMap():
+    """
+    The number of steps from each cell of a :class:`field<mtx.Field>` to the nearest of one or
+    more target cells, calculated by :meth:`mtx.Field.DistanceMap`.
+
+    Only accessible cells are passed on the way to a target (see :meth:`mtx.Cell.IsAccessible`),
+    but the targets themselves don't have to be accessible. So a map of the cell of a player can
+    be used by any number of opponents to find their way to the player.
+    """
+
+    #: The distance of a cell from which no target can be reached.
+    UNREACHABLE = -1
+
+    def __init__(self, width, height, sources, distances):
+        self._width = width
+        self._height = height
+        self._sources = sources
+        self._distances = distances
+
+    def GetDistance(self, x, y):
+        """
+        Parameters:
+            x (:obj:`int`): `X` coordinate of the cell position.
+            y (:obj:`int`): `Y` coordinate of the cell position.
+
+        Returns:
+            :obj:`int`: The number of steps from the cell to the nearest target or
+            :attr:`UNREACHABLE`.
+        """
+        return self._distances[y * self._width + x]
+
+    def GetDirection(self, x, y):
+        """
+        Returns the direction of the first step from a cell towards the nearest target. The cell
+        itself doesn't have to be accessible, e.g. it may be the cell of the object that moves.
+
+        Parameters:
+            x (:obj:`int`): `X` coordinate of the cell position.
+            y (:obj:`int`): `Y` coordinate of the cell position.
+
+        Returns:
+            :obj:`int` or :obj:`None`: The direction (:class:`mtx.UP<mtx.Constants.UP>`,
+            :class:`mtx.RIGHT<mtx.Constants.RIGHT>`, :class:`mtx.DOWN<mtx.Constants.DOWN>` or
+            :class:`mtx.LEFT<mtx.Constants.LEFT>`) or None, if the cell is a target or no
+            target can be reached.
+        """
+        index = y * self._width + x
+        if self._distances[index] == 0:
+            return None
+
+        bestDirection = None
+        bestDistance = None
+        for direction, neighbour in self._GetNeighbours(index):
+            distance = self._distances[neighbour]
+            if distance >= 0 and (bestDistance is None or distance < bestDistance):
+                bestDirection = direction
+                bestDistance = distance
+        return bestDirection
+
+    def _GetNeighbours(self, index):
+        width = self._width
+        x = index % width
+        if index >= width:
+            yield Constants.UP, index - width
+        if x < width - 1:
+            yield Constants.RIGHT, index + 1
+        if index < (self._height - 1) * width:
+            yield Constants.DOWN, index + width
+        if x > 0:
+            yield Constants.LEFT, index - 1
+
+
+class _ReachabilityIndex():
+    """
+    The cells an object can walk to without moving anything, kept as connected regions of walkable
+    cells. A cell is walkable, if it is accessible without moving (see
+    :meth:`mtx.Cell.IsAccessible`) or if the object itself is on it. So the regions don't change
+    while the object just walks around. If a cell becomes walkable, the regions around it are
+    merged. If a cell becomes blocked, only its own region is searched for a split.
+    """
+
+    def __init__(self, obj, grid, width, height):
+        self._obj = obj
+        self._width = width
+        self._height = height
+        self._labels = [-1] * (width * height)
+        self._regions = {}
+        self._nextLabel = 0
+
+        for index in range(width * height):
+            if self._labels[index] < 0 and self._IsWalkable(index, grid):
+                self._Fill(index, -1, grid)
+
+    def _GetObjectIndex(self):
+        cell = self._obj._cell
+        if cell is None:
+            return -1
+        return cell._y * self._width + cell._x
+
+    def _IsWalkable(self, index, grid):
+        return grid[index] == 1 or index == self._GetObjectIndex()
+
+    def _GetNeighbours(self, index):
+        width = self._width
+        x = index % width
+        if index >= width:
+            yield index - width
+        if x < width - 1:
+            yield index + 1
+        if index < (self._height - 1) * width:
+            yield index + width
+        if x > 0:
+            yield index - 1
+
+    def _Fill(self, start, label, grid):
+        # Gives a new label to all cells connected to `start`, which currently have the given
+        # label (-1 for cells that have no region yet).
+        labels = self._labels
+        newLabel = self._nextLabel
+        self._nextLabel += 1
+
+        region = set([start])
+        labels[start] = newLabel
+        stack = [start]
+        while stack:
+            index = stack.pop()
+            for neighbour in self._GetNeighbours(index):
+                if labels[neighbour] == label and neighbour not in region and\
+                   (label >= 0 or self._IsWalkable(neighbour, grid)):
+                    labels[neighbour] = newLabel
+                    region.add(neighbour)
+                    stack.append(neighbour)
+
+        self._regions[newLabel] = region
+        return region
+
+    def CellChanged(self, index, grid):
+        walkable = self._IsWalkable(index, grid)
+        label = self._labels[index]
+        if walkable == (label >= 0):
+            return
+
+        if walkable:
+            self._Join(index)
+        else:
+            self._Split(index, label, grid)
+
+    def _Join(self, index):
+        labels = self._labels
+        neighbourLabels = set(labels[n] for n in self._GetNeighbours(index) if labels[n] >= 0)
+        if not neighbourLabels:
+            label = self._nextLabel
+            self._nextLabel += 1
+            self._regions[label] = set()
+        else:
+            # The smaller regions are merged into the largest one.
+            label = max(neighbourLabels, key=lambda l: len(self._regions[l]))
+            region = self._regions[label]
+            for other in neighbourLabels:
+                if other != label:
+                    for i in self._regions.pop(other):
+                        labels[i] = label
+                        region.add(i)
+
+        labels[index] = label
+        self._regions[label].add(index)
+
+    def _Split(self, index, label, grid):
+        labels = self._labels
+        region = self._regions[label]
+        labels[index] = -1
+        region.discard(index)
+        if not region:
+            del self._regions[label]
+            return
+
+        # A cell with less than two neighbours in the region can't separate the region.
+        starts = [n for n in self._GetNeighbours(index) if labels[n] == label]
+        if len(starts) < 2:
+            return
+
+        del self._regions[label]
+        remaining = len(region)
+        for start in starts:
+            if labels[start] != label:
+                continue
+            remaining -= len(self._Fill(start, label, grid))
+            if remaining == 0:
+                break
+
+    def IsReachable(self, index):
+        objIndex = self._GetObjectIndex()
+        return objIndex >= 0 and self._labels[index] == self._labels[objIndex]
+
+    def GetReachableCells(self):
+        objIndex = self._GetObjectIndex()
+        if objIndex < 0:
+            return set()
+        return self._regions[self._labels[objIndex]]
+
+
+class PathFinder():
+    """
+    Finds paths on a :class:`field<mtx.Field>`. It keeps a flat grid with the accessibility of
+    each cell, which is updated cell by cell when objects are added, removed or change their
+    symbol. The distance maps are cached until a change of the accessibility of a cell could
+    affect them, the cells reachable by an object are kept up to date region by region. The path
+    finder of a field is created on demand by :meth:`mtx.Field.FindPath`,
+    :meth:`mtx.Field.DistanceMap` and the reachability queries of :class:`mtx.Level`.
+    """
+
+    #: The maximum number of cached distance maps. The oldest map is dropped first.
+    MAX_CACHED_MAPS = 64
+
+    def __init__(self, field):
+        """
+        Parameters:
+            field (:class:`mtx.Field`): The field.
+        """
+        self._field = field
+        self._width, self._height = field.GetSize()
+        self._grids = {}
+        self._maps = collections.OrderedDict()
+        self._reachabilities = {}
+        self._access = None
+
+    def _GetSettings(self):
+        level = self._field.GetLevel()
+        if level is not None and level.GetGame() is not None:
+            return level.GetGame().GetSettings()
+        return _DEFAULT_SETTINGS
+
+    def _GetGrid(self, moving, settings):
+        # The grids have to be rebuilt, if the access lists of the settings have been changed.
+        access = settings.GetCompiledAccess()
+        if access != self._access:
+            self._access = access
+            self._grids.clear()
+            self._maps.clear()
+            self._reachabilities.clear()
+
+        grid = self._grids.get(moving)
+        if grid is None:
+            grid = bytearray(self._width * self._height)
+            for cell in self._field:
+                if cell.IsAccessible(moving, settings):
+                    grid[cell._y * self._width + cell._x] = 1
+            self._grids[moving] = grid
+        return grid
+
+    def CellChanged(self, cell):
+        """
+        Updates the accessibility of a cell and drops the distance maps that may be affected by
+        the change. It is called by the field whenever the objects of a cell have changed.
+
+        Parameters:
+            cell (:class:`mtx.Cell`): The changed cell.
+        """
+        if not self._grids:
+            return
+
+        settings = self._GetSettings()
+        index = cell._y * self._width + cell._x
+        for moving, grid in self._grids.items():
+            accessible = 1 if cell.IsAccessible(moving, settings) else 0
+            if grid[index] == accessible:
+                continue
+            grid[index] = accessible
+
+            for key, distanceMap in list(self._maps.items()):
+                if key[1] != moving:
+                    continue
+
+                distances = distanceMap._distances
+                if accessible:
+                    # The cell may open a new way, if it can be reached from a neighbour.
+                    affected = any(distances[n] >= 0
+                                   for direction, n in distanceMap._GetNeighbours(index))
+                else:
+                    # A way through the cell is blocked now. Targets are always reached.
+                    affected = distances[index] > 0
+
+                if affected:
+                    del self._maps[key]
+
+        # Moving objects change the accessibility of their own cell, so the walkable cells of an
+        # object may change even if the grid stays the same.
+        if self._reachabilities:
+            grid = self._grids[False]
+            for reachability in self._reachabilities.values():
+                reachability.CellChanged(index, grid)
+
+    def _GetReachability(self, obj):
+        grid = self._GetGrid(False, self._GetSettings())
+        reachability = self._reachabilities.get(obj._id)
+        if reachability is None or reachability._obj is not obj:
+            reachability = _ReachabilityIndex(obj, grid, self._width, self._height)
+            self._reachabilities[obj._id] = reachability
+        return reachability
+
+    def IsReachable(self, obj, cell):
+        """
+        Parameters:
+            obj (:class:`mtx.BaseObject`): The walking object, e.g. a player.
+            cell (:class:`mtx.Cell`): The cell.
+
+        Returns:
+            :obj:`bool`: True, if the object can walk to the cell without moving another object.
+        """
+        return self._GetReachability(obj).IsReachable(cell._y * self._width + cell._x)
+
+    def GetReachableCells(self, obj):
+        """
+        Parameters:
+            obj (:class:`mtx.BaseObject`): The walking object, e.g. a player.
+
+        Returns:
+            :obj:`list`: The (x, y) positions of all cells the object can walk to without moving
+            another object, including its own cell.
+        """
+        width = self._width
+        return [(index % width, index // width)
+                for index in self._GetReachability(obj).GetReachableCells()]
+
+    def DistanceMap(self, targets, moving=True):
+        """
+        Calculates the distances of all cells to the nearest target with a breadth first search
+        that starts at all targets at once.
+
+        Parameters:
+            targets (:obj:`list`): The target :class:`cells<mtx.Cell>`.
+            moving (:obj:`bool`): True, if the cells are entered by moves, False otherwise (see
+                :meth:`mtx.Cell.IsAccessible`).
+
+        Returns:
+            :class:`mtx.DistanceMap`: The distances to the targets.
+        """
+        width = self._width
+        sources = tuple(sorted(set(cell._y * width + cell._x for cell in targets)))
+        grid = self._GetGrid(moving, self._GetSettings())
+
+        key = (sources, moving)
+        distanceMap = self._maps.get(key)
+        if distanceMap is not None:
+            return distanceMap
+
+        distances = [DistanceMap.UNREACHABLE] * (width * self._height)
+        distanceMap = DistanceMap(width, self._height, sources, distances)
+
+        queue = collections.deque()
+        for index in sources:
+            distances[index] = 0
+            queue.append(index)
+
+        while queue:
+            index = queue.popleft()
+            distance = distances[index] + 1
+            for direction, neighbour in distanceMap._GetNeighbours(index):
+                if grid[neighbour] and distances[neighbour] < 0:
+                    distances[neighbour] = distance
+                    queue.append(neighbour)
+
+        self._maps[key] = distanceMap
+        if len(self._maps) > self.MAX_CACHED_MAPS:
+            self._maps.popitem(last=False)
+
+        return distanceMap
+
+    def FindPath(self, start, goal, moving=True):
+        """
+        Parameters:
+            start (:class:`mtx.Cell`): The cell where the path starts. It doesn't have to be
+                accessible.
+            goal (:class:`mtx.Cell`): The cell where the path ends. It doesn't have to be
+                accessible.
+            moving (:obj:`bool`): True, if the cells are entered by moves, False otherwise (see
+                :meth:`mtx.Cell.IsAccessible`).
+
+        Returns:
+            :obj:`list` or :obj:`None`: The directions of a shortest path from `start` to `goal`
+            or None, if there is none.
+        """
+        distanceMap = self.DistanceMap([goal], moving)
+        distances = distanceMap._distances
+        index = start._y * self._width + start._x
+        goalIndex = goal._y * self._width + goal._x
+
+        path = []
+        while index != goalIndex:
+            best = None
+            for direction, neighbour in distanceMap._GetNeighbours(index):
+                distance = distances[neighbour]
+                if distance >= 0 and (best is None or distance < distances[best[1]]):
+                    best = (direction, neighbour)
+
+            if best is None:
+                return None
+
+            path.append(best[0])
+            index = best[1]
+
+        return path
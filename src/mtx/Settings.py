@@ -15,6 +15,9 @@
     along with this program. If not, see <http://www.gnu.org/licenses/>.
 """
 
+from .BaseObject import GetSymbolBit
+
+
 class Settings():
     def __init__(self):
         self.preferedSize = None
@@ -30,24 +33,92 @@ class Settings():
         whether the level should be centered or drawn in the upper left corner.
         """
 
-        self.cellAccessWhitelist = None
+        self._cellAccessWhitelist = None
+        self._cellAccessBlacklist = None
+        self._compiledAccess = None
+
+        self.movingAllowed = True
+        """
+        Indicates whether a player is allowed to move.
+        """
+
+        self.jumpingAllowed = False
+        """
+        Indicates whether a player is allowed to jump.
+        """
+
+        self.undoDepth = 0
+        """
+        The maximum number of moves and jumps that can be undone (see :meth:`mtx.Game.Undo`).
+        The journal of the moves is cleared when a level starts or is reset. If the value is 0
+        (default), undo is disabled.
+        """
+
+        self.deadlockDetection = False
+        """
+        Indicates whether each pushed object is checked for a deadlock (see
+        :meth:`mtx.Level.IsDeadlocked`). If so, :meth:`mtx.Game.OnDeadlock` is called.
+        """
+
+    @property
+    def cellAccessWhitelist(self):
         """
         List of object symbols of which at least one must be present in a cell to grant access.
         If the value is None (default), there is no whitelist check.
         """
+        return self._cellAccessWhitelist
 
-        self.cellAccessBlacklist = None
+    @cellAccessWhitelist.setter
+    def cellAccessWhitelist(self, whitelist):
+        self._cellAccessWhitelist = whitelist
+        self._compiledAccess = None
+
+    @property
+    def cellAccessBlacklist(self):
         """
         List of object symbols, none of which may be present in the cell to grant access.
         If the value is None (default), there is no blacklist check.
         """
+        return self._cellAccessBlacklist
 
-        self.movingAllowed = True
+    @cellAccessBlacklist.setter
+    def cellAccessBlacklist(self, blacklist):
+        self._cellAccessBlacklist = blacklist
+        self._compiledAccess = None
+
+    def Compile(self):
         """
-        Indicates whether a player is allowed to move.
+        Converts the cell access whitelist and blacklist into symbol bitsets, which are used by
+        :meth:`mtx.Cell.IsAccessible`. It is called by the game console after
+        :meth:`mtx.Game.OnInit` and whenever one of the lists is replaced. If a list is modified
+        in place, this method has to be called again.
         """
+        whitelist = self._cellAccessWhitelist
+        blacklist = self._cellAccessBlacklist
 
-        self.jumpingAllowed = False
+        whitelistMask = None
+        if whitelist is not None:
+            whitelistMask = 0
+            for symbol in whitelist:
+                whitelistMask |= GetSymbolBit(symbol)
+
+        blacklistMask = 0
+        if blacklist is not None:
+            for symbol in blacklist:
+                blacklistMask |= GetSymbolBit(symbol)
+
+        # An empty cell is represented by a space.
+        emptyAccessible = (whitelist is None or ' ' in whitelist) and\
+                          (blacklist is None or ' ' not in blacklist)
+
+        self._compiledAccess = (whitelistMask, blacklistMask, emptyAccessible)
+
+    def GetCompiledAccess(self):
         """
-        Indicates whether a player is allowed to jump.
+        Returns:
+            :obj:`tuple`: The whitelist bitset (None if there is no whitelist), the blacklist
+            bitset and whether empty cells are accessible.
         """
+        if self._compiledAccess is None:
+            self.Compile()
+        return self._compiledAccess
@@ -0,0 +1,114 @@
+"""
+    mtxPython - A framework to create matrix games.
+    Copyright (C) 2016  Tobias Stampfl <info@matrixgames.rocks>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation in version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+class SymbolIndex():
+    """
+    Keeps track of the objects that are currently on the cells of a :class:`field<mtx.Field>`,
+    grouped by their symbol. It is updated by the field whenever an object is added to or removed
+    from a cell or changes its symbol, so it never goes stale when objects are collected, removed
+    or spawned. The index of a field is created by the first query of :class:`mtx.Level`, e.g.
+    :meth:`mtx.Level.GetRemainingCount`.
+    """
+
+    def __init__(self, field):
+        """
+        Parameters:
+            field (:class:`mtx.Field`): The field.
+        """
+        self._width = field.GetWidth()
+        self._objects = {}
+        self._positions = {}
+        self._positionBits = {}
+
+        # The number of placements of each symbol. A flyweight object is one object, but it is
+        # placed on many cells.
+        self._counts = {}
+
+        for cell in field:
+            for obj in cell:
+                self.ObjectAdded(cell, obj._symbol, obj)
+
+    def ObjectAdded(self, cell, symbol, obj):
+        objects = self._objects.get(symbol)
+        if objects is None:
+            objects = self._objects[symbol] = {}
+            self._positions[symbol] = {}
+        objects[obj._id] = obj
+        self._counts[symbol] = self._counts.get(symbol, 0) + 1
+
+        positions = self._positions[symbol]
+        index = cell._y * self._width + cell._x
+        positions[index] = positions.get(index, 0) + 1
+        self._positionBits.pop(symbol, None)
+
+    def ObjectRemoved(self, cell, symbol, obj):
+        del self._objects[symbol][obj._id]
+        self._counts[symbol] -= 1
+
+        positions = self._positions[symbol]
+        index = cell._y * self._width + cell._x
+        if positions[index] == 1:
+            del positions[index]
+        else:
+            positions[index] -= 1
+        self._positionBits.pop(symbol, None)
+
+    def GetCount(self, symbols):
+        """
+        Parameters:
+            symbols (:obj:`str`): One or more symbols.
+
+        Returns:
+            :obj:`int`: The number of objects on the field with one of the symbols. A flyweight
+            object is counted once for each of its cells.
+        """
+        return sum(self._counts.get(symbol, 0) for symbol in symbols)
+
+    def GetObjects(self, symbols):
+        """
+        Parameters:
+            symbols (:obj:`str`): One or more symbols.
+
+        Returns:
+            :obj:`list`: The objects on the field with one of the symbols.
+        """
+        objects = []
+        for symbol in symbols:
+            objects.extend(self._objects.get(symbol, {}).values())
+        return objects
+
+    def GetPositionBits(self, symbols):
+        """
+        Parameters:
+            symbols (:obj:`str`): One or more symbols.
+
+        Returns:
+            :obj:`int`: A bitset with the bit `y * width + x` set for each cell with an object
+            with one of the symbols. The bitset of a symbol is cached until one of its objects
+            changes.
+        """
+        bits = 0
+        for symbol in symbols:
+            symbolBits = self._positionBits.get(symbol)
+            if symbolBits is None:
+                symbolBits = 0
+                for index in self._positions.get(symbol, ()):
+                    symbolBits |= 1 << index
+                self._positionBits[symbol] = symbolBits
+            bits |= symbolBits
+        return bits
@@ -0,0 +1,288 @@
+"""
+    mtxPython - A framework to create matrix games.
+    Copyright (C) 2016  Tobias Stampfl <info@matrixgames.rocks>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation in version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import multiprocessing
+import traceback
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from . import HeadlessConsole
+
+
+def _DefaultReward(game, done):
+    return 1.0 if done else 0.0
+
+
+class _EnvShard():
+    """
+    Runs a range of the game instances of a :class:`mtx.VecEnv` and writes the results into the
+    given arrays.
+    """
+
+    def __init__(self, gameFactory, count, rewardFunc, observations, rewards, dones):
+        self._gameFactory = gameFactory
+        self._rewardFunc = rewardFunc
+        self._observations = observations
+        self._rewards = rewards
+        self._dones = dones
+        self._consoles = [HeadlessConsole() for _ in range(count)]
+
+    def Reset(self):
+        for i, console in enumerate(self._consoles):
+            console.LoadGame(self._gameFactory())
+            self._WriteObservation(i)
+        self._rewards.fill(0.0)
+        self._dones.fill(False)
+
+    def Step(self, actions):
+        for i, console in enumerate(self._consoles):
+            player, direction = actions[i]
+            game = console.GetGame()
+            level = game.GetLevel()
+
+            if direction >= 0:
+                console.MovePlayer(int(player), int(direction))
+
+            done = game.GetLevel() is not level
+            self._rewards[i] = self._rewardFunc(game, done)
+            self._dones[i] = done
+
+            if game.GetLevel() is None:
+                # The game is finished, so it starts again.
+                console.LoadGame(self._gameFactory())
+
+            self._WriteObservation(i)
+
+    def _WriteObservation(self, i):
+        out = self._observations[i]
+        height, width = out.shape
+        level = self._consoles[i].GetGame().GetLevel()
+        levelWidth, levelHeight = level.GetFieldSize()
+        if levelWidth > width or levelHeight > height:
+            raise ValueError("Level %s with the size %s exceeds the observation size %s." %
+                             (level.GetNumber(), (levelWidth, levelHeight), (width, height)))
+
+        grid = bytearray(levelWidth * levelHeight)
+        for cell in level.GetField():
+            obj = cell.GetFirstObject()
+            if obj is not None:
+                grid[cell._y * levelWidth + cell._x] = ord(obj._symbol)
+
+        out.fill(0)
+        out[:levelHeight, :levelWidth] = numpy.frombuffer(grid, numpy.uint8).reshape(levelHeight,
+                                                                                      levelWidth)
+
+
+def _Worker(conn, gameFactory, count, rewardFunc, buffers, offset, shape):
+    total = len(buffers[1])
+    width, height = shape
+    observations = numpy.frombuffer(buffers[0], numpy.uint8).reshape(total, height, width)
+    rewards = numpy.frombuffer(buffers[1], numpy.float32)
+    dones = numpy.frombuffer(buffers[2], numpy.bool_)
+
+    shard = _EnvShard(gameFactory, count, rewardFunc, observations[offset:offset + count],
+                      rewards[offset:offset + count], dones[offset:offset + count])
+
+    while True:
+        command, data = conn.recv()
+        if command == 'close':
+            conn.close()
+            return
+
+        try:
+            if command == 'reset':
+                shard.Reset()
+            elif command == 'step':
+                shard.Step(data)
+            conn.send(None)
+        except Exception:
+            conn.send(traceback.format_exc())
+
+
+class VecEnv():
+    """
+    Runs several instances of the same game side by side for training agents. All instances are
+    played by a :class:`mtx.HeadlessConsole` and are advanced together by :meth:`Step`.
+
+    An observation is a grid of the levels field, which contains for each cell the character
+    code of the symbol of its top most object or 0 for an empty cell. Levels smaller than the
+    observation size are padded with 0. The observations, rewards and done flags of all instances
+    are returned as stacked NumPy arrays.
+
+    A level is done when the game has moved on to the next level. The instance continues with the
+    next level and when there is none, it starts with a new game.
+
+    **Requires NumPy.**
+    """
+
+    def __init__(self, gameFactory, count, shape=None, rewardFunc=None, processes=0):
+        """
+        Parameters:
+            gameFactory (:obj:`callable`): Returns a new :class:`mtx.Game` object, e.g. the
+                class of the game. It has to be picklable, if `processes` is greater than 0.
+            count (:obj:`int`): The number of game instances.
+            shape (:obj:`tuple`): The (width, height) of the observations. By default the size of
+                the first level of the game.
+            rewardFunc (:obj:`callable`): Called with the game and the done flag after each step
+                and returns the reward. By default, the reward is 1.0 if the level is done and
+                0.0 otherwise.
+            processes (:obj:`int`): If greater than 0, the instances are split up between this
+                number of worker processes, which write into shared memory. Otherwise all
+                instances run in the calling process.
+
+        Raises:
+            :obj:`RuntimeError`: If NumPy is not available.
+            :obj:`ValueError`: If `count` or `processes` is not valid.
+        """
+        if numpy is None:
+            raise RuntimeError("mtx.VecEnv requires NumPy.")
+
+        if count < 1:
+            raise ValueError("At least one game instance is required.")
+
+        if processes < 0 or processes > count:
+            raise ValueError("The number of processes must be between 0 and %d." % count)
+
+        if rewardFunc is None:
+            rewardFunc = _DefaultReward
+
+        if shape is None:
+            console = HeadlessConsole()
+            console.LoadGame(gameFactory())
+            shape = console.GetGame().GetLevel().GetFieldSize()
+            console.StopGame()
+
+        width, height = shape
+        self._count = count
+        self._shape = (width, height)
+        self._workers = []
+        self._started = False
+
+        if processes == 0:
+            self._observations = numpy.zeros((count, height, width), numpy.uint8)
+            self._rewards = numpy.zeros(count, numpy.float32)
+            self._dones = numpy.zeros(count, numpy.bool_)
+            self._shard = _EnvShard(gameFactory, count, rewardFunc, self._observations,
+                                    self._rewards, self._dones)
+        else:
+            buffers = (multiprocessing.RawArray('B', count * height * width),
+                       multiprocessing.RawArray('f', count),
+                       multiprocessing.RawArray('B', count))
+            self._observations = numpy.frombuffer(buffers[0], numpy.uint8).reshape(count, height,
+                                                                                 width)
+            self._rewards = numpy.frombuffer(buffers[1], numpy.float32)
+            self._dones = numpy.frombuffer(buffers[2], numpy.bool_)
+            self._shard = None
+
+            offset = 0
+            for i in range(processes):
+                shardCount = count // processes + (1 if i < count % processes else 0)
+                conn, workerConn = multiprocessing.Pipe()
+                process = multiprocessing.Process(target=_Worker,
+                                                  args=(workerConn, gameFactory, shardCount,
+                                                        rewardFunc, buffers, offset,
+                                                        self._shape))
+                process.daemon = True
+                process.start()
+                workerConn.close()
+                self._workers.append((process, conn, offset, shardCount))
+                offset += shardCount
+
+    def GetCount(self):
+        """
+        Returns:
+            :obj:`int`: The number of game instances.
+        """
+        return self._count
+
+    def GetObservationShape(self):
+        """
+        Returns:
+            :obj:`tuple`: The (width, height) of the observations.
+        """
+        return self._shape
+
+    def Reset(self):
+        """
+        Starts a new game in all instances.
+
+        Returns:
+            :obj:`numpy.ndarray`: The observations with the shape (count, height, width).
+        """
+        if self._shard is not None:
+            self._shard.Reset()
+        else:
+            self._Call([('reset', None)] * len(self._workers))
+        self._started = True
+
+        return self._observations
+
+    def Step(self, actions):
+        """
+        Moves a player in each game instance.
+
+        The returned arrays are reused by the next call, so they have to be copied to keep them.
+
+        Parameters:
+            actions: An array with the shape (count, 2) that contains the (player number,
+                direction) for each instance. A negative direction does not move the player.
+
+        Returns:
+            :obj:`tuple`: The observations with the shape (count, height, width), the rewards and
+            the done flags.
+
+        Raises:
+            :obj:`RuntimeError`: If :meth:`Reset` has not been called yet.
+            :obj:`ValueError`: If the shape of `actions` does not fit.
+        """
+        if not self._started:
+            raise RuntimeError("mtx.VecEnv.Reset has to be called before the first step.")
+
+        actions = numpy.asarray(actions)
+        if actions.shape != (self._count, 2):
+            raise ValueError("Expected actions with the shape %s, got %s." %
+                             ((self._count, 2), actions.shape))
+
+        if self._shard is not None:
+            self._shard.Step(actions)
+        else:
+            self._Call([('step', actions[offset:offset + count])
+                        for process, conn, offset, count in self._workers])
+
+        return self._observations, self._rewards, self._dones
+
+    def Close(self):
+        """
+        Stops the worker processes.
+        """
+        for process, conn, offset, count in self._workers:
+            conn.send(('close', None))
+            conn.close()
+            process.join()
+        self._workers = []
+
+    def _Call(self, messages):
+        for (process, conn, offset, count), message in zip(self._workers, messages):
+            conn.send(message)
+
+        errors = [conn.recv() for process, conn, offset, count in self._workers]
+        for error in errors:
+            if error is not None:
+                raise RuntimeError("A worker of the environment failed:\n%s" % error)
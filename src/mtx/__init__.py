@@ -17,17 +17,30 @@
 
 from .Constants import *
 from .Settings import Settings
+from . import FieldCodec
 from .Act import *
+from .Journal import *
 from .Renderer import *
+from .AsyncRenderer import *
+from .InputBuffer import *
+from .GameLoop import *
 from .GameConsole import *
+from .HeadlessConsole import *
 from .BaseObject import (BaseObject, RegisterObjectClass, RegisterMultiObjectSymbol,
                          GetRegisteredObjectClass, IsMultiObjectSymbol,
-                         GetRegisteredMultiObjectSymbols)
+                         GetRegisteredMultiObjectSymbols, GetSymbolBit, GetSymbolTraits)
 from .Cell import *
+from .PathFinder import *
+from .SymbolIndex import *
 from .Field import *
+from .CompactField import *
 from .Level import *
+from .LevelTemplate import *
+from .LevelPack import *
 from .Game import *
 from .GameLoader import *
+from .VecEnv import VecEnv
 
 from . import baseObjects
 from . import objects
+from . import solver
@@ -20,6 +20,8 @@ from .. import BaseObject
 
 class CollectableObject(BaseObject):
 
+    __slots__ = ()
+
     def IsCollectable(self):
         """
         Returns:
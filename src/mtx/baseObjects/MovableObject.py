@@ -25,6 +25,8 @@ class MovableObject(BaseObject):
     It can be moved directly or through another, neighboring object.
     """
 
+    __slots__ = ()
+
     def IsMovable(self):
         """
         Returns:
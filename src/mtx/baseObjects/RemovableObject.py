@@ -20,6 +20,8 @@ from .. import BaseObject
 
 class RemovableObject(BaseObject):
 
+    __slots__ = ()
+
     def IsRemovable(self):
         """
         Returns:
@@ -24,6 +24,8 @@ class SolidObject(BaseObject):
     No other object can be moved to a cell where a solid object is placed.
     """
 
+    __slots__ = ()
+
     def IsSolid(self):
         """
         Returns:
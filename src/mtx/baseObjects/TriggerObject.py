@@ -20,6 +20,8 @@ from .. import BaseObject
 
 class TriggerObject(BaseObject):
 
+    __slots__ = ()
+
     def IsTrigger(self):
         """
         Returns:
@@ -21,6 +21,8 @@ from .. import RegisterObjectClass, RegisterMultiObjectSymbol
 
 class Box(MovableObject):
 
+    __slots__ = ()
+
     @staticmethod
     def GetSymbols():
         return "b"
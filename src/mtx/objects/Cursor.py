@@ -21,6 +21,8 @@ from .. import RegisterObjectClass
 
 class Cursor(MovableObject):
 
+    __slots__ = ()
+
     @staticmethod
     def GetSymbols():
         return "c"
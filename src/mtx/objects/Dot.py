@@ -21,6 +21,8 @@ from .. import RegisterObjectClass
 
 class Dot(CollectableObject):
 
+    __slots__ = ()
+
     @staticmethod
     def GetSymbols():
         return "."
@@ -21,6 +21,10 @@ from .. import RegisterObjectClass
 
 class Empty(SolidObject):
 
+    __slots__ = ()
+
+    FLYWEIGHT = True
+
     @staticmethod
     def GetSymbols():
         return "-"
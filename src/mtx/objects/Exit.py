@@ -22,6 +22,8 @@ from .. import RegisterObjectClass
 
 class Exit(TriggerObject):
 
+    __slots__ = ('_locked',)
+
     def __init__(self, id, symbol):
         TriggerObject.__init__(self, id, symbol)
         self._locked = symbol == 'E'
@@ -30,6 +32,12 @@ class Exit(TriggerObject):
     def GetSymbols():
         return "eE"
 
+    def GetState(self):
+        return self._locked
+
+    def SetState(self, state):
+        self._locked = state
+
     def IsLocked(self):
         return self._locked
 
@@ -37,14 +45,16 @@ class Exit(TriggerObject):
         return not self._locked
 
     def Lock(self):
-        self._symbol = 'E'
+        oldValue = self._locked
+        self.SetSymbol('E')
         self._locked = True
-        self._cell._field._level._game.AddAct(UpdateAct(self.GetId(), 'locked', True))
+        self._cell._field._level._game.AddAct(UpdateAct(self.GetId(), 'locked', True, oldValue))
 
     def Unlock(self):
-        self._symbol = 'e'
+        oldValue = self._locked
+        self.SetSymbol('e')
         self._locked = False
-        self._cell._field._level._game.AddAct(UpdateAct(self.GetId(), 'locked', False))
+        self._cell._field._level._game.AddAct(UpdateAct(self.GetId(), 'locked', False, oldValue))
 
 
 RegisterObjectClass(Exit)
@@ -21,6 +21,8 @@ from .. import RegisterObjectClass
 
 class Key(CollectableObject):
 
+    __slots__ = ()
+
     @staticmethod
     def GetSymbols():
         return "k"
@@ -21,6 +21,8 @@ from .. import RegisterObjectClass
 
 class Player(MovableObject):
 
+    __slots__ = ('_number',)
+
     def __init__(self, id, symbol):
         MovableObject.__init__(self, id, symbol)
         self._number = int(symbol)
@@ -21,6 +21,8 @@ from .. import RegisterObjectClass
 
 class Target(TriggerObject):
 
+    __slots__ = ()
+
     @staticmethod
     def GetSymbols():
         return "t"
@@ -21,6 +21,8 @@ from .. import RegisterObjectClass, RegisterMultiObjectSymbol
 
 class Tile(RemovableObject):
 
+    __slots__ = ()
+
     @staticmethod
     def GetSymbols():
         return "+"
@@ -21,6 +21,10 @@ from .. import RegisterObjectClass
 
 class Wall(SolidObject):
 
+    __slots__ = ()
+
+    FLYWEIGHT = True
+
     @staticmethod
     def GetSymbols():
         return "#"
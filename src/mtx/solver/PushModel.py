@@ -0,0 +1,315 @@
+"""
+    mtxPython - A framework to create matrix games.
+    Copyright (C) 2016  Tobias Stampfl <info@matrixgames.rocks>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation in version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import collections
+
+from .. import Cell, Constants, GetSymbolBit, TRAIT
+
+# The opposite of each direction, indexed by the direction constants.
+_OPPOSITE = (Constants.DOWN, Constants.LEFT, Constants.UP, Constants.RIGHT)
+
+
+class PushModel():
+    """
+    Describes a level as a push puzzle. The rules are derived from the objects of the level:
+
+    * Cells are floor, if the remaining objects grant access to a moving object (see
+      :meth:`mtx.Cell.IsAccessible`). Movable objects are not taken into account.
+    * Movable objects that can be moved by another object are boxes.
+    * Movable objects that can't be moved by another object, apart from the player, block their
+      cell like a wall.
+    * Collectable, removable and trigger objects don't prevent access, so they are floor.
+
+    The puzzle is solved, if every goal cell is covered by a box.
+
+    Cells are identified by their index `y * width + x`.
+    """
+
+    INFINITE = 0x7FFFFFFF
+
+    def __init__(self, level, settings, playerNumber=1, goalSymbols='t', moveDepth=1):
+        """
+        Parameters:
+            level (:class:`mtx.Level`): The level.
+            settings (:class:`mtx.Settings`): The settings of the game.
+            playerNumber (:obj:`int`): The number of the player who moves the boxes.
+            goalSymbols (:obj:`str`): The symbols of the objects that mark goal cells.
+            moveDepth (:obj:`int`): The maximum number of boxes in a row that can be pushed at a
+                time (see :meth:`mtx.Game.MovePlayer`).
+
+        Raises:
+            :obj:`ValueError`: If the player does not exist or a cell holds more than one box.
+        """
+        player = level.GetPlayer(playerNumber)
+        if player is None or player.GetCell() is None:
+            raise ValueError("Player %d is not part of the level." % playerNumber)
+
+        field = level.GetField()
+        self.width, self.height = field.GetSize()
+        self.size = self.width * self.height
+        self.moveDepth = moveDepth
+
+        self.floor = [False] * self.size
+        self.goals = []
+        boxes = []
+
+        for cell in field:
+            index = cell._y * self.width + cell._x
+            traits = TRAIT.NONE
+            symbolMask = 0
+            hasBox = False
+
+            for obj in cell:
+                if obj is player:
+                    continue
+
+                if obj.GetTraits() & (TRAIT.MOVABLE | TRAIT.UNPUSHABLE) == TRAIT.MOVABLE:
+                    if hasBox:
+                        raise ValueError("More than one box on cell %s." % (cell.GetPosition(),))
+                    hasBox = True
+                    boxes.append(index)
+                    continue
+
+                traits |= obj.GetTraits()
+                symbolMask |= GetSymbolBit(obj._symbol)
+                if obj._symbol in goalSymbols:
+                    self.goals.append(index)
+
+            self.floor[index] = Cell._CheckAccess(traits, symbolMask, True, settings)
+
+        self.player = player.GetCell()._y * self.width + player.GetCell()._x
+        self.boxes = tuple(sorted(boxes))
+        self.goals = [goal for goal in self.goals if self.floor[goal]]
+
+        # The neighbouring floor cell in each direction or -1.
+        self.steps = []
+        for dx, dy in ((0, -1), (1, 0), (0, 1), (-1, 0)):
+            step = [-1] * self.size
+            for index in range(self.size):
+                x = index % self.width + dx
+                y = index // self.width + dy
+                if self.floor[index] and 0 <= x < self.width and 0 <= y < self.height and\
+                   self.floor[y * self.width + x]:
+                    step[index] = y * self.width + x
+            self.steps.append(step)
+
+        self.goalDistances = self._CalculateGoalDistances()
+
+    def _CalculateGoalDistances(self):
+        # Pushes the boxes backwards from the goals. A box can be pushed from a cell, if the cell
+        # behind it is floor for the pusher.
+        distances = [self.INFINITE] * self.size
+        queue = collections.deque()
+        for goal in self.goals:
+            distances[goal] = 0
+            queue.append(goal)
+
+        steps = self.steps
+        while queue:
+            index = queue.popleft()
+            for direction in range(4):
+                back = steps[_OPPOSITE[direction]]
+                prev = back[index]
+                if prev >= 0 and back[prev] >= 0 and distances[prev] == self.INFINITE:
+                    distances[prev] = distances[index] + 1
+                    queue.append(prev)
+
+        return distances
+
+    def GetDeadCells(self):
+        """
+        Returns:
+            :obj:`list`: The indices of the floor cells from which a box can never be pushed onto
+            a goal.
+        """
+        return [index for index in range(self.size)
+                if self.floor[index] and self.goalDistances[index] == self.INFINITE]
+
+    def IsFrozen(self, box, boxes, goals=None):
+        """
+        Checks whether a box can no longer be moved, because it is blocked horizontally and
+        vertically by walls, dead cells (see :meth:`GetDeadCells`) or other frozen boxes.
+
+        Parameters:
+            box (:obj:`int`): The index of the cell of the box.
+            boxes (:obj:`set`): The indices of the cells of all boxes.
+            goals (:obj:`set`): If given, the box only counts as frozen if it or one of the boxes
+                blocking it is not on a goal.
+
+        Returns:
+            :obj:`bool`: True, if the box is frozen.
+        """
+        frozen = []
+        if not self._IsFrozen(box, boxes, frozen):
+            return False
+        return goals is None or not set(frozen).issubset(goals)
+
+    def _IsFrozen(self, box, boxes, frozen):
+        # Boxes that are already being checked are treated like walls, which avoids endless
+        # recursion. If the box turns out not to be frozen, the boxes checked on its behalf are
+        # forgotten again.
+        mark = len(frozen)
+        frozen.append(box)
+        steps = self.steps
+        distances = self.goalDistances
+        for first, second in ((steps[1], steps[3]), (steps[0], steps[2])):
+            a = first[box]
+            b = second[box]
+            if a < 0 or b < 0 or a in frozen or b in frozen:
+                continue
+            if distances[a] == self.INFINITE and distances[b] == self.INFINITE:
+                continue
+            if a in boxes and self._IsFrozen(a, boxes, frozen):
+                continue
+            if b in boxes and self._IsFrozen(b, boxes, frozen):
+                continue
+            del frozen[mark:]
+            return False
+        return True
+
+    def IsBlockedSquare(self, box, boxes, goals):
+        """
+        Checks the four 2x2 squares that contain the box. If all cells of a square are walls or
+        boxes and one of these boxes is not on a goal, none of them can ever be moved.
+
+        Parameters:
+            box (:obj:`int`): The index of the cell of the box.
+            boxes (:obj:`set`): The indices of the cells of all boxes.
+            goals (:obj:`set`): The indices of the goal cells.
+
+        Returns:
+            :obj:`bool`: True, if the box is part of a blocked square.
+        """
+        x, y = box % self.width, box // self.width
+        for dx in (-1, 0):
+            for dy in (-1, 0):
+                blocked = True
+                onGoals = True
+                for cx in (x + dx, x + dx + 1):
+                    for cy in (y + dy, y + dy + 1):
+                        if cx < 0 or cy < 0 or cx >= self.width or cy >= self.height:
+                            continue
+                        index = cy * self.width + cx
+                        if index in boxes:
+                            onGoals = onGoals and index in goals
+                        elif self.floor[index]:
+                            blocked = False
+                if blocked and not onGoals:
+                    return True
+        return False
+
+    def IsSolved(self, boxes):
+        """
+        Parameters:
+            boxes (:obj:`set`): The indices of the cells of the boxes.
+
+        Returns:
+            :obj:`bool`: True, if all goal cells are covered by a box.
+        """
+        for goal in self.goals:
+            if goal not in boxes:
+                return False
+        return True
+
+    def GetReachableCells(self, player, boxes):
+        """
+        Parameters:
+            player (:obj:`int`): The index of the cell of the player.
+            boxes (:obj:`set`): The indices of the cells of the boxes.
+
+        Returns:
+            :obj:`list`: The indices of all cells the player can walk to without pushing a box.
+        """
+        steps = self.steps
+        seen = {player}
+        cells = [player]
+        for index in cells:
+            for step in steps:
+                n = step[index]
+                if n >= 0 and n not in seen and n not in boxes:
+                    seen.add(n)
+                    cells.append(n)
+        return cells
+
+    def GetPushes(self, reachable, boxes):
+        """
+        Parameters:
+            reachable (:obj:`list`): The cells the player can walk to.
+            boxes (:obj:`set`): The indices of the cells of the boxes.
+
+        Returns:
+            :obj:`list`: The possible pushes as (box cell, direction, new box cell) tuples. If
+            several boxes in a row are pushed, the first box leaves its cell and the new cell is
+            the one in front of the last box.
+        """
+        pushes = []
+        steps = self.steps
+        moveDepth = self.moveDepth
+        for index in reachable:
+            for direction in range(4):
+                step = steps[direction]
+                box = step[index]
+                if box < 0 or box not in boxes:
+                    continue
+
+                target = step[box]
+                depth = 1
+                while target >= 0 and target in boxes and depth < moveDepth:
+                    target = step[target]
+                    depth += 1
+
+                if target >= 0 and target not in boxes:
+                    pushes.append((box, direction, target))
+        return pushes
+
+    def FindPath(self, start, end, boxes):
+        """
+        Parameters:
+            start (:obj:`int`): The index of the cell where the path starts.
+            end (:obj:`int`): The index of the cell where the path ends.
+            boxes (:obj:`set`): The indices of the cells of the boxes.
+
+        Returns:
+            :obj:`list` or :obj:`None`: The directions of the shortest walk from `start` to `end`
+            or None, if there is none.
+        """
+        previous = {start: None}
+        queue = collections.deque([start])
+        while queue:
+            index = queue.popleft()
+            if index == end:
+                path = []
+                while previous[index] is not None:
+                    index, direction = previous[index]
+                    path.append(direction)
+                path.reverse()
+                return path
+
+            for direction in range(4):
+                n = self.steps[direction][index]
+                if n >= 0 and n not in previous and n not in boxes:
+                    previous[n] = (index, direction)
+                    queue.append(n)
+
+        return None
+
+    def GetPosition(self, index):
+        """
+        Returns:
+            :obj:`tuple`: The (x, y) position of the cell with the given index.
+        """
+        return (index % self.width, index // self.width)
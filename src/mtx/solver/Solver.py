@@ -0,0 +1,259 @@
+"""
+    mtxPython - A framework to create matrix games.
+    Copyright (C) 2016  Tobias Stampfl <info@matrixgames.rocks>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation in version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import heapq
+import time
+
+from .PushModel import PushModel
+from .TranspositionTable import TranspositionTable
+from .Zobrist import ZobristTable
+
+
+class Solution():
+    """
+    The solution of a push puzzle found by a :class:`mtx.solver.Solver`.
+    """
+
+    def __init__(self, moves, pushCount):
+        self._moves = moves
+        self._pushCount = pushCount
+
+    def GetMoves(self):
+        """
+        Returns:
+            :obj:`list`: The directions in which the player has to be moved one after another.
+        """
+        return self._moves
+
+    def GetMoveCount(self):
+        """
+        Returns:
+            :obj:`int`: The number of moves of the player.
+        """
+        return len(self._moves)
+
+    def GetPushCount(self):
+        """
+        Returns:
+            :obj:`int`: The number of moves that push a box.
+        """
+        return self._pushCount
+
+
+class Solver():
+    """
+    Searches the solution of a push puzzle level (e.g. Sokoban) with A*. The rules of the puzzle
+    are derived from the objects of the level (see :class:`mtx.solver.PushModel`).
+
+    A search state consists of the box positions and the area the player can walk to, which is
+    represented by its top left cell. States are identified by their Zobrist hash and stored in a
+    transposition table, whose size is limited by `maxMemory`. The heuristic is the sum of the push
+    distances of the boxes to the nearest goal. By default it is weighted, so the solution does not
+    need to have the least number of pushes. Pushes onto cells from which no goal can be reached
+    and pushes that freeze boxes apart from goals are pruned, if there are as many boxes as goals.
+    Frozen boxes are only pruned, if `moveDepth` is 1.
+
+    Example:
+        .. code-block:: python
+
+            solver = mtx.solver.Solver(level, game.GetSettings())
+            solution = solver.Solve(timeLimit=10)
+            if solution is not None:
+                for direction in solution.GetMoves():
+                    game.MovePlayer(1, direction)
+    """
+
+    SOLVED       = 'solved'
+    UNSOLVABLE   = 'unsolvable'
+    MEMORY_LIMIT = 'memoryLimit'
+    TIME_LIMIT   = 'timeLimit'
+
+    #: Estimated memory in bytes for each state of the search.
+    BYTES_PER_STATE = 400
+
+    def __init__(self, level, settings, playerNumber=1, goalSymbols='t', moveDepth=1,
+                 maxMemory=256, weight=3.0):
+        """
+        Parameters:
+            level (:class:`mtx.Level`): The level to be solved in its current state.
+            settings (:class:`mtx.Settings`): The settings of the game.
+            playerNumber (:obj:`int`): The number of the player who moves the boxes.
+            goalSymbols (:obj:`str`): The symbols of the objects that mark goal cells.
+            moveDepth (:obj:`int`): The maximum number of boxes in a row that can be pushed at a
+                time (see :meth:`mtx.Game.MovePlayer`).
+            maxMemory (:obj:`int`): The approximate maximum memory of the search in megabytes.
+            weight (:obj:`float`): The weight of the heuristic. 1.0 finds a solution with the
+                least number of pushes but may need a lot of time and memory, greater values
+                find a solution much faster.
+        """
+        self._model = PushModel(level, settings, playerNumber, goalSymbols, moveDepth)
+        self._zobrist = ZobristTable(self._model.size)
+        self._maxStates = maxMemory * 1024 * 1024 // self.BYTES_PER_STATE
+        self._weight = weight
+        self._status = None
+        self._stats = {}
+
+    def GetModel(self):
+        """
+        Returns:
+            :class:`mtx.solver.PushModel`: The model of the level.
+        """
+        return self._model
+
+    def GetStatus(self):
+        """
+        Returns:
+            :obj:`str`: The result of the last search (:attr:`SOLVED`, :attr:`UNSOLVABLE`,
+            :attr:`MEMORY_LIMIT` or :attr:`TIME_LIMIT`) or None, if there was no search yet.
+        """
+        return self._status
+
+    def GetStats(self):
+        """
+        Returns:
+            :obj:`dict`: The number of `expanded` and `stored` states and the `time` in seconds
+            of the last search.
+        """
+        return self._stats
+
+    def _Heuristic(self, boxes):
+        distances = self._model.goalDistances
+        goalCount = len(self._model.goals)
+        values = [distances[box] for box in boxes]
+        if len(values) > goalCount:
+            values.sort()
+            values = values[:goalCount]
+        return sum(values)
+
+    def Solve(self, timeLimit=None):
+        """
+        Searches a solution.
+
+        Parameters:
+            timeLimit (:obj:`float`): The maximum time of the search in seconds or None for no
+                limit.
+
+        Returns:
+            :class:`mtx.solver.Solution` or :obj:`None`: The solution or None, if no solution
+            has been found (see :meth:`GetStatus`).
+        """
+        startTime = time.perf_counter()
+        model = self._model
+        boxKeys = self._zobrist.boxKeys
+        playerKeys = self._zobrist.playerKeys
+        distances = model.goalDistances
+        infinite = model.INFINITE
+        weight = self._weight
+        table = TranspositionTable(self._maxStates)
+
+        # Deadlocks can only be pruned, if every box has to reach a goal. Boxes that are frozen
+        # for single pushes may still be moved by pushing several boxes at a time.
+        prune = len(model.boxes) == len(model.goals)
+        pruneFrozen = prune and model.moveDepth == 1
+        goals = set(model.goals)
+
+        self._status = self.UNSOLVABLE
+        solution = None
+        expanded = 0
+
+        startHeuristic = self._Heuristic(model.boxes)
+        if len(model.goals) > 0 and len(model.boxes) >= len(model.goals) and\
+           startHeuristic < infinite:
+            heap = [(startHeuristic * weight, 0, 0, None, None,
+                     self._zobrist.HashBoxes(model.boxes), model.player, model.boxes)]
+            counter = 1
+        else:
+            heap = []
+
+        while heap:
+            f, cost, _, parent, push, boxHash, player, boxTuple = heapq.heappop(heap)
+            boxes = set(boxTuple)
+
+            reachable = model.GetReachableCells(player, boxes)
+            key = boxHash ^ playerKeys[min(reachable)]
+            if key not in table and table.IsFull():
+                self._status = self.MEMORY_LIMIT
+                break
+            if not table.Store(key, cost, parent, push):
+                continue
+
+            if model.IsSolved(boxes):
+                solution = self._CreateSolution(table, key)
+                self._status = self.SOLVED
+                break
+
+            expanded += 1
+            if timeLimit is not None and expanded % 256 == 0 and\
+               time.perf_counter() - startTime > timeLimit:
+                self._status = self.TIME_LIMIT
+                break
+
+            for box, direction, target in model.GetPushes(reachable, boxes):
+                if prune and distances[target] == infinite:
+                    continue
+
+                newBoxes = tuple(b if b != box else target for b in boxTuple)
+                if pruneFrozen:
+                    newBoxSet = set(newBoxes)
+                    if model.IsBlockedSquare(target, newBoxSet, goals) or\
+                       model.IsFrozen(target, newBoxSet, goals):
+                        continue
+
+                heuristic = self._Heuristic(newBoxes)
+                if heuristic >= infinite:
+                    continue
+
+                heapq.heappush(heap, (cost + 1 + heuristic * weight, cost + 1, counter, key,
+                                      (box, direction), boxHash ^ boxKeys[box] ^ boxKeys[target],
+                                      box, newBoxes))
+                counter += 1
+
+            if len(heap) + len(table) > self._maxStates:
+                self._status = self.MEMORY_LIMIT
+                break
+
+        self._stats = {'expanded': expanded,
+                       'stored':   len(table),
+                       'time':     time.perf_counter() - startTime}
+        return solution
+
+    def _CreateSolution(self, table, key):
+        pushes = []
+        cost, parent, push = table.Get(key)
+        while push is not None:
+            pushes.append(push)
+            cost, parent, push = table.Get(parent)
+        pushes.reverse()
+
+        model = self._model
+        boxes = set(model.boxes)
+        player = model.player
+        moves = []
+        for box, direction in pushes:
+            # Walk behind the box and push it.
+            behind = model.steps[(direction + 2) % 4][box]
+            moves.extend(model.FindPath(player, behind, boxes))
+            moves.append(direction)
+
+            target = model.steps[direction][box]
+            while target in boxes:
+                target = model.steps[direction][target]
+            boxes.remove(box)
+            boxes.add(target)
+            player = box
+
+        return Solution(moves, len(pushes))
@@ -0,0 +1,80 @@
+"""
+    mtxPython - A framework to create matrix games.
+    Copyright (C) 2016  Tobias Stampfl <info@matrixgames.rocks>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation in version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+class TranspositionTable():
+    """
+    Maps the hashes of states that have already been seen to the number of pushes needed to reach
+    them and the push that led to them. The number of entries is limited to keep the memory usage
+    of a search bounded.
+    """
+
+    def __init__(self, maxEntries):
+        """
+        Parameters:
+            maxEntries (:obj:`int`): The maximum number of stored states.
+        """
+        self._maxEntries = maxEntries
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def Get(self, key):
+        """
+        Parameters:
+            key (:obj:`int`): The hash of a state.
+
+        Returns:
+            :obj:`tuple` or :obj:`None`: The (cost, parent key, push) of the state or None, if the
+            state is unknown.
+        """
+        return self._entries.get(key)
+
+    def Store(self, key, cost, parent, push):
+        """
+        Stores a state, if it is unknown or has been reached with higher costs before. Unknown
+        states are not stored, if the table is full.
+
+        Parameters:
+            key (:obj:`int`): The hash of the state.
+            cost (:obj:`int`): The number of pushes to reach the state.
+            parent (:obj:`int`): The hash of the previous state.
+            push (:obj:`tuple`): The (box cell, direction) of the push that led to the state.
+
+        Returns:
+            :obj:`bool`: True, if the state has been stored, False otherwise.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] <= cost:
+                return False
+        elif len(self._entries) >= self._maxEntries:
+            return False
+
+        self._entries[key] = (cost, parent, push)
+        return True
+
+    def IsFull(self):
+        """
+        Returns:
+            :obj:`bool`: True, if no more states can be stored.
+        """
+        return len(self._entries) >= self._maxEntries
@@ -0,0 +1,60 @@
+"""
+    mtxPython - A framework to create matrix games.
+    Copyright (C) 2016  Tobias Stampfl <info@matrixgames.rocks>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation in version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import random
+
+
+class ZobristTable():
+    """
+    Random 64 bit keys for Zobrist hashing of push puzzle states. The hash of a state is the XOR
+    of the keys of all occupied cells, so moving a box from one cell to another only needs two
+    XOR operations.
+    """
+
+    def __init__(self, size, seed=0):
+        """
+        Parameters:
+            size (:obj:`int`): The number of cells.
+            seed (:obj:`int`): The seed of the random keys.
+        """
+        rnd = random.Random(seed)
+        self.boxKeys = [rnd.getrandbits(64) for _ in range(size)]
+        self.playerKeys = [rnd.getrandbits(64) for _ in range(size)]
+
+    def Hash(self, player, boxes):
+        """
+        Parameters:
+            player (:obj:`int`): The index of the cell of the player.
+            boxes (:obj:`iterable`): The indices of the cells of the boxes.
+
+        Returns:
+            :obj:`int`: The hash of the state.
+        """
+        return self.HashBoxes(boxes) ^ self.playerKeys[player]
+
+    def HashBoxes(self, boxes):
+        """
+        Parameters:
+            boxes (:obj:`iterable`): The indices of the cells of the boxes.
+
+        Returns:
+            :obj:`int`: The hash of the boxes alone.
+        """
+        h = 0
+        for box in boxes:
+            h ^= self.boxKeys[box]
+        return h
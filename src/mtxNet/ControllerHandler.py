@@ -15,23 +15,50 @@
     along with this program. If not, see <http://www.gnu.org/licenses/>.
 """
 
+import concurrent.futures
 import itertools
 import logging
+from threading import Lock
 
+import mtx
 from .RendererClient import RendererClient
+from .Session import Session
 from .controllerService.ttypes import GameInfo, GameError
 
 
 class ControllerHandler():
+    """
+    Handles the calls of the controller service. The calls without a session id control the
+    game of the given game console. Besides that, any number of sessions can be created, each
+    with its own game console, game and renderers (see :class:`mtxNet.Session`), so one process
+    can host many independent games.
+    """
 
     __NEW_RENDERER_ID__ = itertools.count()
+    __NEW_SESSION_ID__ = itertools.count(1)
 
-    def __init__(self, gameConsole, gameLoader):
+    #: The maximum time in seconds a call that returns a result waits for the game thread to
+    #: execute its command. A command that times out is cancelled, unless it is already running.
+    COMMAND_TIMEOUT = 10.0
+
+    def __init__(self, gameConsole, gameLoader, consoleFactory=mtx.GameConsole):
+        """
+        Parameters:
+            gameConsole (:class:`mtx.GameConsole`): The console of the calls without a session.
+            gameLoader (:class:`mtx.GameLoader`): The loader of the available games.
+            consoleFactory (:obj:`callable`): Returns a new game console for each session.
+        """
         self._gameConsole = gameConsole
         self._gameLoader = gameLoader
+        self._consoleFactory = consoleFactory
 
         self._renderers = {}
 
+        # The sessions by id. The lock only guards the dictionary, the calls on a session are
+        # executed by the thread that runs its game console.
+        self._sessions = {}
+        self._sessionsLock = Lock()
+
     def Ping(self):
         pass
 
@@ -39,24 +66,35 @@ class ControllerHandler():
         #logging.info('Renderer connected: %s@%s' % (port, host))
         print('Renderer connected: %s@%s' % (port, host))
         renderer = RendererClient(host, port)
-        if renderer.Connect():
-            rendererId = next(self.__NEW_RENDERER_ID__)
-            self._renderers[rendererId] = renderer
-            self._gameConsole.RegisterRenderer(renderer)
-        else:
-            rendererId = -1
+        if not renderer.Connect():
+            return -1
 
+        # The renderer only gets an id, if the game thread has registered it.
+        try:
+            self._Wait(self._gameConsole.Submit(self._gameConsole.RegisterRenderer, renderer))
+        except GameError as e:
+            logging.error("Renderer %s@%s could not be registered: %s" % (port, host, e.errorMessage))
+            renderer.Disconnect()
+            return -1
+
+        rendererId = next(self.__NEW_RENDERER_ID__)
+        self._renderers[rendererId] = renderer
         return rendererId
 
     def DisconnectRenderer(self, rendererId):
-        renderer = self._renderers.get(rendererId)
+        renderer = self._renderers.pop(rendererId, None)
 
         if renderer is not None:
             #logging.info('Renderer disconnected: %s@%s' % (renderer.GetPort(), renderer.GetHost()))
             print('Renderer disconnected: %s@%s' % (renderer.GetPort(), renderer.GetHost()))
-            renderer.Disconnect()
+            self._Post(self._gameConsole.Submit(self._RemoveRenderer, renderer))
+
+    def _RemoveRenderer(self, renderer):
+        # The renderer is disconnected after the game thread has stopped using it.
+        try:
             self._gameConsole.UnregisterRenderer(renderer)
-            del self._renderers[rendererId]
+        finally:
+            renderer.Disconnect()
 
     def DisconnectAllRenderer(self):
         for rendererId in list(self._renderers):
@@ -72,9 +110,15 @@ class ControllerHandler():
 
     def LoadGame(self, name):
         gameClass = self._GetGameClass(name)
+        self._Wait(self._gameConsole.Submit(self._LoadGame, gameClass))
+
+    def _LoadGame(self, gameClass):
         self._gameConsole.LoadGame(gameClass())
 
     def ReloadGame(self):
+        self._Post(self._gameConsole.Submit(self._ReloadGame))
+
+    def _ReloadGame(self):
         idx = -1
         game = self._gameConsole.GetGame()
 
@@ -90,13 +134,121 @@ class ControllerHandler():
             self._gameConsole.LoadGame(gameClass())
 
     def MovePlayer(self, number, direction):
-        self._gameConsole.MovePlayer(number, direction)
+        self._Post(self._gameConsole.Submit(self._gameConsole.MovePlayer, number, direction))
 
     def JumpPlayer(self, number, direction):
-        self._gameConsole.JumpPlayer(number, direction)
+        self._Post(self._gameConsole.Submit(self._gameConsole.JumpPlayer, number, direction))
 
     def ResetLevel(self):
-        self._gameConsole.ResetLevel()
+        self._Post(self._gameConsole.Submit(self._gameConsole.ResetLevel))
+
+    def _Post(self, future):
+        # Calls without a result don't wait for the game thread, so a server thread is not
+        # blocked until the next tick. Errors of the command are logged instead.
+        future.add_done_callback(self._LogCommandError)
+
+    @staticmethod
+    def _LogCommandError(future):
+        if not future.cancelled() and future.exception() is not None:
+            logging.error("Command of the controller failed...", exc_info=future.exception())
+
+    def _Wait(self, future):
+        try:
+            return future.result(self.COMMAND_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            if future.cancel():
+                raise GameError('The game did not execute the command in time.')
+            return future.result()
+
+    def CreateSession(self, name):
+        gameClass = self._GetGameClass(name)
+        session = Session(next(self.__NEW_SESSION_ID__), self._consoleFactory(), gameClass())
+
+        with self._sessionsLock:
+            self._sessions[session.GetId()] = session
+
+        return session.GetId()
+
+    def JoinSession(self, sessionId):
+        return self._Wait(self._GetSession(sessionId).Join())
+
+    def LeaveSession(self, sessionId, number):
+        self._Wait(self._GetSession(sessionId).Leave(number))
+
+    def DestroySession(self, sessionId):
+        # The session is idled until its game has been stopped.
+        self._Wait(self._GetSession(sessionId).Destroy())
+
+        with self._sessionsLock:
+            self._sessions.pop(sessionId, None)
+
+    def DestroyAllSessions(self):
+        """
+        Destroys all sessions, e.g. when the server shuts down. The commands of the sessions are
+        executed by the calling thread, so the game consoles of the sessions must no longer be
+        idled by another thread.
+        """
+        with self._sessionsLock:
+            sessions = list(self._sessions.values())
+            self._sessions = {}
+
+        for session in sessions:
+            session.Destroy()
+            session.GetGameConsole().ProcessCommands()
+
+    def GetSessions(self):
+        with self._sessionsLock:
+            return sorted(self._sessions)
+
+    def ConnectSessionRenderer(self, sessionId, host, port):
+        session = self._GetSession(sessionId)
+
+        renderer = RendererClient(host, port)
+        if not renderer.Connect():
+            return -1
+
+        try:
+            rendererId = self._Wait(session.AddRenderer(renderer))
+        except GameError as e:
+            logging.error("Renderer %s@%s could not be registered: %s" % (port, host, e.errorMessage))
+            renderer.Disconnect()
+            return -1
+
+        logging.info("Renderer %d connected to session %d: %s@%s" %
+                     (rendererId, sessionId, port, host))
+        return rendererId
+
+    def DisconnectSessionRenderer(self, sessionId, rendererId):
+        session = self._GetSession(sessionId)
+
+        logging.info("Renderer %d disconnected from session %d" % (rendererId, sessionId))
+        self._Post(session.RemoveRenderer(rendererId))
+
+    def SessionMovePlayer(self, sessionId, number, direction):
+        self._Post(self._GetSession(sessionId).MovePlayer(number, direction))
+
+    def SessionJumpPlayer(self, sessionId, number, direction):
+        self._Post(self._GetSession(sessionId).JumpPlayer(number, direction))
+
+    def SessionResetLevel(self, sessionId):
+        self._Post(self._GetSession(sessionId).ResetLevel())
+
+    def IdleSessions(self):
+        """
+        Calls :meth:`mtx.GameConsole.Idle` for the game console of each session. It has to be
+        called regularly by the main loop, like the idle call of the game console without session.
+        """
+        with self._sessionsLock:
+            sessions = list(self._sessions.values())
+
+        for session in sessions:
+            session.Idle()
+
+    def _GetSession(self, sessionId):
+        session = self._sessions.get(sessionId)
+        if session is None:
+            raise GameError('A session with the id %d does not exist.' % sessionId)
+        return session
 
     def _GetGameClass(self, name):
         game = self._gameLoader.GetGameClass(name)
@@ -26,14 +26,37 @@ from thrift.protocol import TBinaryProtocol
 from thrift.server import TServer
 
 from .controllerService import ControllerService
+from .NonblockingServer import NonblockingServer
 
 
 class ControllerServer():
 
-    def __init__(self, port, handler):
+    def __init__(self, port, handler, nonblocking=False, workers=4, maxQueuedRequests=256):
+        """
+        Parameters:
+            port (:obj:`int`): The port of the server.
+            handler (:class:`mtxNet.ControllerHandler`): The handler of the service calls.
+            nonblocking (:obj:`bool`): True, to serve all connections by one event loop and a
+                pool of worker threads (see :class:`mtxNet.NonblockingServer`), which requires
+                the clients to use the framed transport. False, to serve each connection by its
+                own thread with the buffered transport.
+            workers (:obj:`int`): The number of worker threads of the nonblocking server. With 0
+                workers the requests are processed by the event loop itself, which is the fastest
+                mode, as long as no handler call blocks. The calls of
+                :class:`mtxNet.ControllerHandler` that don't return a result only queue their
+                command for the game thread, but calls like `LoadGame`, `ConnectRenderer` or
+                `JoinSession` wait for the next tick of the game, which stalls all connections
+                in this mode.
+            maxQueuedRequests (:obj:`int`): The maximum number of requests the nonblocking server
+                queues for its workers, before it stops reading from the connections.
+        """
         self._port = port
         self._handler = handler
         self._active = Event()
+        self._nonblocking = nonblocking
+        self._workers = workers
+        self._maxQueuedRequests = maxQueuedRequests
+        self._server = None
 
     def Run(self, blocking=False):
         self._active.set()
@@ -50,9 +73,28 @@ class ControllerServer():
 
     def Stop(self):
         self._active.clear()
+        if self._nonblocking and self._server is not None:
+            self._server.Stop()
+
+    def GetStats(self):
+        """
+        Returns:
+            :obj:`dict` or :obj:`None`: The statistics of the nonblocking server (see
+            :meth:`mtxNet.NonblockingServer.GetStats`) or None for the threaded server.
+        """
+        if self._nonblocking and self._server is not None:
+            return self._server.GetStats()
+        return None
 
     def _ServerThread(self):
         processor = ControllerService.Processor(self._handler)
+
+        if self._nonblocking:
+            self._server = NonblockingServer(processor, "0.0.0.0", self._port, self._workers,
+                                             self._maxQueuedRequests)
+            self._server.Serve()
+            return
+
         transport = TSocket.TServerSocket(host="0.0.0.0", port=self._port)
         tfactory = TTransport.TBufferedTransportFactory()
         pfactory = TBinaryProtocol.TBinaryProtocolFactory()
@@ -0,0 +1,352 @@
+"""
+    mtxPython - A framework to create matrix games.
+    Copyright (C) 2016  Tobias Stampfl <info@matrixgames.rocks>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation in version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import collections
+import logging
+import queue
+import selectors
+import socket
+import struct
+from threading import Thread, Lock
+
+from thrift.transport import TTransport
+from thrift.protocol import TBinaryProtocol
+
+_FRAME_HEADER = struct.Struct('!i')
+
+
+class _Connection():
+
+    def __init__(self, sock):
+        self.socket = sock
+        self.readBuffer = bytearray()
+        self.writeBuffer = None
+        self.events = 0
+        self.closed = False
+
+
+class NonblockingServer():
+    """
+    Thrift server that handles all connections with a single event loop (see :mod:`selectors`)
+    and processes the requests with a fixed number of worker threads, so the number of threads
+    doesn't grow with the number of connections. The clients have to use the framed transport
+    (:class:`thrift.transport.TTransport.TFramedTransport`).
+
+    Each connection has at most one request in progress, the next request of a connection is
+    read after the response to the previous one has been sent. At most `maxQueuedRequests`
+    requests are queued for or processed by the workers. Further complete requests are held back
+    and neither new data is read from their connections nor new connections are accepted, until
+    the workers have caught up. So the clients are slowed down by the flow control of TCP instead
+    of the server buffering an unbounded backlog.
+    """
+
+    def __init__(self, processor, host='0.0.0.0', port=9090, workers=4, maxQueuedRequests=256,
+                 maxFrameSize=16 * 1024 * 1024, protocolFactory=None):
+        """
+        Parameters:
+            processor (:class:`thrift.Thrift.TProcessor`): The processor of the service.
+            host (:obj:`str`): The address to listen on.
+            port (:obj:`int`): The port to listen on.
+            workers (:obj:`int`): The number of worker threads. With 0 workers the requests are
+                processed by the event loop itself, so a blocking call delays all connections.
+            maxQueuedRequests (:obj:`int`): The maximum number of requests that are queued for or
+                processed by the workers.
+            maxFrameSize (:obj:`int`): The maximum size of a request in bytes. Connections that
+                send larger requests are closed.
+            protocolFactory: The factory of the protocols, by default the binary protocol.
+
+        Raises:
+            :obj:`ValueError`: If `workers` is negative or `maxQueuedRequests` is less than 1.
+        """
+        if workers < 0 or maxQueuedRequests < 1:
+            raise ValueError("The number of workers must not be negative and at least one "
+                             "request has to be queued.")
+
+        self._processor = processor
+        self._host = host
+        self._port = port
+        self._workerCount = workers
+        self._maxQueuedRequests = maxQueuedRequests
+        self._maxFrameSize = maxFrameSize
+        self._protocolFactory = protocolFactory or TBinaryProtocol.TBinaryProtocolFactory()
+
+        self._active = True
+        self._selector = None
+        self._listenSocket = None
+        self._accepting = False
+        self._connections = set()
+
+        # Requests waiting for or being processed by a worker, requests held back because of
+        # too many queued requests and the results of the workers for the event loop.
+        self._tasks = queue.Queue()
+        self._queued = 0
+        self._waiting = collections.deque()
+        self._done = collections.deque()
+        self._doneLock = Lock()
+        self._wakeupReader, self._wakeupWriter = socket.socketpair()
+
+        self._processed = 0
+
+    def GetStats(self):
+        """
+        Returns:
+            :obj:`dict`: The number of open `connections`, the number of `queued` and `waiting`
+            requests and the number of `processed` requests.
+        """
+        return {'connections': len(self._connections),
+                'queued':      self._queued,
+                'waiting':     len(self._waiting),
+                'processed':   self._processed}
+
+    def Serve(self):
+        """
+        Runs the event loop until :meth:`Stop` is called.
+        """
+        self._listenSocket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listenSocket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listenSocket.bind((self._host, self._port))
+        self._listenSocket.listen(1024)
+        self._listenSocket.setblocking(False)
+        self._wakeupReader.setblocking(False)
+        self._wakeupWriter.setblocking(False)
+
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._wakeupReader, selectors.EVENT_READ, None)
+        self._PauseAccepting(False)
+
+        workers = [Thread(target=self._Worker) for _ in range(self._workerCount)]
+        for worker in workers:
+            worker.daemon = True
+            worker.start()
+
+        try:
+            while self._active:
+                for key, events in self._selector.select():
+                    if key.fileobj is self._wakeupReader:
+                        self._HandleResults()
+                    elif key.fileobj is self._listenSocket:
+                        self._Accept()
+                    elif events & selectors.EVENT_READ:
+                        self._Read(key.data)
+                    elif events & selectors.EVENT_WRITE:
+                        if self._Write(key.data):
+                            self._Dispatch(key.data)
+        finally:
+            for connection in list(self._connections):
+                self._Close(connection)
+            for worker in workers:
+                self._tasks.put(None)
+            self._selector.close()
+            self._listenSocket.close()
+
+    def Stop(self):
+        """
+        Stops the event loop. It can be called from any thread.
+        """
+        self._active = False
+        self._Wakeup()
+
+    def _Wakeup(self):
+        try:
+            self._wakeupWriter.send(b'\0')
+        except (BlockingIOError, InterruptedError):
+            # The event loop has not read the previous wake-ups yet.
+            pass
+
+    def _PauseAccepting(self, pause):
+        if pause and self._accepting:
+            self._selector.unregister(self._listenSocket)
+        elif not pause and not self._accepting:
+            self._selector.register(self._listenSocket, selectors.EVENT_READ, None)
+        self._accepting = not pause
+
+    def _SetEvents(self, connection, events):
+        if connection.events == events:
+            return
+        if events == 0:
+            self._selector.unregister(connection.socket)
+        elif connection.events == 0:
+            self._selector.register(connection.socket, events, connection)
+        else:
+            self._selector.modify(connection.socket, events, connection)
+        connection.events = events
+
+    def _Accept(self):
+        while True:
+            try:
+                sock, address = self._listenSocket.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                logging.error("Could not accept a connection...", exc_info=1)
+                return
+
+            sock.setblocking(False)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            connection = _Connection(sock)
+            self._connections.add(connection)
+            self._SetEvents(connection, selectors.EVENT_READ)
+
+    def _Close(self, connection):
+        if not connection.closed:
+            self._SetEvents(connection, 0)
+            connection.closed = True
+            connection.socket.close()
+            self._connections.discard(connection)
+
+    def _Read(self, connection):
+        try:
+            data = connection.socket.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b''
+
+        if not data:
+            self._Close(connection)
+            return
+
+        connection.readBuffer += data
+        self._Dispatch(connection)
+
+    def _Dispatch(self, connection):
+        # Handles the complete requests in the read buffer of an idle connection. Without
+        # workers the requests are processed right away, otherwise the next request is handed
+        # over to the workers and the connection waits for the result.
+        while True:
+            frame = self._NextFrame(connection)
+            if frame is None:
+                if not connection.closed:
+                    self._SetEvents(connection, selectors.EVENT_READ)
+                return
+
+            if self._workerCount > 0:
+                self._SetEvents(connection, 0)
+                if self._queued < self._maxQueuedRequests:
+                    self._queued += 1
+                    self._tasks.put((connection, frame))
+                else:
+                    self._waiting.append((connection, frame))
+                    self._PauseAccepting(True)
+                return
+
+            self._processed += 1
+            if not self._SendResponse(connection, self._Process(frame)):
+                return
+
+    def _NextFrame(self, connection):
+        buffer = connection.readBuffer
+        if len(buffer) < _FRAME_HEADER.size:
+            return None
+
+        size, = _FRAME_HEADER.unpack_from(buffer, 0)
+        if size < 0 or size > self._maxFrameSize:
+            logging.error("Request of %d bytes exceeds the maximum frame size..." % size)
+            self._Close(connection)
+            return None
+
+        end = _FRAME_HEADER.size + size
+        if len(buffer) < end:
+            return None
+
+        frame = bytes(buffer[_FRAME_HEADER.size:end])
+        del buffer[:end]
+        return frame
+
+    def _Write(self, connection):
+        # Returns True, if the whole response has been sent.
+        try:
+            sent = connection.socket.send(connection.writeBuffer)
+        except (BlockingIOError, InterruptedError):
+            sent = 0
+        except OSError:
+            self._Close(connection)
+            return False
+
+        connection.writeBuffer = connection.writeBuffer[sent:]
+        if len(connection.writeBuffer) > 0:
+            self._SetEvents(connection, selectors.EVENT_WRITE)
+            return False
+
+        connection.writeBuffer = None
+        return True
+
+    def _SendResponse(self, connection, response):
+        # Returns True, if the connection is ready for the next request. One-way calls have an
+        # empty response, which is not sent.
+        if response is None:
+            self._Close(connection)
+            return False
+        if len(response) == 0:
+            return True
+
+        connection.writeBuffer = memoryview(_FRAME_HEADER.pack(len(response)) + response)
+        return self._Write(connection)
+
+    def _HandleResults(self):
+        try:
+            while self._wakeupReader.recv(4096):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+
+        with self._doneLock:
+            done = list(self._done)
+            self._done.clear()
+
+        for connection, response in done:
+            self._queued -= 1
+            self._processed += 1
+            if not connection.closed and self._SendResponse(connection, response):
+                self._Dispatch(connection)
+
+        while len(self._waiting) > 0 and self._queued < self._maxQueuedRequests:
+            connection, frame = self._waiting.popleft()
+            if not connection.closed:
+                self._queued += 1
+                self._tasks.put((connection, frame))
+
+        if len(self._waiting) == 0:
+            self._PauseAccepting(False)
+
+    def _Process(self, frame):
+        inputTransport = TTransport.TMemoryBuffer(frame)
+        outputTransport = TTransport.TMemoryBuffer()
+        try:
+            self._processor.process(self._protocolFactory.getProtocol(inputTransport),
+                                    self._protocolFactory.getProtocol(outputTransport))
+            return outputTransport.getvalue()
+        except Exception:
+            logging.error("Could not process a request...", exc_info=1)
+            return None
+
+    def _Worker(self):
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                return
+
+            connection, frame = task
+            response = self._Process(frame)
+
+            # The event loop only has to be woken up, if it has not been woken up for the
+            # previous results yet.
+            with self._doneLock:
+                wakeup = len(self._done) == 0
+                self._done.append((connection, response))
+            if wakeup:
+                self._Wakeup()
@@ -19,9 +19,10 @@ import logging
 
 import mtx
 from .rendererService import RendererService
-from .rendererService.ttypes import LevelInfo, Value
+from .rendererService.constants import PROTOCOL_VERSION
+from .rendererService.ttypes import LevelInfo, Value, Act, ActType
 
-from thrift.Thrift import TException
+from thrift.Thrift import TException, TApplicationException
 from thrift.transport import TSocket
 from thrift.transport import TTransport
 from thrift.protocol import TBinaryProtocol
@@ -29,13 +30,23 @@ from thrift.protocol import TBinaryProtocol
 
 class RendererClient(mtx.Renderer):
 
-    def __init__(self, host, port):
-        self._transport = TSocket.TSocket(host, port)
+    def __init__(self, host, port, batched=True):
+        """
+        Parameters:
+            host (:obj:`str`): The host of the renderer.
+            port (:obj:`int`): The port of the renderer.
+            batched (:obj:`bool`): True, if a whole act group should be sent to the renderer with
+                a single one-way call, if the renderer supports it. False, to always send one call
+                per act.
+        """
+        self._transport = TTransport.TBufferedTransport(TSocket.TSocket(host, port))
         protocol = TBinaryProtocol.TBinaryProtocol(self._transport)
         self._client = RendererService.Client(protocol)
         self._connected = False
         self._host = host
         self._port = port
+        self._batched = batched
+        self._protocolVersion = 0
 
     def GetHost(self):
         return self._host
@@ -50,6 +61,9 @@ class RendererClient(mtx.Renderer):
         except TTransport.TTransportException:
             self._connected = False
 
+        if self._connected:
+            self._protocolVersion = self._RequestProtocolVersion()
+
         return self._connected
 
     def Disconnect(self):
@@ -59,6 +73,27 @@ class RendererClient(mtx.Renderer):
     def IsConnected(self):
         return self._connected
 
+    def IsBatched(self):
+        """
+        Returns:
+            :obj:`bool`: True, if act groups are sent with a single one-way call, False otherwise.
+        """
+        return self._batched and self._protocolVersion >= 1
+
+    def _RequestProtocolVersion(self):
+        # Renderers that were built against an older service definition don't know the method
+        # and answer with an exception. Those renderers only understand the per act calls.
+        try:
+            return min(self._client.GetProtocolVersion(), PROTOCOL_VERSION)
+        except TApplicationException as e:
+            if e.type != TApplicationException.UNKNOWN_METHOD:
+                logging.error("Could not request the protocol version of the renderer client...", exc_info=1)
+            return 0
+        except TException:
+            logging.error("Connection to renderer client lost...", exc_info=1)
+            self.Disconnect()
+            return 0
+
     def _CallClientCommand(self, cmd, *args, **kwargs):
         if not self._connected:
             return False
@@ -70,6 +105,54 @@ class RendererClient(mtx.Renderer):
             self.Disconnect()
 
     def ProcessActGroup(self, actGrp):
+        if self.IsBatched():
+            self._ProcessActGroupBatched(actGrp)
+        else:
+            self._ProcessActGroupSingle(actGrp)
+
+    def _ProcessActGroupBatched(self, actGrp):
+        packed = self._protocolVersion >= 2
+        acts = []
+
+        for act in actGrp:
+            if act.id == mtx.Act.CLEAR:
+                acts.append(Act(ActType.CLEAR))
+            elif act.id == mtx.Act.LOAD_LEVEL:
+                if packed:
+                    acts.append(Act(ActType.LOAD_LEVEL, packedField=act.GetPackedField(),
+                                    levelInfo=self._GetLevelInfo(act.level)))
+                else:
+                    acts.append(Act(ActType.LOAD_LEVEL, field=self._GetNetField(act),
+                                    levelInfo=self._GetLevelInfo(act.level)))
+            elif act.id == mtx.Act.RESET_LEVEL:
+                if packed:
+                    # Only the cells that differ from the current state of the renderer are
+                    # sent, if they are known.
+                    packedCells = act.GetPackedCells()
+                    if packedCells is not None:
+                        acts.append(Act(ActType.RESET_LEVEL, packedCells=packedCells))
+                    else:
+                        acts.append(Act(ActType.RESET_LEVEL, packedField=act.GetPackedField()))
+                else:
+                    acts.append(Act(ActType.RESET_LEVEL, field=self._GetNetField(act)))
+            elif act.id == mtx.Act.UPDATE:
+                acts.append(Act(ActType.UPDATE, act.objId, key=act.key, value=self._GetValue(act.value)))
+            elif act.id == mtx.Act.SPAWN:
+                acts.append(Act(ActType.SPAWN, act.objId, symbol=ord(act.symbol), positionX=act.x,
+                                positionY=act.y))
+            elif act.id == mtx.Act.REMOVE:
+                acts.append(Act(ActType.REMOVE, act.objId, act.sourceId))
+            elif act.id == mtx.Act.COLLECT:
+                acts.append(Act(ActType.COLLECT, act.objId, act.sourceId))
+            elif act.id in mtx.Act.MOTION:
+                actType = ActType.MOVE if act.id == mtx.Act.MOVE else ActType.JUMP
+                acts.append(Act(actType, act.objId, direction=act.direction, fromX=act.fromX,
+                                fromY=act.fromY, toX=act.toX, toY=act.toY))
+
+        if len(acts) > 0:
+            self._CallClientCommand(self._client.ProcessActs, acts)
+
+    def _ProcessActGroupSingle(self, actGrp):
         self._CallClientCommand(self._client.Freeze)
 
         try:
@@ -77,34 +160,14 @@ class RendererClient(mtx.Renderer):
                 if act.id == mtx.Act.CLEAR:
                     self._CallClientCommand(self._client.Clear)
                 elif act.id in mtx.Act.LEVEL:
-
-                    level = act.level
-                    field = level._field
-
-                    netField = []
-                    for y in range(field._height):
-                        row = []
-                        for x in range(field._width):
-                            cell = []
-                            for obj in reversed(field._cells[y][x]):
-                                cell.append([obj._id, ord(obj._symbol)])
-                            row.append(cell)
-                        netField.append(row)
+                    netField = self._GetNetField(act)
 
                     if act.id == mtx.Act.LOAD_LEVEL:
-                        self._CallClientCommand(self._client.LoadLevel, netField, LevelInfo(level._name, level._groundTexture, level._wallTexture))
+                        self._CallClientCommand(self._client.LoadLevel, netField, self._GetLevelInfo(act.level))
                     else:
                         self._CallClientCommand(self._client.ResetLevel, netField)
                 elif act.id == mtx.Act.UPDATE:
-                    if type(act.value) == str:
-                        value = Value(strValue=act.value)
-                    elif type(act.value) == bool:
-                        value = Value(boolValue=act.value)
-                    elif type(act.value) == int:
-                        value = Value(intValue=act.value)
-                    else:
-                        value = Value(doubleValue=act.value)
-                    self._CallClientCommand(self._client.UpdateObject, act.objId, act.key, value)
+                    self._CallClientCommand(self._client.UpdateObject, act.objId, act.key, self._GetValue(act.value))
                 elif act.id == mtx.Act.SPAWN:
                     self._CallClientCommand(self._client.Spawn, act.objId, ord(act.symbol), act.x, act.y)
                 elif act.id == mtx.Act.REMOVE:
@@ -117,3 +180,22 @@ class RendererClient(mtx.Renderer):
                     self._CallClientCommand(self._client.Jump, act.objId, act.direction, act.fromX, act.fromY, act.toX, act.toY)
         finally:
             self._CallClientCommand(self._client.Thaw)
+
+    @staticmethod
+    def _GetNetField(levelAct):
+        return [[[[objId, ord(symbol)] for objId, symbol in cell] for cell in row]
+                for row in levelAct.GetFieldData()]
+
+    @staticmethod
+    def _GetLevelInfo(level):
+        return LevelInfo(level._name, level._groundTexture, level._wallTexture)
+
+    @staticmethod
+    def _GetValue(value):
+        if type(value) == str:
+            return Value(strValue=value)
+        if type(value) == bool:
+            return Value(boolValue=value)
+        if type(value) == int:
+            return Value(intValue=value)
+        return Value(doubleValue=value)
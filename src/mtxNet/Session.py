@@ -0,0 +1,151 @@
+"""
+    mtxPython - A framework to create matrix games.
+    Copyright (C) 2016  Tobias Stampfl <info@matrixgames.rocks>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation in version 3 of the License.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from .controllerService.ttypes import GameError
+
+
+class Session():
+    """
+    A game that is hosted by a :class:`mtxNet.ControllerHandler` side by side with many other
+    games. Each session has its own game console, game and renderers, so the games of different
+    sessions progress independently.
+
+    Like the calls of the handler without a session, the calls of a session are queued as
+    commands for the thread that runs its game console (see :meth:`mtx.GameConsole.Submit`), so
+    the console can be idled by any thread, e.g. by a :class:`mtx.GameLoop`. The calls return
+    the future of their command.
+    """
+
+    def __init__(self, sessionId, gameConsole, game):
+        """
+        Parameters:
+            sessionId (:obj:`int`): The id of the session.
+            gameConsole (:class:`mtx.GameConsole`): The console that runs the game. It must not
+                be idled before the session has been created.
+            game (:class:`mtx.Game`): The game of the session, which is loaded immediately.
+        """
+        self._id = sessionId
+        self._gameConsole = gameConsole
+        self._renderers = {}
+        self._maxPlayers = game.GetMaxPlayers()
+
+        # The set is replaced by the game thread, so it can be read by any thread.
+        self._players = frozenset()
+
+        self._gameConsole.LoadGame(game)
+
+    def GetId(self):
+        return self._id
+
+    def GetGameConsole(self):
+        return self._gameConsole
+
+    def GetPlayers(self):
+        """
+        Returns:
+            :obj:`list`: The numbers of the players that have joined the session.
+        """
+        return sorted(self._players)
+
+    def Join(self):
+        """
+        Returns:
+            :class:`concurrent.futures.Future`: The future of the lowest player number that is
+            still free. It raises a :obj:`GameError`, if all players of the game have already
+            joined.
+        """
+        return self._gameConsole.Submit(self._Join)
+
+    def _Join(self):
+        for number in range(1, self._maxPlayers + 1):
+            if number not in self._players:
+                self._players = self._players | {number}
+                return number
+
+        raise GameError('The session %d is full.' % self._id)
+
+    def Leave(self, number):
+        return self._gameConsole.Submit(self._Leave, number)
+
+    def _Leave(self, number):
+        if number not in self._players:
+            raise GameError('Player %d has not joined the session %d.' % (number, self._id))
+        self._players = self._players - {number}
+
+    def AddRenderer(self, renderer):
+        """
+        Parameters:
+            renderer (:class:`mtxNet.RendererClient`): The connected renderer.
+
+        Returns:
+            :class:`concurrent.futures.Future`: The future of the id of the renderer, which is
+            the lowest id that is not used by another renderer of the session.
+        """
+        return self._gameConsole.Submit(self._AddRenderer, renderer)
+
+    def _AddRenderer(self, renderer):
+        # The ids are reused, so they stay small however often renderers reconnect.
+        rendererId = 0
+        while rendererId in self._renderers:
+            rendererId += 1
+
+        self._gameConsole.RegisterRenderer(renderer)
+        self._renderers[rendererId] = renderer
+        return rendererId
+
+    def RemoveRenderer(self, rendererId):
+        return self._gameConsole.Submit(self._RemoveRenderer, rendererId)
+
+    def _RemoveRenderer(self, rendererId):
+        renderer = self._renderers.pop(rendererId, None)
+        if renderer is not None:
+            # The renderer is disconnected after the game has stopped using it.
+            try:
+                self._gameConsole.UnregisterRenderer(renderer)
+            finally:
+                renderer.Disconnect()
+
+    def MovePlayer(self, number, direction):
+        return self._gameConsole.Submit(self._gameConsole.MovePlayer, number, direction)
+
+    def JumpPlayer(self, number, direction):
+        return self._gameConsole.Submit(self._gameConsole.JumpPlayer, number, direction)
+
+    def ResetLevel(self):
+        return self._gameConsole.Submit(self._gameConsole.ResetLevel)
+
+    def Idle(self):
+        self._gameConsole.Idle()
+
+    def Destroy(self):
+        """
+        Stops the game and disconnects all renderers of the session.
+
+        Returns:
+            :class:`concurrent.futures.Future`: The future of the command.
+        """
+        return self._gameConsole.Submit(self._Destroy)
+
+    def _Destroy(self):
+        self._gameConsole.StopGame()
+        for renderer in self._renderers.values():
+            try:
+                self._gameConsole.UnregisterRenderer(renderer)
+            finally:
+                renderer.Disconnect()
+        self._renderers = {}
+        self._players = frozenset()
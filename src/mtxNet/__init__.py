@@ -16,5 +16,7 @@
 """
 
 from .RendererClient import RendererClient
+from .NonblockingServer import NonblockingServer
 from .ControllerServer import ControllerServer
+from .Session import Session
 from .ControllerHandler import ControllerHandler
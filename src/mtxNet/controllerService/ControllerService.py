@@ -73,6 +73,80 @@ class Iface(object):
     def ResetLevel(self):
         pass
 
+    def CreateSession(self, name):
+        """
+        Parameters:
+         - name
+        """
+        pass
+
+    def JoinSession(self, sessionId):
+        """
+        Parameters:
+         - sessionId
+        """
+        pass
+
+    def LeaveSession(self, sessionId, number):
+        """
+        Parameters:
+         - sessionId
+         - number
+        """
+        pass
+
+    def DestroySession(self, sessionId):
+        """
+        Parameters:
+         - sessionId
+        """
+        pass
+
+    def GetSessions(self):
+        pass
+
+    def ConnectSessionRenderer(self, sessionId, host, port):
+        """
+        Parameters:
+         - sessionId
+         - host
+         - port
+        """
+        pass
+
+    def DisconnectSessionRenderer(self, sessionId, rendererId):
+        """
+        Parameters:
+         - sessionId
+         - rendererId
+        """
+        pass
+
+    def SessionMovePlayer(self, sessionId, number, direction):
+        """
+        Parameters:
+         - sessionId
+         - number
+         - direction
+        """
+        pass
+
+    def SessionJumpPlayer(self, sessionId, number, direction):
+        """
+        Parameters:
+         - sessionId
+         - number
+         - direction
+        """
+        pass
+
+    def SessionResetLevel(self, sessionId):
+        """
+        Parameters:
+         - sessionId
+        """
+        pass
+
 
 class Client(Iface):
     def __init__(self, iprot, oprot=None):
@@ -371,208 +445,419 @@ class Client(Iface):
         iprot.readMessageEnd()
         return
 
+    def CreateSession(self, name):
+        """
+        Parameters:
+         - name
+        """
+        self.send_CreateSession(name)
+        return self.recv_CreateSession()
 
-class Processor(Iface, TProcessor):
-    def __init__(self, handler):
-        self._handler = handler
-        self._processMap = {}
-        self._processMap["Ping"] = Processor.process_Ping
-        self._processMap["ConnectRenderer"] = Processor.process_ConnectRenderer
-        self._processMap["DisconnectRenderer"] = Processor.process_DisconnectRenderer
-        self._processMap["MovePlayer"] = Processor.process_MovePlayer
-        self._processMap["JumpPlayer"] = Processor.process_JumpPlayer
-        self._processMap["GetGames"] = Processor.process_GetGames
-        self._processMap["GetGameInfo"] = Processor.process_GetGameInfo
-        self._processMap["LoadGame"] = Processor.process_LoadGame
-        self._processMap["ReloadGame"] = Processor.process_ReloadGame
-        self._processMap["ResetLevel"] = Processor.process_ResetLevel
+    def send_CreateSession(self, name):
+        self._oprot.writeMessageBegin('CreateSession', TMessageType.CALL, self._seqid)
+        args = CreateSession_args()
+        args.name = name
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
 
-    def process(self, iprot, oprot):
-        (name, type, seqid) = iprot.readMessageBegin()
-        if name not in self._processMap:
-            iprot.skip(TType.STRUCT)
+    def recv_CreateSession(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
             iprot.readMessageEnd()
-            x = TApplicationException(TApplicationException.UNKNOWN_METHOD, 'Unknown function %s' % (name))
-            oprot.writeMessageBegin(name, TMessageType.EXCEPTION, seqid)
-            x.write(oprot)
-            oprot.writeMessageEnd()
-            oprot.trans.flush()
-            return
-        else:
-            self._processMap[name](self, seqid, iprot, oprot)
-        return True
-
-    def process_Ping(self, seqid, iprot, oprot):
-        args = Ping_args()
-        args.read(iprot)
+            raise x
+        result = CreateSession_result()
+        result.read(iprot)
         iprot.readMessageEnd()
-        result = Ping_result()
-        try:
-            self._handler.Ping()
-            msg_type = TMessageType.REPLY
-        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
-            raise
-        except Exception as ex:
-            msg_type = TMessageType.EXCEPTION
-            logging.exception(ex)
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("Ping", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        if result.success is not None:
+            return result.success
+        if result.gameError is not None:
+            raise result.gameError
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "CreateSession failed: unknown result")
 
-    def process_ConnectRenderer(self, seqid, iprot, oprot):
-        args = ConnectRenderer_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = ConnectRenderer_result()
-        try:
-            result.success = self._handler.ConnectRenderer(args.host, args.port)
-            msg_type = TMessageType.REPLY
-        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
-            raise
-        except Exception as ex:
-            msg_type = TMessageType.EXCEPTION
-            logging.exception(ex)
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("ConnectRenderer", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def JoinSession(self, sessionId):
+        """
+        Parameters:
+         - sessionId
+        """
+        self.send_JoinSession(sessionId)
+        return self.recv_JoinSession()
 
-    def process_DisconnectRenderer(self, seqid, iprot, oprot):
-        args = DisconnectRenderer_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = DisconnectRenderer_result()
-        try:
-            self._handler.DisconnectRenderer(args.rendererId)
-            msg_type = TMessageType.REPLY
-        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
-            raise
-        except Exception as ex:
-            msg_type = TMessageType.EXCEPTION
-            logging.exception(ex)
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("DisconnectRenderer", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def send_JoinSession(self, sessionId):
+        self._oprot.writeMessageBegin('JoinSession', TMessageType.CALL, self._seqid)
+        args = JoinSession_args()
+        args.sessionId = sessionId
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
 
-    def process_MovePlayer(self, seqid, iprot, oprot):
-        args = MovePlayer_args()
-        args.read(iprot)
+    def recv_JoinSession(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = JoinSession_result()
+        result.read(iprot)
         iprot.readMessageEnd()
-        result = MovePlayer_result()
-        try:
-            self._handler.MovePlayer(args.number, args.direction)
-            msg_type = TMessageType.REPLY
-        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
-            raise
-        except GameError as gameError:
-            msg_type = TMessageType.REPLY
-            result.gameError = gameError
-        except Exception as ex:
-            msg_type = TMessageType.EXCEPTION
-            logging.exception(ex)
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("MovePlayer", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        if result.success is not None:
+            return result.success
+        if result.gameError is not None:
+            raise result.gameError
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "JoinSession failed: unknown result")
 
-    def process_JumpPlayer(self, seqid, iprot, oprot):
-        args = JumpPlayer_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = JumpPlayer_result()
-        try:
-            self._handler.JumpPlayer(args.number, args.direction)
-            msg_type = TMessageType.REPLY
-        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
-            raise
-        except GameError as gameError:
-            msg_type = TMessageType.REPLY
-            result.gameError = gameError
-        except Exception as ex:
-            msg_type = TMessageType.EXCEPTION
-            logging.exception(ex)
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("JumpPlayer", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def LeaveSession(self, sessionId, number):
+        """
+        Parameters:
+         - sessionId
+         - number
+        """
+        self.send_LeaveSession(sessionId, number)
+        self.recv_LeaveSession()
 
-    def process_GetGames(self, seqid, iprot, oprot):
-        args = GetGames_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = GetGames_result()
-        try:
-            result.success = self._handler.GetGames()
-            msg_type = TMessageType.REPLY
-        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
-            raise
-        except Exception as ex:
-            msg_type = TMessageType.EXCEPTION
-            logging.exception(ex)
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("GetGames", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def send_LeaveSession(self, sessionId, number):
+        self._oprot.writeMessageBegin('LeaveSession', TMessageType.CALL, self._seqid)
+        args = LeaveSession_args()
+        args.sessionId = sessionId
+        args.number = number
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
 
-    def process_GetGameInfo(self, seqid, iprot, oprot):
-        args = GetGameInfo_args()
-        args.read(iprot)
+    def recv_LeaveSession(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = LeaveSession_result()
+        result.read(iprot)
         iprot.readMessageEnd()
-        result = GetGameInfo_result()
-        try:
-            result.success = self._handler.GetGameInfo(args.name)
-            msg_type = TMessageType.REPLY
+        if result.gameError is not None:
+            raise result.gameError
+        return
+
+    def DestroySession(self, sessionId):
+        """
+        Parameters:
+         - sessionId
+        """
+        self.send_DestroySession(sessionId)
+        self.recv_DestroySession()
+
+    def send_DestroySession(self, sessionId):
+        self._oprot.writeMessageBegin('DestroySession', TMessageType.CALL, self._seqid)
+        args = DestroySession_args()
+        args.sessionId = sessionId
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_DestroySession(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = DestroySession_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.gameError is not None:
+            raise result.gameError
+        return
+
+    def GetSessions(self):
+        self.send_GetSessions()
+        return self.recv_GetSessions()
+
+    def send_GetSessions(self):
+        self._oprot.writeMessageBegin('GetSessions', TMessageType.CALL, self._seqid)
+        args = GetSessions_args()
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_GetSessions(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = GetSessions_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "GetSessions failed: unknown result")
+
+    def ConnectSessionRenderer(self, sessionId, host, port):
+        """
+        Parameters:
+         - sessionId
+         - host
+         - port
+        """
+        self.send_ConnectSessionRenderer(sessionId, host, port)
+        return self.recv_ConnectSessionRenderer()
+
+    def send_ConnectSessionRenderer(self, sessionId, host, port):
+        self._oprot.writeMessageBegin('ConnectSessionRenderer', TMessageType.CALL, self._seqid)
+        args = ConnectSessionRenderer_args()
+        args.sessionId = sessionId
+        args.host = host
+        args.port = port
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_ConnectSessionRenderer(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = ConnectSessionRenderer_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.gameError is not None:
+            raise result.gameError
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "ConnectSessionRenderer failed: unknown result")
+
+    def DisconnectSessionRenderer(self, sessionId, rendererId):
+        """
+        Parameters:
+         - sessionId
+         - rendererId
+        """
+        self.send_DisconnectSessionRenderer(sessionId, rendererId)
+        self.recv_DisconnectSessionRenderer()
+
+    def send_DisconnectSessionRenderer(self, sessionId, rendererId):
+        self._oprot.writeMessageBegin('DisconnectSessionRenderer', TMessageType.CALL, self._seqid)
+        args = DisconnectSessionRenderer_args()
+        args.sessionId = sessionId
+        args.rendererId = rendererId
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_DisconnectSessionRenderer(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = DisconnectSessionRenderer_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.gameError is not None:
+            raise result.gameError
+        return
+
+    def SessionMovePlayer(self, sessionId, number, direction):
+        """
+        Parameters:
+         - sessionId
+         - number
+         - direction
+        """
+        self.send_SessionMovePlayer(sessionId, number, direction)
+        self.recv_SessionMovePlayer()
+
+    def send_SessionMovePlayer(self, sessionId, number, direction):
+        self._oprot.writeMessageBegin('SessionMovePlayer', TMessageType.CALL, self._seqid)
+        args = SessionMovePlayer_args()
+        args.sessionId = sessionId
+        args.number = number
+        args.direction = direction
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_SessionMovePlayer(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = SessionMovePlayer_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.gameError is not None:
+            raise result.gameError
+        return
+
+    def SessionJumpPlayer(self, sessionId, number, direction):
+        """
+        Parameters:
+         - sessionId
+         - number
+         - direction
+        """
+        self.send_SessionJumpPlayer(sessionId, number, direction)
+        self.recv_SessionJumpPlayer()
+
+    def send_SessionJumpPlayer(self, sessionId, number, direction):
+        self._oprot.writeMessageBegin('SessionJumpPlayer', TMessageType.CALL, self._seqid)
+        args = SessionJumpPlayer_args()
+        args.sessionId = sessionId
+        args.number = number
+        args.direction = direction
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_SessionJumpPlayer(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = SessionJumpPlayer_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.gameError is not None:
+            raise result.gameError
+        return
+
+    def SessionResetLevel(self, sessionId):
+        """
+        Parameters:
+         - sessionId
+        """
+        self.send_SessionResetLevel(sessionId)
+        self.recv_SessionResetLevel()
+
+    def send_SessionResetLevel(self, sessionId):
+        self._oprot.writeMessageBegin('SessionResetLevel', TMessageType.CALL, self._seqid)
+        args = SessionResetLevel_args()
+        args.sessionId = sessionId
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_SessionResetLevel(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = SessionResetLevel_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.gameError is not None:
+            raise result.gameError
+        return
+
+
+class Processor(Iface, TProcessor):
+    def __init__(self, handler):
+        self._handler = handler
+        self._processMap = {}
+        self._processMap["Ping"] = Processor.process_Ping
+        self._processMap["ConnectRenderer"] = Processor.process_ConnectRenderer
+        self._processMap["DisconnectRenderer"] = Processor.process_DisconnectRenderer
+        self._processMap["MovePlayer"] = Processor.process_MovePlayer
+        self._processMap["JumpPlayer"] = Processor.process_JumpPlayer
+        self._processMap["GetGames"] = Processor.process_GetGames
+        self._processMap["GetGameInfo"] = Processor.process_GetGameInfo
+        self._processMap["LoadGame"] = Processor.process_LoadGame
+        self._processMap["ReloadGame"] = Processor.process_ReloadGame
+        self._processMap["ResetLevel"] = Processor.process_ResetLevel
+        self._processMap["CreateSession"] = Processor.process_CreateSession
+        self._processMap["JoinSession"] = Processor.process_JoinSession
+        self._processMap["LeaveSession"] = Processor.process_LeaveSession
+        self._processMap["DestroySession"] = Processor.process_DestroySession
+        self._processMap["GetSessions"] = Processor.process_GetSessions
+        self._processMap["ConnectSessionRenderer"] = Processor.process_ConnectSessionRenderer
+        self._processMap["DisconnectSessionRenderer"] = Processor.process_DisconnectSessionRenderer
+        self._processMap["SessionMovePlayer"] = Processor.process_SessionMovePlayer
+        self._processMap["SessionJumpPlayer"] = Processor.process_SessionJumpPlayer
+        self._processMap["SessionResetLevel"] = Processor.process_SessionResetLevel
+
+    def process(self, iprot, oprot):
+        (name, type, seqid) = iprot.readMessageBegin()
+        if name not in self._processMap:
+            iprot.skip(TType.STRUCT)
+            iprot.readMessageEnd()
+            x = TApplicationException(TApplicationException.UNKNOWN_METHOD, 'Unknown function %s' % (name))
+            oprot.writeMessageBegin(name, TMessageType.EXCEPTION, seqid)
+            x.write(oprot)
+            oprot.writeMessageEnd()
+            oprot.trans.flush()
+            return
+        else:
+            self._processMap[name](self, seqid, iprot, oprot)
+        return True
+
+    def process_Ping(self, seqid, iprot, oprot):
+        args = Ping_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = Ping_result()
+        try:
+            self._handler.Ping()
+            msg_type = TMessageType.REPLY
         except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
             raise
-        except GameError as gameError:
-            msg_type = TMessageType.REPLY
-            result.gameError = gameError
         except Exception as ex:
             msg_type = TMessageType.EXCEPTION
             logging.exception(ex)
             result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("GetGameInfo", msg_type, seqid)
+        oprot.writeMessageBegin("Ping", msg_type, seqid)
         result.write(oprot)
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
-    def process_LoadGame(self, seqid, iprot, oprot):
-        args = LoadGame_args()
+    def process_ConnectRenderer(self, seqid, iprot, oprot):
+        args = ConnectRenderer_args()
         args.read(iprot)
         iprot.readMessageEnd()
-        result = LoadGame_result()
+        result = ConnectRenderer_result()
         try:
-            self._handler.LoadGame(args.name)
+            result.success = self._handler.ConnectRenderer(args.host, args.port)
             msg_type = TMessageType.REPLY
         except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
             raise
-        except GameError as gameError:
-            msg_type = TMessageType.REPLY
-            result.gameError = gameError
         except Exception as ex:
             msg_type = TMessageType.EXCEPTION
             logging.exception(ex)
             result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("LoadGame", msg_type, seqid)
+        oprot.writeMessageBegin("ConnectRenderer", msg_type, seqid)
         result.write(oprot)
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
-    def process_ReloadGame(self, seqid, iprot, oprot):
-        args = ReloadGame_args()
+    def process_DisconnectRenderer(self, seqid, iprot, oprot):
+        args = DisconnectRenderer_args()
         args.read(iprot)
         iprot.readMessageEnd()
-        result = ReloadGame_result()
+        result = DisconnectRenderer_result()
         try:
-            self._handler.ReloadGame()
+            self._handler.DisconnectRenderer(args.rendererId)
             msg_type = TMessageType.REPLY
         except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
             raise
@@ -580,34 +865,1407 @@ class Processor(Iface, TProcessor):
             msg_type = TMessageType.EXCEPTION
             logging.exception(ex)
             result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("ReloadGame", msg_type, seqid)
+        oprot.writeMessageBegin("DisconnectRenderer", msg_type, seqid)
         result.write(oprot)
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
-    def process_ResetLevel(self, seqid, iprot, oprot):
-        args = ResetLevel_args()
+    def process_MovePlayer(self, seqid, iprot, oprot):
+        args = MovePlayer_args()
         args.read(iprot)
         iprot.readMessageEnd()
-        result = ResetLevel_result()
+        result = MovePlayer_result()
         try:
-            self._handler.ResetLevel()
+            self._handler.MovePlayer(args.number, args.direction)
             msg_type = TMessageType.REPLY
         except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
             raise
+        except GameError as gameError:
+            msg_type = TMessageType.REPLY
+            result.gameError = gameError
         except Exception as ex:
             msg_type = TMessageType.EXCEPTION
             logging.exception(ex)
             result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("ResetLevel", msg_type, seqid)
+        oprot.writeMessageBegin("MovePlayer", msg_type, seqid)
         result.write(oprot)
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
-# HELPER FUNCTIONS AND STRUCTURES
+    def process_JumpPlayer(self, seqid, iprot, oprot):
+        args = JumpPlayer_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = JumpPlayer_result()
+        try:
+            self._handler.JumpPlayer(args.number, args.direction)
+            msg_type = TMessageType.REPLY
+        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
+            raise
+        except GameError as gameError:
+            msg_type = TMessageType.REPLY
+            result.gameError = gameError
+        except Exception as ex:
+            msg_type = TMessageType.EXCEPTION
+            logging.exception(ex)
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("JumpPlayer", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_GetGames(self, seqid, iprot, oprot):
+        args = GetGames_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = GetGames_result()
+        try:
+            result.success = self._handler.GetGames()
+            msg_type = TMessageType.REPLY
+        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as ex:
+            msg_type = TMessageType.EXCEPTION
+            logging.exception(ex)
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("GetGames", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_GetGameInfo(self, seqid, iprot, oprot):
+        args = GetGameInfo_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = GetGameInfo_result()
+        try:
+            result.success = self._handler.GetGameInfo(args.name)
+            msg_type = TMessageType.REPLY
+        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
+            raise
+        except GameError as gameError:
+            msg_type = TMessageType.REPLY
+            result.gameError = gameError
+        except Exception as ex:
+            msg_type = TMessageType.EXCEPTION
+            logging.exception(ex)
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("GetGameInfo", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_LoadGame(self, seqid, iprot, oprot):
+        args = LoadGame_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = LoadGame_result()
+        try:
+            self._handler.LoadGame(args.name)
+            msg_type = TMessageType.REPLY
+        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
+            raise
+        except GameError as gameError:
+            msg_type = TMessageType.REPLY
+            result.gameError = gameError
+        except Exception as ex:
+            msg_type = TMessageType.EXCEPTION
+            logging.exception(ex)
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("LoadGame", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_ReloadGame(self, seqid, iprot, oprot):
+        args = ReloadGame_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = ReloadGame_result()
+        try:
+            self._handler.ReloadGame()
+            msg_type = TMessageType.REPLY
+        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as ex:
+            msg_type = TMessageType.EXCEPTION
+            logging.exception(ex)
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("ReloadGame", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_ResetLevel(self, seqid, iprot, oprot):
+        args = ResetLevel_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = ResetLevel_result()
+        try:
+            self._handler.ResetLevel()
+            msg_type = TMessageType.REPLY
+        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as ex:
+            msg_type = TMessageType.EXCEPTION
+            logging.exception(ex)
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("ResetLevel", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_CreateSession(self, seqid, iprot, oprot):
+        args = CreateSession_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = CreateSession_result()
+        try:
+            result.success = self._handler.CreateSession(args.name)
+            msg_type = TMessageType.REPLY
+        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
+            raise
+        except GameError as gameError:
+            msg_type = TMessageType.REPLY
+            result.gameError = gameError
+        except Exception as ex:
+            msg_type = TMessageType.EXCEPTION
+            logging.exception(ex)
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("CreateSession", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_JoinSession(self, seqid, iprot, oprot):
+        args = JoinSession_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = JoinSession_result()
+        try:
+            result.success = self._handler.JoinSession(args.sessionId)
+            msg_type = TMessageType.REPLY
+        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
+            raise
+        except GameError as gameError:
+            msg_type = TMessageType.REPLY
+            result.gameError = gameError
+        except Exception as ex:
+            msg_type = TMessageType.EXCEPTION
+            logging.exception(ex)
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("JoinSession", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_LeaveSession(self, seqid, iprot, oprot):
+        args = LeaveSession_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = LeaveSession_result()
+        try:
+            self._handler.LeaveSession(args.sessionId, args.number)
+            msg_type = TMessageType.REPLY
+        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
+            raise
+        except GameError as gameError:
+            msg_type = TMessageType.REPLY
+            result.gameError = gameError
+        except Exception as ex:
+            msg_type = TMessageType.EXCEPTION
+            logging.exception(ex)
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("LeaveSession", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_DestroySession(self, seqid, iprot, oprot):
+        args = DestroySession_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = DestroySession_result()
+        try:
+            self._handler.DestroySession(args.sessionId)
+            msg_type = TMessageType.REPLY
+        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
+            raise
+        except GameError as gameError:
+            msg_type = TMessageType.REPLY
+            result.gameError = gameError
+        except Exception as ex:
+            msg_type = TMessageType.EXCEPTION
+            logging.exception(ex)
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("DestroySession", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_GetSessions(self, seqid, iprot, oprot):
+        args = GetSessions_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = GetSessions_result()
+        try:
+            result.success = self._handler.GetSessions()
+            msg_type = TMessageType.REPLY
+        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as ex:
+            msg_type = TMessageType.EXCEPTION
+            logging.exception(ex)
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("GetSessions", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_ConnectSessionRenderer(self, seqid, iprot, oprot):
+        args = ConnectSessionRenderer_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = ConnectSessionRenderer_result()
+        try:
+            result.success = self._handler.ConnectSessionRenderer(args.sessionId, args.host, args.port)
+            msg_type = TMessageType.REPLY
+        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
+            raise
+        except GameError as gameError:
+            msg_type = TMessageType.REPLY
+            result.gameError = gameError
+        except Exception as ex:
+            msg_type = TMessageType.EXCEPTION
+            logging.exception(ex)
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("ConnectSessionRenderer", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_DisconnectSessionRenderer(self, seqid, iprot, oprot):
+        args = DisconnectSessionRenderer_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = DisconnectSessionRenderer_result()
+        try:
+            self._handler.DisconnectSessionRenderer(args.sessionId, args.rendererId)
+            msg_type = TMessageType.REPLY
+        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
+            raise
+        except GameError as gameError:
+            msg_type = TMessageType.REPLY
+            result.gameError = gameError
+        except Exception as ex:
+            msg_type = TMessageType.EXCEPTION
+            logging.exception(ex)
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("DisconnectSessionRenderer", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_SessionMovePlayer(self, seqid, iprot, oprot):
+        args = SessionMovePlayer_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = SessionMovePlayer_result()
+        try:
+            self._handler.SessionMovePlayer(args.sessionId, args.number, args.direction)
+            msg_type = TMessageType.REPLY
+        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
+            raise
+        except GameError as gameError:
+            msg_type = TMessageType.REPLY
+            result.gameError = gameError
+        except Exception as ex:
+            msg_type = TMessageType.EXCEPTION
+            logging.exception(ex)
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("SessionMovePlayer", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_SessionJumpPlayer(self, seqid, iprot, oprot):
+        args = SessionJumpPlayer_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = SessionJumpPlayer_result()
+        try:
+            self._handler.SessionJumpPlayer(args.sessionId, args.number, args.direction)
+            msg_type = TMessageType.REPLY
+        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
+            raise
+        except GameError as gameError:
+            msg_type = TMessageType.REPLY
+            result.gameError = gameError
+        except Exception as ex:
+            msg_type = TMessageType.EXCEPTION
+            logging.exception(ex)
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("SessionJumpPlayer", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_SessionResetLevel(self, seqid, iprot, oprot):
+        args = SessionResetLevel_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = SessionResetLevel_result()
+        try:
+            self._handler.SessionResetLevel(args.sessionId)
+            msg_type = TMessageType.REPLY
+        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
+            raise
+        except GameError as gameError:
+            msg_type = TMessageType.REPLY
+            result.gameError = gameError
+        except Exception as ex:
+            msg_type = TMessageType.EXCEPTION
+            logging.exception(ex)
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("SessionResetLevel", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+# HELPER FUNCTIONS AND STRUCTURES
+
+
+class Ping_args(object):
+
+    thrift_spec = (
+    )
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('Ping_args')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class Ping_result(object):
+
+    thrift_spec = (
+    )
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('Ping_result')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class ConnectRenderer_args(object):
+    """
+    Attributes:
+     - host
+     - port
+    """
+
+    thrift_spec = (
+        None,  # 0
+        (1, TType.STRING, 'host', 'UTF8', None, ),  # 1
+        (2, TType.I32, 'port', None, None, ),  # 2
+    )
+
+    def __init__(self, host=None, port=None,):
+        self.host = host
+        self.port = port
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.host = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.port = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('ConnectRenderer_args')
+        if self.host is not None:
+            oprot.writeFieldBegin('host', TType.STRING, 1)
+            oprot.writeString(self.host.encode('utf-8') if sys.version_info[0] == 2 else self.host)
+            oprot.writeFieldEnd()
+        if self.port is not None:
+            oprot.writeFieldBegin('port', TType.I32, 2)
+            oprot.writeI32(self.port)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class ConnectRenderer_result(object):
+    """
+    Attributes:
+     - success
+    """
+
+    thrift_spec = (
+        (0, TType.I16, 'success', None, None, ),  # 0
+    )
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.I16:
+                    self.success = iprot.readI16()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('ConnectRenderer_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.I16, 0)
+            oprot.writeI16(self.success)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class DisconnectRenderer_args(object):
+    """
+    Attributes:
+     - rendererId
+    """
+
+    thrift_spec = (
+        None,  # 0
+        (1, TType.I16, 'rendererId', None, None, ),  # 1
+    )
+
+    def __init__(self, rendererId=None,):
+        self.rendererId = rendererId
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I16:
+                    self.rendererId = iprot.readI16()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('DisconnectRenderer_args')
+        if self.rendererId is not None:
+            oprot.writeFieldBegin('rendererId', TType.I16, 1)
+            oprot.writeI16(self.rendererId)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class DisconnectRenderer_result(object):
+
+    thrift_spec = (
+    )
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('DisconnectRenderer_result')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class MovePlayer_args(object):
+    """
+    Attributes:
+     - number
+     - direction
+    """
+
+    thrift_spec = (
+        None,  # 0
+        (1, TType.BYTE, 'number', None, None, ),  # 1
+        (2, TType.I32, 'direction', None, None, ),  # 2
+    )
+
+    def __init__(self, number=None, direction=None,):
+        self.number = number
+        self.direction = direction
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.BYTE:
+                    self.number = iprot.readByte()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.direction = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('MovePlayer_args')
+        if self.number is not None:
+            oprot.writeFieldBegin('number', TType.BYTE, 1)
+            oprot.writeByte(self.number)
+            oprot.writeFieldEnd()
+        if self.direction is not None:
+            oprot.writeFieldBegin('direction', TType.I32, 2)
+            oprot.writeI32(self.direction)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class MovePlayer_result(object):
+    """
+    Attributes:
+     - gameError
+    """
+
+    thrift_spec = (
+        None,  # 0
+        (1, TType.STRUCT, 'gameError', (GameError, GameError.thrift_spec), None, ),  # 1
+    )
+
+    def __init__(self, gameError=None,):
+        self.gameError = gameError
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.gameError = GameError()
+                    self.gameError.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('MovePlayer_result')
+        if self.gameError is not None:
+            oprot.writeFieldBegin('gameError', TType.STRUCT, 1)
+            self.gameError.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class JumpPlayer_args(object):
+    """
+    Attributes:
+     - number
+     - direction
+    """
+
+    thrift_spec = (
+        None,  # 0
+        (1, TType.BYTE, 'number', None, None, ),  # 1
+        (2, TType.I32, 'direction', None, None, ),  # 2
+    )
+
+    def __init__(self, number=None, direction=None,):
+        self.number = number
+        self.direction = direction
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.BYTE:
+                    self.number = iprot.readByte()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.direction = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('JumpPlayer_args')
+        if self.number is not None:
+            oprot.writeFieldBegin('number', TType.BYTE, 1)
+            oprot.writeByte(self.number)
+            oprot.writeFieldEnd()
+        if self.direction is not None:
+            oprot.writeFieldBegin('direction', TType.I32, 2)
+            oprot.writeI32(self.direction)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class JumpPlayer_result(object):
+    """
+    Attributes:
+     - gameError
+    """
+
+    thrift_spec = (
+        None,  # 0
+        (1, TType.STRUCT, 'gameError', (GameError, GameError.thrift_spec), None, ),  # 1
+    )
+
+    def __init__(self, gameError=None,):
+        self.gameError = gameError
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.gameError = GameError()
+                    self.gameError.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('JumpPlayer_result')
+        if self.gameError is not None:
+            oprot.writeFieldBegin('gameError', TType.STRUCT, 1)
+            self.gameError.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class GetGames_args(object):
+
+    thrift_spec = (
+    )
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('GetGames_args')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class GetGames_result(object):
+    """
+    Attributes:
+     - success
+    """
+
+    thrift_spec = (
+        (0, TType.LIST, 'success', (TType.STRING, 'UTF8', False), None, ),  # 0
+    )
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype3, _size0) = iprot.readListBegin()
+                    for _i4 in range(_size0):
+                        _elem5 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                        self.success.append(_elem5)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('GetGames_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.LIST, 0)
+            oprot.writeListBegin(TType.STRING, len(self.success))
+            for iter6 in self.success:
+                oprot.writeString(iter6.encode('utf-8') if sys.version_info[0] == 2 else iter6)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class GetGameInfo_args(object):
+    """
+    Attributes:
+     - name
+    """
+
+    thrift_spec = (
+        None,  # 0
+        (1, TType.STRING, 'name', 'UTF8', None, ),  # 1
+    )
+
+    def __init__(self, name=None,):
+        self.name = name
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.name = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('GetGameInfo_args')
+        if self.name is not None:
+            oprot.writeFieldBegin('name', TType.STRING, 1)
+            oprot.writeString(self.name.encode('utf-8') if sys.version_info[0] == 2 else self.name)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class GetGameInfo_result(object):
+    """
+    Attributes:
+     - success
+     - gameError
+    """
+
+    thrift_spec = (
+        (0, TType.STRUCT, 'success', (GameInfo, GameInfo.thrift_spec), None, ),  # 0
+        (1, TType.STRUCT, 'gameError', (GameError, GameError.thrift_spec), None, ),  # 1
+    )
+
+    def __init__(self, success=None, gameError=None,):
+        self.success = success
+        self.gameError = gameError
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = GameInfo()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.gameError = GameError()
+                    self.gameError.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('GetGameInfo_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        if self.gameError is not None:
+            oprot.writeFieldBegin('gameError', TType.STRUCT, 1)
+            self.gameError.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class LoadGame_args(object):
+    """
+    Attributes:
+     - name
+    """
+
+    thrift_spec = (
+        None,  # 0
+        (1, TType.STRING, 'name', 'UTF8', None, ),  # 1
+    )
+
+    def __init__(self, name=None,):
+        self.name = name
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.name = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('LoadGame_args')
+        if self.name is not None:
+            oprot.writeFieldBegin('name', TType.STRING, 1)
+            oprot.writeString(self.name.encode('utf-8') if sys.version_info[0] == 2 else self.name)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class LoadGame_result(object):
+    """
+    Attributes:
+     - gameError
+    """
+
+    thrift_spec = (
+        None,  # 0
+        (1, TType.STRUCT, 'gameError', (GameError, GameError.thrift_spec), None, ),  # 1
+    )
+
+    def __init__(self, gameError=None,):
+        self.gameError = gameError
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.gameError = GameError()
+                    self.gameError.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('LoadGame_result')
+        if self.gameError is not None:
+            oprot.writeFieldBegin('gameError', TType.STRUCT, 1)
+            self.gameError.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class ReloadGame_args(object):
+
+    thrift_spec = (
+    )
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('ReloadGame_args')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class ReloadGame_result(object):
+
+    thrift_spec = (
+    )
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('ReloadGame_result')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
 
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
 
-class Ping_args(object):
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class ResetLevel_args(object):
 
     thrift_spec = (
     )
@@ -630,7 +2288,7 @@ class Ping_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
             return
-        oprot.writeStructBegin('Ping_args')
+        oprot.writeStructBegin('ResetLevel_args')
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -649,7 +2307,7 @@ class Ping_args(object):
         return not (self == other)
 
 
-class Ping_result(object):
+class ResetLevel_result(object):
 
     thrift_spec = (
     )
@@ -672,7 +2330,7 @@ class Ping_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
             return
-        oprot.writeStructBegin('Ping_result')
+        oprot.writeStructBegin('ResetLevel_result')
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -691,22 +2349,19 @@ class Ping_result(object):
         return not (self == other)
 
 
-class ConnectRenderer_args(object):
+class CreateSession_args(object):
     """
     Attributes:
-     - host
-     - port
+     - name
     """
 
     thrift_spec = (
         None,  # 0
-        (1, TType.STRING, 'host', 'UTF8', None, ),  # 1
-        (2, TType.I32, 'port', None, None, ),  # 2
+        (1, TType.STRING, 'name', 'UTF8', None, ),  # 1
     )
 
-    def __init__(self, host=None, port=None,):
-        self.host = host
-        self.port = port
+    def __init__(self, name=None,):
+        self.name = name
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -719,12 +2374,7 @@ class ConnectRenderer_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.host = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
-                if ftype == TType.I32:
-                    self.port = iprot.readI32()
+                    self.name = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
                 else:
                     iprot.skip(ftype)
             else:
@@ -736,14 +2386,10 @@ class ConnectRenderer_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
             return
-        oprot.writeStructBegin('ConnectRenderer_args')
-        if self.host is not None:
-            oprot.writeFieldBegin('host', TType.STRING, 1)
-            oprot.writeString(self.host.encode('utf-8') if sys.version_info[0] == 2 else self.host)
-            oprot.writeFieldEnd()
-        if self.port is not None:
-            oprot.writeFieldBegin('port', TType.I32, 2)
-            oprot.writeI32(self.port)
+        oprot.writeStructBegin('CreateSession_args')
+        if self.name is not None:
+            oprot.writeFieldBegin('name', TType.STRING, 1)
+            oprot.writeString(self.name.encode('utf-8') if sys.version_info[0] == 2 else self.name)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -763,18 +2409,21 @@ class ConnectRenderer_args(object):
         return not (self == other)
 
 
-class ConnectRenderer_result(object):
+class CreateSession_result(object):
     """
     Attributes:
      - success
+     - gameError
     """
 
     thrift_spec = (
-        (0, TType.I16, 'success', None, None, ),  # 0
+        (0, TType.I32, 'success', None, None, ),  # 0
+        (1, TType.STRUCT, 'gameError', (GameError, GameError.thrift_spec), None, ),  # 1
     )
 
-    def __init__(self, success=None,):
+    def __init__(self, success=None, gameError=None,):
         self.success = success
+        self.gameError = gameError
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -786,8 +2435,14 @@ class ConnectRenderer_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.I16:
-                    self.success = iprot.readI16()
+                if ftype == TType.I32:
+                    self.success = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.gameError = GameError()
+                    self.gameError.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -799,10 +2454,14 @@ class ConnectRenderer_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
             return
-        oprot.writeStructBegin('ConnectRenderer_result')
+        oprot.writeStructBegin('CreateSession_result')
         if self.success is not None:
-            oprot.writeFieldBegin('success', TType.I16, 0)
-            oprot.writeI16(self.success)
+            oprot.writeFieldBegin('success', TType.I32, 0)
+            oprot.writeI32(self.success)
+            oprot.writeFieldEnd()
+        if self.gameError is not None:
+            oprot.writeFieldBegin('gameError', TType.STRUCT, 1)
+            self.gameError.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -822,19 +2481,19 @@ class ConnectRenderer_result(object):
         return not (self == other)
 
 
-class DisconnectRenderer_args(object):
+class JoinSession_args(object):
     """
     Attributes:
-     - rendererId
+     - sessionId
     """
 
     thrift_spec = (
         None,  # 0
-        (1, TType.I16, 'rendererId', None, None, ),  # 1
+        (1, TType.I32, 'sessionId', None, None, ),  # 1
     )
 
-    def __init__(self, rendererId=None,):
-        self.rendererId = rendererId
+    def __init__(self, sessionId=None,):
+        self.sessionId = sessionId
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -846,8 +2505,8 @@ class DisconnectRenderer_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.I16:
-                    self.rendererId = iprot.readI16()
+                if ftype == TType.I32:
+                    self.sessionId = iprot.readI32()
                 else:
                     iprot.skip(ftype)
             else:
@@ -859,10 +2518,10 @@ class DisconnectRenderer_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
             return
-        oprot.writeStructBegin('DisconnectRenderer_args')
-        if self.rendererId is not None:
-            oprot.writeFieldBegin('rendererId', TType.I16, 1)
-            oprot.writeI16(self.rendererId)
+        oprot.writeStructBegin('JoinSession_args')
+        if self.sessionId is not None:
+            oprot.writeFieldBegin('sessionId', TType.I32, 1)
+            oprot.writeI32(self.sessionId)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -882,11 +2541,22 @@ class DisconnectRenderer_args(object):
         return not (self == other)
 
 
-class DisconnectRenderer_result(object):
+class JoinSession_result(object):
+    """
+    Attributes:
+     - success
+     - gameError
+    """
 
     thrift_spec = (
+        (0, TType.BYTE, 'success', None, None, ),  # 0
+        (1, TType.STRUCT, 'gameError', (GameError, GameError.thrift_spec), None, ),  # 1
     )
 
+    def __init__(self, success=None, gameError=None,):
+        self.success = success
+        self.gameError = gameError
+
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
             iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
@@ -896,6 +2566,17 @@ class DisconnectRenderer_result(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 0:
+                if ftype == TType.BYTE:
+                    self.success = iprot.readByte()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.gameError = GameError()
+                    self.gameError.read(iprot)
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -905,7 +2586,15 @@ class DisconnectRenderer_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
             return
-        oprot.writeStructBegin('DisconnectRenderer_result')
+        oprot.writeStructBegin('JoinSession_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.BYTE, 0)
+            oprot.writeByte(self.success)
+            oprot.writeFieldEnd()
+        if self.gameError is not None:
+            oprot.writeFieldBegin('gameError', TType.STRUCT, 1)
+            self.gameError.write(oprot)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -924,22 +2613,22 @@ class DisconnectRenderer_result(object):
         return not (self == other)
 
 
-class MovePlayer_args(object):
+class LeaveSession_args(object):
     """
     Attributes:
+     - sessionId
      - number
-     - direction
     """
 
     thrift_spec = (
         None,  # 0
-        (1, TType.BYTE, 'number', None, None, ),  # 1
-        (2, TType.I32, 'direction', None, None, ),  # 2
+        (1, TType.I32, 'sessionId', None, None, ),  # 1
+        (2, TType.BYTE, 'number', None, None, ),  # 2
     )
 
-    def __init__(self, number=None, direction=None,):
+    def __init__(self, sessionId=None, number=None,):
+        self.sessionId = sessionId
         self.number = number
-        self.direction = direction
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -951,13 +2640,13 @@ class MovePlayer_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.BYTE:
-                    self.number = iprot.readByte()
+                if ftype == TType.I32:
+                    self.sessionId = iprot.readI32()
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
-                if ftype == TType.I32:
-                    self.direction = iprot.readI32()
+                if ftype == TType.BYTE:
+                    self.number = iprot.readByte()
                 else:
                     iprot.skip(ftype)
             else:
@@ -969,15 +2658,15 @@ class MovePlayer_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
             return
-        oprot.writeStructBegin('MovePlayer_args')
+        oprot.writeStructBegin('LeaveSession_args')
+        if self.sessionId is not None:
+            oprot.writeFieldBegin('sessionId', TType.I32, 1)
+            oprot.writeI32(self.sessionId)
+            oprot.writeFieldEnd()
         if self.number is not None:
-            oprot.writeFieldBegin('number', TType.BYTE, 1)
+            oprot.writeFieldBegin('number', TType.BYTE, 2)
             oprot.writeByte(self.number)
             oprot.writeFieldEnd()
-        if self.direction is not None:
-            oprot.writeFieldBegin('direction', TType.I32, 2)
-            oprot.writeI32(self.direction)
-            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -996,7 +2685,7 @@ class MovePlayer_args(object):
         return not (self == other)
 
 
-class MovePlayer_result(object):
+class LeaveSession_result(object):
     """
     Attributes:
      - gameError
@@ -1034,7 +2723,7 @@ class MovePlayer_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
             return
-        oprot.writeStructBegin('MovePlayer_result')
+        oprot.writeStructBegin('LeaveSession_result')
         if self.gameError is not None:
             oprot.writeFieldBegin('gameError', TType.STRUCT, 1)
             self.gameError.write(oprot)
@@ -1057,22 +2746,19 @@ class MovePlayer_result(object):
         return not (self == other)
 
 
-class JumpPlayer_args(object):
+class DestroySession_args(object):
     """
     Attributes:
-     - number
-     - direction
+     - sessionId
     """
 
     thrift_spec = (
         None,  # 0
-        (1, TType.BYTE, 'number', None, None, ),  # 1
-        (2, TType.I32, 'direction', None, None, ),  # 2
+        (1, TType.I32, 'sessionId', None, None, ),  # 1
     )
 
-    def __init__(self, number=None, direction=None,):
-        self.number = number
-        self.direction = direction
+    def __init__(self, sessionId=None,):
+        self.sessionId = sessionId
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1084,13 +2770,8 @@ class JumpPlayer_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.BYTE:
-                    self.number = iprot.readByte()
-                else:
-                    iprot.skip(ftype)
-            elif fid == 2:
                 if ftype == TType.I32:
-                    self.direction = iprot.readI32()
+                    self.sessionId = iprot.readI32()
                 else:
                     iprot.skip(ftype)
             else:
@@ -1102,14 +2783,71 @@ class JumpPlayer_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
             return
-        oprot.writeStructBegin('JumpPlayer_args')
-        if self.number is not None:
-            oprot.writeFieldBegin('number', TType.BYTE, 1)
-            oprot.writeByte(self.number)
+        oprot.writeStructBegin('DestroySession_args')
+        if self.sessionId is not None:
+            oprot.writeFieldBegin('sessionId', TType.I32, 1)
+            oprot.writeI32(self.sessionId)
             oprot.writeFieldEnd()
-        if self.direction is not None:
-            oprot.writeFieldBegin('direction', TType.I32, 2)
-            oprot.writeI32(self.direction)
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class DestroySession_result(object):
+    """
+    Attributes:
+     - gameError
+    """
+
+    thrift_spec = (
+        None,  # 0
+        (1, TType.STRUCT, 'gameError', (GameError, GameError.thrift_spec), None, ),  # 1
+    )
+
+    def __init__(self, gameError=None,):
+        self.gameError = gameError
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.gameError = GameError()
+                    self.gameError.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('DestroySession_result')
+        if self.gameError is not None:
+            oprot.writeFieldBegin('gameError', TType.STRUCT, 1)
+            self.gameError.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -1129,19 +2867,59 @@ class JumpPlayer_args(object):
         return not (self == other)
 
 
-class JumpPlayer_result(object):
+class GetSessions_args(object):
+    thrift_spec = (
+    )
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('GetSessions_args')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class GetSessions_result(object):
     """
     Attributes:
-     - gameError
+     - success
     """
 
     thrift_spec = (
-        None,  # 0
-        (1, TType.STRUCT, 'gameError', (GameError, GameError.thrift_spec), None, ),  # 1
+        (0, TType.LIST, 'success', (TType.I32, None, False), None, ),  # 0
     )
 
-    def __init__(self, gameError=None,):
-        self.gameError = gameError
+    def __init__(self, success=None,):
+        self.success = success
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1152,10 +2930,14 @@ class JumpPlayer_result(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 1:
-                if ftype == TType.STRUCT:
-                    self.gameError = GameError()
-                    self.gameError.read(iprot)
+            if fid == 0:
+                if ftype == TType.LIST:
+                    self.success = []
+                    (_etype100, _size101) = iprot.readListBegin()
+                    for _i102 in range(_size101):
+                        _elem103 = iprot.readI32()
+                        self.success.append(_elem103)
+                    iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             else:
@@ -1167,10 +2949,13 @@ class JumpPlayer_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
             return
-        oprot.writeStructBegin('JumpPlayer_result')
-        if self.gameError is not None:
-            oprot.writeFieldBegin('gameError', TType.STRUCT, 1)
-            self.gameError.write(oprot)
+        oprot.writeStructBegin('GetSessions_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.LIST, 0)
+            oprot.writeListBegin(TType.I32, len(self.success))
+            for iter104 in self.success:
+                oprot.writeI32(iter104)
+            oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -1190,11 +2975,26 @@ class JumpPlayer_result(object):
         return not (self == other)
 
 
-class GetGames_args(object):
+class ConnectSessionRenderer_args(object):
+    """
+    Attributes:
+     - sessionId
+     - host
+     - port
+    """
 
     thrift_spec = (
+        None,  # 0
+        (1, TType.I32, 'sessionId', None, None, ),  # 1
+        (2, TType.STRING, 'host', 'UTF8', None, ),  # 2
+        (3, TType.I32, 'port', None, None, ),  # 3
     )
 
+    def __init__(self, sessionId=None, host=None, port=None,):
+        self.sessionId = sessionId
+        self.host = host
+        self.port = port
+
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
             iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
@@ -1204,6 +3004,21 @@ class GetGames_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.I32:
+                    self.sessionId = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.host = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I32:
+                    self.port = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -1213,7 +3028,19 @@ class GetGames_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
             return
-        oprot.writeStructBegin('GetGames_args')
+        oprot.writeStructBegin('ConnectSessionRenderer_args')
+        if self.sessionId is not None:
+            oprot.writeFieldBegin('sessionId', TType.I32, 1)
+            oprot.writeI32(self.sessionId)
+            oprot.writeFieldEnd()
+        if self.host is not None:
+            oprot.writeFieldBegin('host', TType.STRING, 2)
+            oprot.writeString(self.host.encode('utf-8') if sys.version_info[0] == 2 else self.host)
+            oprot.writeFieldEnd()
+        if self.port is not None:
+            oprot.writeFieldBegin('port', TType.I32, 3)
+            oprot.writeI32(self.port)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -1232,18 +3059,21 @@ class GetGames_args(object):
         return not (self == other)
 
 
-class GetGames_result(object):
+class ConnectSessionRenderer_result(object):
     """
     Attributes:
      - success
+     - gameError
     """
 
     thrift_spec = (
-        (0, TType.LIST, 'success', (TType.STRING, 'UTF8', False), None, ),  # 0
+        (0, TType.I16, 'success', None, None, ),  # 0
+        (1, TType.STRUCT, 'gameError', (GameError, GameError.thrift_spec), None, ),  # 1
     )
 
-    def __init__(self, success=None,):
+    def __init__(self, success=None, gameError=None,):
         self.success = success
+        self.gameError = gameError
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1255,13 +3085,14 @@ class GetGames_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.LIST:
-                    self.success = []
-                    (_etype3, _size0) = iprot.readListBegin()
-                    for _i4 in range(_size0):
-                        _elem5 = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
-                        self.success.append(_elem5)
-                    iprot.readListEnd()
+                if ftype == TType.I16:
+                    self.success = iprot.readI16()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.gameError = GameError()
+                    self.gameError.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -1273,13 +3104,14 @@ class GetGames_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
             return
-        oprot.writeStructBegin('GetGames_result')
+        oprot.writeStructBegin('ConnectSessionRenderer_result')
         if self.success is not None:
-            oprot.writeFieldBegin('success', TType.LIST, 0)
-            oprot.writeListBegin(TType.STRING, len(self.success))
-            for iter6 in self.success:
-                oprot.writeString(iter6.encode('utf-8') if sys.version_info[0] == 2 else iter6)
-            oprot.writeListEnd()
+            oprot.writeFieldBegin('success', TType.I16, 0)
+            oprot.writeI16(self.success)
+            oprot.writeFieldEnd()
+        if self.gameError is not None:
+            oprot.writeFieldBegin('gameError', TType.STRUCT, 1)
+            self.gameError.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -1299,19 +3131,22 @@ class GetGames_result(object):
         return not (self == other)
 
 
-class GetGameInfo_args(object):
+class DisconnectSessionRenderer_args(object):
     """
     Attributes:
-     - name
+     - sessionId
+     - rendererId
     """
 
     thrift_spec = (
         None,  # 0
-        (1, TType.STRING, 'name', 'UTF8', None, ),  # 1
+        (1, TType.I32, 'sessionId', None, None, ),  # 1
+        (2, TType.I16, 'rendererId', None, None, ),  # 2
     )
 
-    def __init__(self, name=None,):
-        self.name = name
+    def __init__(self, sessionId=None, rendererId=None,):
+        self.sessionId = sessionId
+        self.rendererId = rendererId
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1323,8 +3158,13 @@ class GetGameInfo_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRING:
-                    self.name = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                if ftype == TType.I32:
+                    self.sessionId = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I16:
+                    self.rendererId = iprot.readI16()
                 else:
                     iprot.skip(ftype)
             else:
@@ -1336,10 +3176,14 @@ class GetGameInfo_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
             return
-        oprot.writeStructBegin('GetGameInfo_args')
-        if self.name is not None:
-            oprot.writeFieldBegin('name', TType.STRING, 1)
-            oprot.writeString(self.name.encode('utf-8') if sys.version_info[0] == 2 else self.name)
+        oprot.writeStructBegin('DisconnectSessionRenderer_args')
+        if self.sessionId is not None:
+            oprot.writeFieldBegin('sessionId', TType.I32, 1)
+            oprot.writeI32(self.sessionId)
+            oprot.writeFieldEnd()
+        if self.rendererId is not None:
+            oprot.writeFieldBegin('rendererId', TType.I16, 2)
+            oprot.writeI16(self.rendererId)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -1359,20 +3203,18 @@ class GetGameInfo_args(object):
         return not (self == other)
 
 
-class GetGameInfo_result(object):
+class DisconnectSessionRenderer_result(object):
     """
     Attributes:
-     - success
      - gameError
     """
 
     thrift_spec = (
-        (0, TType.STRUCT, 'success', (GameInfo, GameInfo.thrift_spec), None, ),  # 0
+        None,  # 0
         (1, TType.STRUCT, 'gameError', (GameError, GameError.thrift_spec), None, ),  # 1
     )
 
-    def __init__(self, success=None, gameError=None,):
-        self.success = success
+    def __init__(self, gameError=None,):
         self.gameError = gameError
 
     def read(self, iprot):
@@ -1384,13 +3226,7 @@ class GetGameInfo_result(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
-            if fid == 0:
-                if ftype == TType.STRUCT:
-                    self.success = GameInfo()
-                    self.success.read(iprot)
-                else:
-                    iprot.skip(ftype)
-            elif fid == 1:
+            if fid == 1:
                 if ftype == TType.STRUCT:
                     self.gameError = GameError()
                     self.gameError.read(iprot)
@@ -1405,11 +3241,7 @@ class GetGameInfo_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
             return
-        oprot.writeStructBegin('GetGameInfo_result')
-        if self.success is not None:
-            oprot.writeFieldBegin('success', TType.STRUCT, 0)
-            self.success.write(oprot)
-            oprot.writeFieldEnd()
+        oprot.writeStructBegin('DisconnectSessionRenderer_result')
         if self.gameError is not None:
             oprot.writeFieldBegin('gameError', TType.STRUCT, 1)
             self.gameError.write(oprot)
@@ -1432,19 +3264,25 @@ class GetGameInfo_result(object):
         return not (self == other)
 
 
-class LoadGame_args(object):
+class SessionMovePlayer_args(object):
     """
     Attributes:
-     - name
+     - sessionId
+     - number
+     - direction
     """
 
     thrift_spec = (
         None,  # 0
-        (1, TType.STRING, 'name', 'UTF8', None, ),  # 1
+        (1, TType.I32, 'sessionId', None, None, ),  # 1
+        (2, TType.BYTE, 'number', None, None, ),  # 2
+        (3, TType.I32, 'direction', None, None, ),  # 3
     )
 
-    def __init__(self, name=None,):
-        self.name = name
+    def __init__(self, sessionId=None, number=None, direction=None,):
+        self.sessionId = sessionId
+        self.number = number
+        self.direction = direction
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1456,8 +3294,18 @@ class LoadGame_args(object):
             if ftype == TType.STOP:
                 break
             if fid == 1:
-                if ftype == TType.STRING:
-                    self.name = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                if ftype == TType.I32:
+                    self.sessionId = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.BYTE:
+                    self.number = iprot.readByte()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I32:
+                    self.direction = iprot.readI32()
                 else:
                     iprot.skip(ftype)
             else:
@@ -1469,10 +3317,18 @@ class LoadGame_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
             return
-        oprot.writeStructBegin('LoadGame_args')
-        if self.name is not None:
-            oprot.writeFieldBegin('name', TType.STRING, 1)
-            oprot.writeString(self.name.encode('utf-8') if sys.version_info[0] == 2 else self.name)
+        oprot.writeStructBegin('SessionMovePlayer_args')
+        if self.sessionId is not None:
+            oprot.writeFieldBegin('sessionId', TType.I32, 1)
+            oprot.writeI32(self.sessionId)
+            oprot.writeFieldEnd()
+        if self.number is not None:
+            oprot.writeFieldBegin('number', TType.BYTE, 2)
+            oprot.writeByte(self.number)
+            oprot.writeFieldEnd()
+        if self.direction is not None:
+            oprot.writeFieldBegin('direction', TType.I32, 3)
+            oprot.writeI32(self.direction)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -1492,7 +3348,7 @@ class LoadGame_args(object):
         return not (self == other)
 
 
-class LoadGame_result(object):
+class SessionMovePlayer_result(object):
     """
     Attributes:
      - gameError
@@ -1530,7 +3386,7 @@ class LoadGame_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
             return
-        oprot.writeStructBegin('LoadGame_result')
+        oprot.writeStructBegin('SessionMovePlayer_result')
         if self.gameError is not None:
             oprot.writeFieldBegin('gameError', TType.STRUCT, 1)
             self.gameError.write(oprot)
@@ -1553,11 +3409,26 @@ class LoadGame_result(object):
         return not (self == other)
 
 
-class ReloadGame_args(object):
+class SessionJumpPlayer_args(object):
+    """
+    Attributes:
+     - sessionId
+     - number
+     - direction
+    """
 
     thrift_spec = (
+        None,  # 0
+        (1, TType.I32, 'sessionId', None, None, ),  # 1
+        (2, TType.BYTE, 'number', None, None, ),  # 2
+        (3, TType.I32, 'direction', None, None, ),  # 3
     )
 
+    def __init__(self, sessionId=None, number=None, direction=None,):
+        self.sessionId = sessionId
+        self.number = number
+        self.direction = direction
+
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
             iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
@@ -1567,6 +3438,21 @@ class ReloadGame_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.I32:
+                    self.sessionId = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.BYTE:
+                    self.number = iprot.readByte()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I32:
+                    self.direction = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -1576,7 +3462,19 @@ class ReloadGame_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
             return
-        oprot.writeStructBegin('ReloadGame_args')
+        oprot.writeStructBegin('SessionJumpPlayer_args')
+        if self.sessionId is not None:
+            oprot.writeFieldBegin('sessionId', TType.I32, 1)
+            oprot.writeI32(self.sessionId)
+            oprot.writeFieldEnd()
+        if self.number is not None:
+            oprot.writeFieldBegin('number', TType.BYTE, 2)
+            oprot.writeByte(self.number)
+            oprot.writeFieldEnd()
+        if self.direction is not None:
+            oprot.writeFieldBegin('direction', TType.I32, 3)
+            oprot.writeI32(self.direction)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -1595,11 +3493,20 @@ class ReloadGame_args(object):
         return not (self == other)
 
 
-class ReloadGame_result(object):
+class SessionJumpPlayer_result(object):
+    """
+    Attributes:
+     - gameError
+    """
 
     thrift_spec = (
+        None,  # 0
+        (1, TType.STRUCT, 'gameError', (GameError, GameError.thrift_spec), None, ),  # 1
     )
 
+    def __init__(self, gameError=None,):
+        self.gameError = gameError
+
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
             iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
@@ -1609,6 +3516,12 @@ class ReloadGame_result(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.gameError = GameError()
+                    self.gameError.read(iprot)
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -1618,7 +3531,11 @@ class ReloadGame_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
             return
-        oprot.writeStructBegin('ReloadGame_result')
+        oprot.writeStructBegin('SessionJumpPlayer_result')
+        if self.gameError is not None:
+            oprot.writeFieldBegin('gameError', TType.STRUCT, 1)
+            self.gameError.write(oprot)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -1637,11 +3554,20 @@ class ReloadGame_result(object):
         return not (self == other)
 
 
-class ResetLevel_args(object):
+class SessionResetLevel_args(object):
+    """
+    Attributes:
+     - sessionId
+    """
 
     thrift_spec = (
+        None,  # 0
+        (1, TType.I32, 'sessionId', None, None, ),  # 1
     )
 
+    def __init__(self, sessionId=None,):
+        self.sessionId = sessionId
+
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
             iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
@@ -1651,6 +3577,11 @@ class ResetLevel_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.I32:
+                    self.sessionId = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -1660,7 +3591,11 @@ class ResetLevel_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
             return
-        oprot.writeStructBegin('ResetLevel_args')
+        oprot.writeStructBegin('SessionResetLevel_args')
+        if self.sessionId is not None:
+            oprot.writeFieldBegin('sessionId', TType.I32, 1)
+            oprot.writeI32(self.sessionId)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -1679,11 +3614,20 @@ class ResetLevel_args(object):
         return not (self == other)
 
 
-class ResetLevel_result(object):
+class SessionResetLevel_result(object):
+    """
+    Attributes:
+     - gameError
+    """
 
     thrift_spec = (
+        None,  # 0
+        (1, TType.STRUCT, 'gameError', (GameError, GameError.thrift_spec), None, ),  # 1
     )
 
+    def __init__(self, gameError=None,):
+        self.gameError = gameError
+
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
             iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
@@ -1693,6 +3637,12 @@ class ResetLevel_result(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.gameError = GameError()
+                    self.gameError.read(iprot)
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -1702,7 +3652,11 @@ class ResetLevel_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
             return
-        oprot.writeStructBegin('ResetLevel_result')
+        oprot.writeStructBegin('SessionResetLevel_result')
+        if self.gameError is not None:
+            oprot.writeFieldBegin('gameError', TType.STRUCT, 1)
+            self.gameError.write(oprot)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
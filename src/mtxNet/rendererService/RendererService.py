@@ -130,6 +130,16 @@ class Iface(object):
         """
         pass
 
+    def GetProtocolVersion(self):
+        pass
+
+    def ProcessActs(self, acts):
+        """
+        Parameters:
+         - acts
+        """
+        pass
+
 
 class Client(Iface):
     def __init__(self, iprot, oprot=None):
@@ -662,6 +672,47 @@ class Client(Iface):
         iprot.readMessageEnd()
         return
 
+    def GetProtocolVersion(self):
+        self.send_GetProtocolVersion()
+        return self.recv_GetProtocolVersion()
+
+    def send_GetProtocolVersion(self):
+        self._oprot.writeMessageBegin('GetProtocolVersion', TMessageType.CALL, self._seqid)
+        args = GetProtocolVersion_args()
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_GetProtocolVersion(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = GetProtocolVersion_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "GetProtocolVersion failed: unknown result")
+
+    def ProcessActs(self, acts):
+        """
+        Parameters:
+         - acts
+        """
+        self.send_ProcessActs(acts)
+
+    def send_ProcessActs(self, acts):
+        self._oprot.writeMessageBegin('ProcessActs', TMessageType.ONEWAY, self._seqid)
+        args = ProcessActs_args()
+        args.acts = acts
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
 
 class Processor(Iface, TProcessor):
     def __init__(self, handler):
@@ -685,6 +736,8 @@ class Processor(Iface, TProcessor):
         self._processMap["TriggerLeave"] = Processor.process_TriggerLeave
         self._processMap["Move"] = Processor.process_Move
         self._processMap["Jump"] = Processor.process_Jump
+        self._processMap["GetProtocolVersion"] = Processor.process_GetProtocolVersion
+        self._processMap["ProcessActs"] = Processor.process_ProcessActs
 
     def process(self, iprot, oprot):
         (name, type, seqid) = iprot.readMessageBegin()
@@ -1043,6 +1096,36 @@ class Processor(Iface, TProcessor):
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
+    def process_GetProtocolVersion(self, seqid, iprot, oprot):
+        args = GetProtocolVersion_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = GetProtocolVersion_result()
+        try:
+            result.success = self._handler.GetProtocolVersion()
+            msg_type = TMessageType.REPLY
+        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
+            raise
+        except Exception as ex:
+            msg_type = TMessageType.EXCEPTION
+            logging.exception(ex)
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("GetProtocolVersion", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_ProcessActs(self, seqid, iprot, oprot):
+        args = ProcessActs_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        try:
+            self._handler.ProcessActs(args.acts)
+        except (TTransport.TTransportException, KeyboardInterrupt, SystemExit):
+            raise
+        except:
+            pass
+
 # HELPER FUNCTIONS AND STRUCTURES
 
 
@@ -3067,3 +3150,172 @@ class Jump_result(object):
 
     def __ne__(self, other):
         return not (self == other)
+
+
+class GetProtocolVersion_args(object):
+    thrift_spec = (
+    )
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('GetProtocolVersion_args')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class GetProtocolVersion_result(object):
+    """
+    Attributes:
+     - success
+    """
+
+    thrift_spec = (
+        (0, TType.I32, 'success', None, None, ),  # 0
+    )
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.I32:
+                    self.success = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('GetProtocolVersion_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.I32, 0)
+            oprot.writeI32(self.success)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class ProcessActs_args(object):
+    """
+    Attributes:
+     - acts
+    """
+
+    thrift_spec = (
+        None,  # 0
+        (1, TType.LIST, 'acts', (TType.STRUCT, (Act, Act.thrift_spec), False), None, ),  # 1
+    )
+
+    def __init__(self, acts=None,):
+        self.acts = acts
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.acts = []
+                    (_etype100, _size101) = iprot.readListBegin()
+                    for _i102 in range(_size101):
+                        _elem103 = Act()
+                        _elem103.read(iprot)
+                        self.acts.append(_elem103)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('ProcessActs_args')
+        if self.acts is not None:
+            oprot.writeFieldBegin('acts', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRUCT, len(self.acts))
+            for iter104 in self.acts:
+                iter104.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
@@ -100,6 +100,54 @@ class WallTexture(object):
     }
 
 
+class ActType(object):
+    PAUSE = 0
+    RESUME = 1
+    CLEAR = 2
+    LOAD_LEVEL = 3
+    RESET_LEVEL = 4
+    UPDATE = 5
+    MOVE = 6
+    JUMP = 7
+    SPAWN = 8
+    REMOVE = 9
+    COLLECT = 10
+    TRIGGER_ENTER = 11
+    TRIGGER_LEAVE = 12
+
+    _VALUES_TO_NAMES = {
+        0: "PAUSE",
+        1: "RESUME",
+        2: "CLEAR",
+        3: "LOAD_LEVEL",
+        4: "RESET_LEVEL",
+        5: "UPDATE",
+        6: "MOVE",
+        7: "JUMP",
+        8: "SPAWN",
+        9: "REMOVE",
+        10: "COLLECT",
+        11: "TRIGGER_ENTER",
+        12: "TRIGGER_LEAVE",
+    }
+
+    _NAMES_TO_VALUES = {
+        "PAUSE": 0,
+        "RESUME": 1,
+        "CLEAR": 2,
+        "LOAD_LEVEL": 3,
+        "RESET_LEVEL": 4,
+        "UPDATE": 5,
+        "MOVE": 6,
+        "JUMP": 7,
+        "SPAWN": 8,
+        "REMOVE": 9,
+        "COLLECT": 10,
+        "TRIGGER_ENTER": 11,
+        "TRIGGER_LEAVE": 12,
+    }
+
+
 class LevelInfo(object):
     """
     Attributes:
@@ -278,3 +326,289 @@ class Value(object):
 
     def __ne__(self, other):
         return not (self == other)
+
+
+class Act(object):
+    """
+    Attributes:
+     - actType
+     - objectId
+     - sourceId
+     - key
+     - value
+     - symbol
+     - positionX
+     - positionY
+     - direction
+     - fromX
+     - fromY
+     - toX
+     - toY
+     - field
+     - levelInfo
+     - packedField
+     - packedCells
+    """
+
+    thrift_spec = (
+        None,  # 0
+        (1, TType.I32, 'actType', None, None, ),  # 1
+        (2, TType.I16, 'objectId', None, None, ),  # 2
+        (3, TType.I16, 'sourceId', None, None, ),  # 3
+        (4, TType.STRING, 'key', 'UTF8', None, ),  # 4
+        (5, TType.STRUCT, 'value', (Value, Value.thrift_spec), None, ),  # 5
+        (6, TType.BYTE, 'symbol', None, None, ),  # 6
+        (7, TType.I16, 'positionX', None, None, ),  # 7
+        (8, TType.I16, 'positionY', None, None, ),  # 8
+        (9, TType.I32, 'direction', None, None, ),  # 9
+        (10, TType.I16, 'fromX', None, None, ),  # 10
+        (11, TType.I16, 'fromY', None, None, ),  # 11
+        (12, TType.I16, 'toX', None, None, ),  # 12
+        (13, TType.I16, 'toY', None, None, ),  # 13
+        (14, TType.LIST, 'field', (TType.LIST, (TType.LIST, (TType.LIST, (TType.I16, None, False), False), False), False), None, ),  # 14
+        (15, TType.STRUCT, 'levelInfo', (LevelInfo, LevelInfo.thrift_spec), None, ),  # 15
+        (16, TType.STRING, 'packedField', 'BINARY', None, ),  # 16
+        (17, TType.STRING, 'packedCells', 'BINARY', None, ),  # 17
+    )
+
+    def __init__(self, actType=None, objectId=None, sourceId=None, key=None, value=None, symbol=None, positionX=None, positionY=None, direction=None, fromX=None, fromY=None, toX=None, toY=None, field=None, levelInfo=None, packedField=None, packedCells=None,):
+        self.actType = actType
+        self.objectId = objectId
+        self.sourceId = sourceId
+        self.key = key
+        self.value = value
+        self.symbol = symbol
+        self.positionX = positionX
+        self.positionY = positionY
+        self.direction = direction
+        self.fromX = fromX
+        self.fromY = fromY
+        self.toX = toX
+        self.toY = toY
+        self.field = field
+        self.levelInfo = levelInfo
+        self.packedField = packedField
+        self.packedCells = packedCells
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, (self.__class__, self.thrift_spec))
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I32:
+                    self.actType = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I16:
+                    self.objectId = iprot.readI16()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I16:
+                    self.sourceId = iprot.readI16()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.key = iprot.readString().decode('utf-8') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRUCT:
+                    self.value = Value()
+                    self.value.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.BYTE:
+                    self.symbol = iprot.readByte()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.I16:
+                    self.positionX = iprot.readI16()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 8:
+                if ftype == TType.I16:
+                    self.positionY = iprot.readI16()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 9:
+                if ftype == TType.I32:
+                    self.direction = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 10:
+                if ftype == TType.I16:
+                    self.fromX = iprot.readI16()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 11:
+                if ftype == TType.I16:
+                    self.fromY = iprot.readI16()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 12:
+                if ftype == TType.I16:
+                    self.toX = iprot.readI16()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 13:
+                if ftype == TType.I16:
+                    self.toY = iprot.readI16()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 14:
+                if ftype == TType.LIST:
+                    self.field = []
+                    (_etype100, _size101) = iprot.readListBegin()
+                    for _i102 in range(_size101):
+                        _elem103 = []
+                        (_etype104, _size105) = iprot.readListBegin()
+                        for _i106 in range(_size105):
+                            _elem107 = []
+                            (_etype108, _size109) = iprot.readListBegin()
+                            for _i110 in range(_size109):
+                                _elem111 = []
+                                (_etype112, _size113) = iprot.readListBegin()
+                                for _i114 in range(_size113):
+                                    _elem115 = iprot.readI16()
+                                    _elem111.append(_elem115)
+                                iprot.readListEnd()
+                                _elem107.append(_elem111)
+                            iprot.readListEnd()
+                            _elem103.append(_elem107)
+                        iprot.readListEnd()
+                        self.field.append(_elem103)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 15:
+                if ftype == TType.STRUCT:
+                    self.levelInfo = LevelInfo()
+                    self.levelInfo.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 16:
+                if ftype == TType.STRING:
+                    self.packedField = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 17:
+                if ftype == TType.STRING:
+                    self.packedCells = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, (self.__class__, self.thrift_spec)))
+            return
+        oprot.writeStructBegin('Act')
+        if self.actType is not None:
+            oprot.writeFieldBegin('actType', TType.I32, 1)
+            oprot.writeI32(self.actType)
+            oprot.writeFieldEnd()
+        if self.objectId is not None:
+            oprot.writeFieldBegin('objectId', TType.I16, 2)
+            oprot.writeI16(self.objectId)
+            oprot.writeFieldEnd()
+        if self.sourceId is not None:
+            oprot.writeFieldBegin('sourceId', TType.I16, 3)
+            oprot.writeI16(self.sourceId)
+            oprot.writeFieldEnd()
+        if self.key is not None:
+            oprot.writeFieldBegin('key', TType.STRING, 4)
+            oprot.writeString(self.key.encode('utf-8') if sys.version_info[0] == 2 else self.key)
+            oprot.writeFieldEnd()
+        if self.value is not None:
+            oprot.writeFieldBegin('value', TType.STRUCT, 5)
+            self.value.write(oprot)
+            oprot.writeFieldEnd()
+        if self.symbol is not None:
+            oprot.writeFieldBegin('symbol', TType.BYTE, 6)
+            oprot.writeByte(self.symbol)
+            oprot.writeFieldEnd()
+        if self.positionX is not None:
+            oprot.writeFieldBegin('positionX', TType.I16, 7)
+            oprot.writeI16(self.positionX)
+            oprot.writeFieldEnd()
+        if self.positionY is not None:
+            oprot.writeFieldBegin('positionY', TType.I16, 8)
+            oprot.writeI16(self.positionY)
+            oprot.writeFieldEnd()
+        if self.direction is not None:
+            oprot.writeFieldBegin('direction', TType.I32, 9)
+            oprot.writeI32(self.direction)
+            oprot.writeFieldEnd()
+        if self.fromX is not None:
+            oprot.writeFieldBegin('fromX', TType.I16, 10)
+            oprot.writeI16(self.fromX)
+            oprot.writeFieldEnd()
+        if self.fromY is not None:
+            oprot.writeFieldBegin('fromY', TType.I16, 11)
+            oprot.writeI16(self.fromY)
+            oprot.writeFieldEnd()
+        if self.toX is not None:
+            oprot.writeFieldBegin('toX', TType.I16, 12)
+            oprot.writeI16(self.toX)
+            oprot.writeFieldEnd()
+        if self.toY is not None:
+            oprot.writeFieldBegin('toY', TType.I16, 13)
+            oprot.writeI16(self.toY)
+            oprot.writeFieldEnd()
+        if self.field is not None:
+            oprot.writeFieldBegin('field', TType.LIST, 14)
+            oprot.writeListBegin(TType.LIST, len(self.field))
+            for iter116 in self.field:
+                oprot.writeListBegin(TType.LIST, len(iter116))
+                for iter117 in iter116:
+                    oprot.writeListBegin(TType.LIST, len(iter117))
+                    for iter118 in iter117:
+                        oprot.writeListBegin(TType.I16, len(iter118))
+                        for iter119 in iter118:
+                            oprot.writeI16(iter119)
+                        oprot.writeListEnd()
+                    oprot.writeListEnd()
+                oprot.writeListEnd()
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.levelInfo is not None:
+            oprot.writeFieldBegin('levelInfo', TType.STRUCT, 15)
+            self.levelInfo.write(oprot)
+            oprot.writeFieldEnd()
+        if self.packedField is not None:
+            oprot.writeFieldBegin('packedField', TType.STRING, 16)
+            oprot.writeBinary(self.packedField)
+            oprot.writeFieldEnd()
+        if self.packedCells is not None:
+            oprot.writeFieldBegin('packedCells', TType.STRING, 17)
+            oprot.writeBinary(self.packedCells)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)